@@ -15,3 +15,4 @@ from .instructionset import InstructionSet
 from .measure import Measure
 from .reset import Reset
 from .compositegate import CompositeGate
+from .variablebinder import VariableBinder
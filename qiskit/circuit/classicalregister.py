@@ -16,6 +16,8 @@ from .register import Register
 class ClassicalRegister(Register):
     """Implement a classical register."""
 
+    __slots__ = ()
+
     # Counter for the number of instances in this class.
     instances_counter = itertools.count()
     # Prefix to use for auto naming.
@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Columnar storage of the instructions of a circuit.
+"""
+from array import array
+from collections.abc import MutableSequence
+
+import numpy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from qiskit.exceptions import QiskitError
+
+_DIRECTIVES = ('barrier', 'snapshot')
+
+
+class ColumnarData(MutableSequence):
+    """Instructions of a circuit, stored as columns of integers.
+
+    Behaves as the list of ``(instruction, qargs, cargs)`` tuples of
+    ``QuantumCircuit.data``, but stores each instruction as an op-code into a
+    table of distinct instructions, and its qubits and clbits as integer
+    indices into the bits of the circuit registers, in register order. The
+    columns are packed arrays, so that metrics of the circuit can be computed
+    without building the tuples, and the indices exported without lookups.
+
+    The table is keyed by the identity of the instructions, not by their name
+    and params: an instruction appended several times, such as a shared gate,
+    is stored once, but equal instructions that are distinct objects each have
+    their op-code. The data thus gives back the instructions that were
+    appended, and modifying one of them in place does not modify the others.
+    The table counts the uses of each op-code: when the last use of an
+    instruction is removed, its entry is released, so that the table does not
+    hold the instruction anymore, and its op-code is reused. Released op-codes
+    are None in the table.
+
+    The qubits of instruction ``i`` are
+    ``qubit_indices[qubit_offsets[i]:qubit_offsets[i + 1]]``, and likewise for
+    its clbits.
+    """
+
+    def __init__(self, qregs, cregs, data=()):
+        """Create a new columnar store.
+
+        Args:
+            qregs (list[QuantumRegister]): quantum registers of the circuit.
+                The list is shared with the circuit, and must only be
+                appended to.
+            cregs (list[ClassicalRegister]): classical registers of the circuit,
+                likewise.
+            data (iterable): initial ``(instruction, qargs, cargs)`` tuples.
+        """
+        self._qregs = qregs
+        self._cregs = cregs
+        # table of the distinct instructions, indexed by op-code
+        self._table = []
+        self._opcode_of = {}
+        # number of uses of each op-code, and the released op-codes
+        self._uses = []
+        self._released = []
+        self._opcodes = array('i')
+        self._qubit_offsets = array('q', [0])
+        self._qubit_indices = array('i')
+        self._clbit_offsets = array('q', [0])
+        self._clbit_indices = array('i')
+        self._version = 0
+        self._reset_bit_maps()
+        self.extend(data)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attribute in ('_opcode_of', '_qubit_map', '_clbit_map'):
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._opcode_of = {id(instruction): opcode
+                           for opcode, instruction in enumerate(self._table)
+                           if instruction is not None}
+        self._reset_bit_maps()
+
+    def __len__(self):
+        return len(self._opcodes)
+
+    def __eq__(self, other):
+        if not isinstance(other, (ColumnarData, list)):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._check_index(index)
+        qubits = self._bit_map(self._qregs, self._qubit_map)[1]
+        clbits = self._bit_map(self._cregs, self._clbit_map)[1]
+        qubit_start, qubit_stop = self._qubit_offsets[index:index + 2]
+        clbit_start, clbit_stop = self._clbit_offsets[index:index + 2]
+        return (self._table[self._opcodes[index]],
+                [qubits[i] for i in self._qubit_indices[qubit_start:qubit_stop]],
+                [clbits[i] for i in self._clbit_indices[clbit_start:clbit_stop]])
+
+    def __iter__(self):
+        qubits = self._bit_map(self._qregs, self._qubit_map)[1]
+        clbits = self._bit_map(self._cregs, self._clbit_map)[1]
+        for instruction, qubit_indices, clbit_indices in self.indexed():
+            yield (instruction,
+                   [qubits[i] for i in qubit_indices],
+                   [clbits[i] for i in clbit_indices])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            raise QiskitError("slice assignment is not supported by ColumnarData")
+        index = self._check_index(index)
+        del self[index]
+        self.insert(index, value)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[i]
+            return
+        index = self._check_index(index)
+        self._version += 1
+        self._release(self._opcodes[index])
+        del self._opcodes[index]
+        for offsets, indices in ((self._qubit_offsets, self._qubit_indices),
+                                 (self._clbit_offsets, self._clbit_indices)):
+            start, stop = offsets[index:index + 2]
+            del indices[start:stop]
+            del offsets[index + 1]
+            _shift(offsets, index + 1, start - stop)
+
+    def insert(self, index, value):
+        size = len(self)
+        index = min(max(index + size if index < 0 else index, 0), size)
+        if index == size:
+            self.append(value)
+            return
+        instruction, qargs, cargs = value
+        new_indices = (self._indices(qargs, self._qregs, self._qubit_map),
+                       self._indices(cargs, self._cregs, self._clbit_map))
+        self._version += 1
+        self._opcodes.insert(index, self._opcode(instruction))
+        for (offsets, indices), bit_indices in zip(
+                ((self._qubit_offsets, self._qubit_indices),
+                 (self._clbit_offsets, self._clbit_indices)), new_indices):
+            start = offsets[index]
+            indices[start:start] = array('i', bit_indices)
+            offsets.insert(index + 1, start)
+            _shift(offsets, index + 1, len(bit_indices))
+
+    def append(self, value):
+        instruction, qargs, cargs = value
+        qubit_indices = self._indices(qargs, self._qregs, self._qubit_map)
+        clbit_indices = self._indices(cargs, self._cregs, self._clbit_map)
+        self._version += 1
+        self._opcodes.append(self._opcode(instruction))
+        self._qubit_indices.extend(qubit_indices)
+        self._qubit_offsets.append(len(self._qubit_indices))
+        self._clbit_indices.extend(clbit_indices)
+        self._clbit_offsets.append(len(self._clbit_indices))
+
+    def extend(self, values):
+        if not isinstance(values, ColumnarData):
+            super().extend(values)
+            return
+        # translate the columns of values to the op-codes and the bit indices
+        # of this store, before modifying it in case values is self
+        opcodes = [-1] * len(values._table)
+        for opcode, uses in enumerate(list(values._uses)):
+            if uses:
+                opcodes[opcode] = self._opcode(values._table[opcode], uses)
+        new_columns = [(self._opcodes, _translated(values._opcodes, opcodes))]
+        for offsets, indices, other_offsets, other_indices, translation in (
+                (self._qubit_offsets, self._qubit_indices,
+                 values._qubit_offsets, values._qubit_indices,
+                 self._translation(self._qregs, self._qubit_map, values._qregs)),
+                (self._clbit_offsets, self._clbit_indices,
+                 values._clbit_offsets, values._clbit_indices,
+                 self._translation(self._cregs, self._clbit_map, values._cregs))):
+            new_columns.append((indices, _translated(other_indices, translation)))
+            new_columns.append((offsets, _translated(other_offsets[1:], delta=len(indices))))
+        self._version += 1
+        for column, new_entries in new_columns:
+            column.frombytes(new_entries)
+
+    def copy(self, qregs=None, cregs=None, replacements=None):
+        """Return a copy of the columns, as ``list.copy()`` does.
+
+        Args:
+            qregs (list[QuantumRegister]): quantum registers of the circuit of
+                the copy, which must start with the registers of this one.
+                Defaults to the registers of this one.
+            cregs (list[ClassicalRegister]): classical registers, likewise.
+            replacements (dict): instructions replacing the instructions of
+                the table, by id. The other instructions are shared.
+
+        Returns:
+            ColumnarData: the copy.
+        """
+        cpy = ColumnarData(self._qregs if qregs is None else qregs,
+                           self._cregs if cregs is None else cregs)
+        replacements = replacements or {}
+        cpy._table = [replacements.get(id(instruction), instruction)
+                      for instruction in self._table]
+        cpy._opcode_of = {id(instruction): opcode
+                          for opcode, instruction in enumerate(cpy._table)
+                          if instruction is not None}
+        cpy._uses = list(self._uses)
+        cpy._released = list(self._released)
+        for column in ('_opcodes', '_qubit_offsets', '_qubit_indices',
+                       '_clbit_offsets', '_clbit_indices'):
+            setattr(cpy, column, getattr(self, column)[:])
+        return cpy
+
+    @property
+    def version(self):
+        """Number of modifications of the instructions, so that metrics
+        computed from them can be cached."""
+        return self._version
+
+    @property
+    def table(self):
+        """Return the table of the distinct instructions, indexed by op-code,
+        with None for the released op-codes."""
+        return list(self._table)
+
+    @property
+    def opcodes(self):
+        """Return the op-code of each instruction, as a numpy array."""
+        return _to_numpy(self._opcodes)
+
+    @property
+    def qubit_offsets(self):
+        """Return the offsets of the qubits of each instruction in
+        ``qubit_indices``, as a numpy array of length ``len(self) + 1``."""
+        return _to_numpy(self._qubit_offsets)
+
+    @property
+    def qubit_indices(self):
+        """Return the qubit indices of all the instructions, as a numpy array."""
+        return _to_numpy(self._qubit_indices)
+
+    @property
+    def clbit_offsets(self):
+        """Return the offsets of the clbits of each instruction in
+        ``clbit_indices``, as a numpy array of length ``len(self) + 1``."""
+        return _to_numpy(self._clbit_offsets)
+
+    @property
+    def clbit_indices(self):
+        """Return the clbit indices of all the instructions, as a numpy array."""
+        return _to_numpy(self._clbit_indices)
+
+    def instructions(self):
+        """Iterate over the instructions, without their bits."""
+        table = self._table
+        return (table[opcode] for opcode in self._opcodes)
+
+    def indexed(self):
+        """Iterate over the instructions with the indices of their bits.
+
+        Yields:
+            tuple: ``(instruction, qubit_indices, clbit_indices)``, where the
+                indices are lists of ints into the bits of the circuit registers.
+        """
+        table = self._table
+        qubit_offsets = self._qubit_offsets.tolist()
+        qubit_indices = self._qubit_indices.tolist()
+        clbit_offsets = self._clbit_offsets.tolist()
+        clbit_indices = self._clbit_indices.tolist()
+        for index, opcode in enumerate(self._opcodes.tolist()):
+            yield (table[opcode],
+                   qubit_indices[qubit_offsets[index]:qubit_offsets[index + 1]],
+                   clbit_indices[clbit_offsets[index]:clbit_offsets[index + 1]])
+
+    def size(self):
+        """Return the number of instructions that are not directives."""
+        directives = numpy.array(self._directives(), dtype=bool)
+        return len(self) - int(numpy.count_nonzero(directives[self.opcodes]))
+
+    def count_ops(self):
+        """Return the number of instructions of each name."""
+        count_ops = {}
+        for instruction, uses in zip(self._table, self._uses):
+            if uses:
+                count_ops[instruction.name] = count_ops.get(instruction.name, 0) + uses
+        return count_ops
+
+    def depth(self):
+        """Return the depth of the circuit, see ``QuantumCircuit.depth()``."""
+        num_qubits = len(self._bit_map(self._qregs, self._qubit_map)[1])
+        num_bits = num_qubits + len(self._bit_map(self._cregs, self._clbit_map)[1])
+        directives = self._directives()
+        conditions = self._condition_indices(num_qubits)
+        qubit_offsets = self._qubit_offsets.tolist()
+        qubit_indices = self._qubit_indices.tolist()
+        clbit_offsets = self._clbit_offsets.tolist()
+        clbit_indices = self._clbit_indices.tolist()
+
+        # the depth reached on each wire, qubits first
+        levels = [0] * num_bits
+        for index, opcode in enumerate(self._opcodes.tolist()):
+            if directives[opcode]:
+                continue
+            wires = qubit_indices[qubit_offsets[index]:qubit_offsets[index + 1]]
+            clbit_start, clbit_stop = clbit_offsets[index], clbit_offsets[index + 1]
+            if clbit_start != clbit_stop:
+                wires += [num_qubits + i for i in clbit_indices[clbit_start:clbit_stop]]
+            condition = conditions[opcode]
+            if condition:
+                wires += [i for i in condition if i not in wires]
+            if not wires:
+                continue
+            level = max([levels[i] for i in wires]) + 1
+            for i in wires:
+                levels[i] = level
+        return max(levels, default=0)
+
+    def num_connected_components(self, unitary_only=False):
+        """Return the number of connected components of the circuit, see
+        ``QuantumCircuit.num_connected_components()``."""
+        num_qubits = len(self._bit_map(self._qregs, self._qubit_map)[1])
+        num_bits = num_qubits
+        if not unitary_only:
+            num_bits += len(self._bit_map(self._cregs, self._clbit_map)[1])
+        size = len(self)
+        opcodes = self.opcodes
+        kept = ~numpy.array(self._directives(), dtype=bool)[opcodes]
+
+        # bipartite graph of the bits and of the instructions, where each
+        # instruction is connected to the bits it acts on
+        bits = [self.qubit_indices]
+        rows = [numpy.repeat(numpy.arange(size), numpy.diff(self.qubit_offsets))]
+        if not unitary_only:
+            bits.append(self.clbit_indices + num_qubits)
+            rows.append(numpy.repeat(numpy.arange(size), numpy.diff(self.clbit_offsets)))
+            for opcode, condition in enumerate(self._condition_indices(num_qubits)):
+                if condition:
+                    conditioned = numpy.flatnonzero(opcodes == opcode)
+                    bits.append(numpy.tile(condition, len(conditioned)))
+                    rows.append(numpy.repeat(conditioned, len(condition)))
+        bits = numpy.concatenate(bits)
+        rows = numpy.concatenate(rows)
+        bits, rows = bits[kept[rows]], rows[kept[rows]]
+
+        graph = coo_matrix((numpy.ones(len(bits), dtype=numpy.int8), (bits, num_bits + rows)),
+                           shape=(num_bits + size, num_bits + size))
+        num_components = connected_components(graph, directed=False, return_labels=False)
+        # instructions without bits are components of their own
+        return num_components - (size - len(numpy.unique(rows)))
+
+    def _check_index(self, index):
+        """Return a non negative index, or raise IndexError."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarData index out of range")
+        return index
+
+    def _opcode(self, instruction, uses=1):
+        """Return the op-code of an instruction, adding it to the table if
+        needed, and count its new uses."""
+        opcode = self._opcode_of.get(id(instruction))
+        if opcode is None:
+            if self._released:
+                opcode = self._released.pop()
+                self._table[opcode] = instruction
+            else:
+                opcode = len(self._table)
+                self._table.append(instruction)
+                self._uses.append(0)
+            self._opcode_of[id(instruction)] = opcode
+        self._uses[opcode] += uses
+        return opcode
+
+    def _release(self, opcode):
+        """Count a removed use of an op-code, and release the op-code if it
+        was the last one."""
+        self._uses[opcode] -= 1
+        if not self._uses[opcode]:
+            del self._opcode_of[id(self._table[opcode])]
+            self._table[opcode] = None
+            self._released.append(opcode)
+
+    def _directives(self):
+        """Return whether each op-code is a directive."""
+        return [instruction is not None and instruction.name in _DIRECTIVES
+                for instruction in self._table]
+
+    def _condition_indices(self, num_qubits):
+        """Return the wire indices of the condition of each op-code, if any."""
+        offsets = self._bit_map(self._cregs, self._clbit_map)[0]
+        conditions = []
+        for instruction in self._table:
+            if instruction is None or instruction.control is None:
+                conditions.append(None)
+                continue
+            creg = instruction.control[0]
+            try:
+                offset = offsets[creg]
+            except KeyError:
+                raise QiskitError("condition register %s is not in the circuit" % creg.name)
+            conditions.append(list(range(num_qubits + offset,
+                                         num_qubits + offset + creg.size)))
+        return conditions
+
+    def _indices(self, bits, registers, bit_map):
+        """Return the indices of some bits."""
+        offsets, _, index_of = self._bit_map(registers, bit_map)
+        try:
+            # the bits of the circuit registers, as cached by the registers
+            return [index_of[id(bit)] for bit in bits]
+        except KeyError:
+            pass
+        try:
+            return [offsets[register] + index for register, index in bits]
+        except KeyError:
+            raise QiskitError("bits %s are not in the circuit" % bits)
+
+    def _translation(self, registers, bit_map, other_registers):
+        """Return the indices of the bits of other registers, in order."""
+        offsets = self._bit_map(registers, bit_map)[0]
+        translation = []
+        for register in other_registers:
+            try:
+                offset = offsets[register]
+            except KeyError:
+                raise QiskitError("register %s is not in the circuit" % register.name)
+            translation.extend(range(offset, offset + register.size))
+        return translation
+
+    def _reset_bit_maps(self):
+        """Reset the maps from the bits of the registers to their indices."""
+        # ({register: offset of its first bit}, [bits], {id(bit): index})
+        self._qubit_map = ({}, [], {})
+        self._clbit_map = ({}, [], {})
+
+    @staticmethod
+    def _bit_map(registers, bit_map):
+        """Return the offsets of the registers, the list of their bits and the
+        indices of the bits by id, updating ``bit_map`` if registers were added."""
+        offsets, bits, index_of = bit_map
+        if len(offsets) != len(registers):
+            for register in registers[len(offsets):]:
+                offsets[register] = len(bits)
+                for bit in register:
+                    index_of[id(bit)] = len(bits)
+                    bits.append(bit)
+        return bit_map
+
+
+def _shift(offsets, start, delta):
+    """Add ``delta`` to the entries of the ``offsets`` array from ``start`` on."""
+    if delta:
+        view = numpy.frombuffer(offsets, dtype=offsets.typecode)
+        view[start:] += delta
+        # release the buffer, so that the array can be resized
+        del view
+
+
+def _translated(column, translation=None, delta=0):
+    """Return the bytes of ``translation[column] + delta``, for a column of
+    the same type."""
+    entries = numpy.frombuffer(column, dtype=column.typecode)
+    if translation is not None:
+        entries = numpy.array(translation, dtype=column.typecode)[entries]
+    return (entries + delta).astype(column.typecode).tobytes()
+
+
+def _to_numpy(column):
+    """Return a numpy array copy of a column."""
+    return numpy.array(column, dtype=column.typecode)
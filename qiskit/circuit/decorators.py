@@ -65,7 +65,7 @@ def _op_expand(n_bits, func=None, broadcastable=None):
             expanded_rargs = []
             for arg, broadcast in zip(rargs, blist):
                 if isinstance(arg, Register):
-                    arg = [(arg, i) for i in range(len(arg))]
+                    arg = list(arg)
                 elif isinstance(arg, tuple):
                     arg = [arg]
                 # now we should have a list of qubits
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Structural fingerprints of circuits.
+
+The fingerprint of a circuit is a hash of its DAG: each instruction is hashed
+together with the state of the wires it acts on, and then updates the state of
+these wires. The fingerprint is the hash of the final state of all the wires,
+so it does not depend on the order in which independent instructions were
+applied, and circuits with equal DAGs have equal fingerprints.
+"""
+import numpy
+import sympy
+
+from .instruction import Instruction
+
+
+def circuit_fingerprint(wires, instructions, params=True):
+    """Return the fingerprint of a circuit.
+
+    Args:
+        wires (list[tuple]): (Register, index) wires of the circuit.
+        instructions (iterable): ``(instruction, qargs, cargs, condition)``
+            tuples, in a topological order of the circuit.
+        params (bool): if False, the parameters of the instructions are left
+            out of the fingerprint.
+
+    Returns:
+        int: the fingerprint.
+    """
+    states = {wire: hash(('in', wire)) for wire in wires}
+    for instruction, qargs, cargs, condition in instructions:
+        condition_bits = []
+        if condition is not None:
+            condition_bits = [(condition[0], index) for index in range(condition[0].size)]
+        arg_states = [(wire, states[wire])
+                      for wire in qargs + cargs + condition_bits]
+        # For barriers, qarg order is not significant
+        if instruction.name == 'barrier':
+            arg_states = frozenset(arg_states)
+        else:
+            arg_states = tuple(arg_states)
+        node_hash = hash((_instruction_key(instruction, params), condition, arg_states))
+        for wire in qargs + cargs + condition_bits:
+            states[wire] = hash((node_hash, wire))
+    return hash(frozenset(states.items()))
+
+
+def _instruction_key(instruction, params):
+    """Return a hashable key of an instruction."""
+    key = (type(instruction), instruction.name,
+           instruction.num_qubits, instruction.num_clbits)
+    if not params:
+        return key
+
+    key += tuple(_param_key(param) for param in instruction.params)
+    # instructions that do not derive their definition from their params
+    if type(instruction)._define is Instruction._define and instruction.definition:
+        wires = {wire: None
+                 for _, qargs, cargs in instruction.definition for wire in qargs + cargs}
+        key += (circuit_fingerprint(list(wires),
+                                    ((sub_instruction, qargs, cargs, sub_instruction.control)
+                                     for sub_instruction, qargs, cargs
+                                     in instruction.definition)),)
+    return key
+
+
+def _param_key(param):
+    """Return a hashable key of an instruction parameter.
+
+    Numeric sympy expressions are evaluated, so that they have the same key as
+    the numbers they are equal to.
+    """
+    if isinstance(param, numpy.ndarray):
+        return (param.shape, param.dtype.str, param.tobytes())
+    if isinstance(param, sympy.Matrix):
+        return (param.shape, tuple(_param_key(element) for element in param))
+    if isinstance(param, sympy.Basic) and not param.free_symbols:
+        try:
+            value = complex(param)
+        except TypeError:
+            return param
+        return value.real if value.imag == 0 else value
+    return param
@@ -14,6 +14,8 @@ from .instruction import Instruction
 class Gate(Instruction):
     """Unitary gate."""
 
+    __slots__ = ()
+
     def __init__(self, name, num_qubits, params):
         """Create a new composite gate.
 
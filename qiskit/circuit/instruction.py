@@ -27,6 +27,7 @@ Instructions are identified by the following:
 Instructions do not have any context about where they are in a circuit (which qubits/clbits).
 The circuit itself keeps this context.
 """
+from collections import OrderedDict
 from copy import deepcopy
 import sympy
 import numpy
@@ -37,10 +38,21 @@ from qiskit.circuit.classicalregister import ClassicalRegister
 
 _CUTOFF_PRECISION = 1E-10
 
+# shared instance of each instruction class, see Instruction.flyweight()
+_FLYWEIGHTS = {}
+
+# least recently used definitions, by class, name, dimensions and params,
+# see Instruction.definition
+_DEFINITIONS = OrderedDict()
+_DEFINITIONS_SIZE = 256
+
 
 class Instruction:
     """Generic quantum instruction."""
 
+    __slots__ = ('_name', 'num_qubits', 'num_clbits', '_params', '_control', '_definition',
+                 '_condition_counters')
+
     def __init__(self, name, num_qubits, num_clbits, params):
         """Create a new instruction.
         Args:
@@ -56,14 +68,17 @@ class Instruction:
         if num_qubits < 0 or num_clbits < 0:
             raise QiskitError("bad instruction dimensions: %d qubits, %d clbits." %
                               num_qubits, num_clbits)
-        self.name = name
+        self._name = name
         self.num_qubits = num_qubits
         self.num_clbits = num_clbits
 
         self._params = []  # a list of gate params stored
 
         # tuple (ClassicalRegister, int) when the instruction has a conditional ("if")
-        self.control = None
+        self._control = None
+        # counter, or tuple of counters, of the circuits to notify when the
+        # condition changes, see QuantumCircuit._metric()
+        self._condition_counters = None
         # list of instructions (and their contexts) that this instruction is composed of
         # empty definition means opaque or fundamental instruction
         self._definition = None
@@ -92,15 +107,121 @@ class Instruction:
             res = True
         return res
 
+    def __reduce_ex__(self, protocol):
+        # deep copies and unpickled versions of a flyweight are the flyweight itself
+        if self._is_flyweight():
+            return _flyweight, (type(self),)
+        return super().__reduce_ex__(protocol)
+
+    def __setstate__(self, state):
+        # instructions pickled before Instruction had slots have a dict state
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for attributes in (dict_state, slot_state):
+            for attribute, value in (attributes or {}).items():
+                try:
+                    setattr(self, attribute, value)
+                except AttributeError:  # attributes that are no longer used
+                    pass
+
+    def __copy__(self):
+        """Return a shallow copy of the instruction, never a shared instance."""
+        cls = type(self)
+        cpy = cls.__new__(cls)
+        cpy.__setstate__(super().__reduce_ex__(2)[2])
+        cpy._condition_counters = None
+        return cpy
+
     def _define(self):
         """Populates self.definition with a decomposition of this gate."""
         pass
 
+    def flyweight(self):
+        """Return the shared instance equal to this instruction, if there is one.
+
+        Instructions without params, condition or custom definition, whose
+        state is entirely held by the ``Instruction`` slots (such as the
+        standard ``h`` and ``cx`` gates), have a shared instance that large
+        circuits can reference instead of holding a copy for every gate. A
+        shared instance cannot be modified: conditioning it, renaming it or
+        setting its params raises, and ``copy()`` returns a modifiable copy.
+
+        Returns:
+            Instruction: the shared instance, or None if this instruction
+                cannot be shared.
+        """
+        if self._control is not None or self._params or hasattr(self, '__dict__'):
+            return None
+        shared = _flyweight(type(self))
+        if shared is None or shared is self:
+            return shared
+        if self.name != shared.name or \
+                self.num_qubits != shared.num_qubits or \
+                self.num_clbits != shared.num_clbits or \
+                (self._definition is not None and self._definition != shared.definition):
+            return None
+        return shared
+
+    def _is_flyweight(self):
+        """Return True if this instruction is a shared instance."""
+        return _FLYWEIGHTS.get(type(self)) is self
+
+    @property
+    def name(self):
+        """Return the name of the instruction."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set the name of the instruction."""
+        if self._is_flyweight():
+            raise QiskitError("cannot rename the shared %s instruction, "
+                              "rename a copy of it instead." % self._name)
+        self._name = name
+
+    @property
+    def control(self):
+        """Return the classical condition ``(ClassicalRegister, int)``, or None."""
+        return self._control
+
+    @control.setter
+    def control(self, condition):
+        """Set the classical condition."""
+        if condition is not None and self._is_flyweight():
+            raise QiskitError("cannot condition the shared %s instruction, "
+                              "condition a copy of it instead." % self.name)
+        self._control = condition
+        counters = self._condition_counters
+        if isinstance(counters, tuple):
+            for counter in counters:
+                counter.count += 1
+        elif counters is not None:
+            counters.count += 1
+
+    def _count_condition_changes(self, counter):
+        """Count the changes of the condition of this instruction in counter.
+
+        Args:
+            counter (ConditionCounter): counter of a circuit holding this
+                instruction.
+        """
+        # most instructions are in a single circuit, whose counter is kept
+        # without allocating a tuple
+        counters = self._condition_counters
+        if counters is None:
+            self._condition_counters = counter
+        elif isinstance(counters, tuple):
+            if not any(existing is counter for existing in counters):
+                self._condition_counters = counters + (counter,)
+        elif counters is not counter:
+            self._condition_counters = (counters, counter)
+
     @property
     def params(self):
         """return instruction params"""
-        # if params already defined don't attempt to get them from definition
-        if self._definition and not self._params:
+        # if params already defined don't attempt to get them from definition,
+        # nor from a definition that only depends on the instruction class
+        if self._definition and not self._params and \
+                type(self)._define is Instruction._define:
             self._params = []
             for sub_instr, _, _ in self._definition:
                 self._params.extend(sub_instr.params)  # recursive call
@@ -110,6 +231,12 @@ class Instruction:
 
     @params.setter
     def params(self, parameters):
+        if self._is_flyweight():
+            raise QiskitError("cannot set the params of the shared %s instruction, "
+                              "set the params of a copy of it instead." % self.name)
+        if type(self)._define is not Instruction._define:
+            # the definition is derived from the params again when needed
+            self._definition = None
         self._params = []
         for single_param in parameters:
             # example: u2(pi/2, sin(pi/4))
@@ -119,11 +246,12 @@ class Instruction:
             elif isinstance(single_param, node.Node):
                 self.params.append(single_param.sym())
             # example: u3(0.1, 0.2, 0.3)
+            # numbers are kept as they are, sympy is only used for symbolic params
             elif isinstance(single_param, (int, float)):
-                self.params.append(sympy.Number(single_param))
+                self.params.append(single_param)
             # example: Initialize([complex(0,1), complex(0,0)])
             elif isinstance(single_param, complex):
-                self.params.append(single_param.real + single_param.imag * sympy.I)
+                self.params.append(single_param)
             # example: snapshot('label')
             elif isinstance(single_param, str):
                 self.params.append(sympy.Symbol(single_param))
@@ -136,16 +264,36 @@ class Instruction:
             elif isinstance(single_param, sympy.Expr):
                 self.params.append(single_param)
             elif isinstance(single_param, numpy.number):
-                self.params.append(sympy.Number(single_param.item()))
+                self.params.append(single_param.item())
             else:
                 raise QiskitError("invalid param type {0} in instruction "
                                   "{1}".format(type(single_param), self.name))
 
     @property
     def definition(self):
-        """Return definition in terms of other basic gates."""
+        """Return definition in terms of other basic gates.
+
+        The definitions computed by ``_define()`` for instructions whose state
+        is entirely held by the ``Instruction`` slots only depend on their
+        class, name, dimensions and params, and are cached: the sub-instructions
+        of the definition are shared by all the equal instructions, and must not
+        be modified in place.
+        """
         if self._definition is None:
-            self._define()
+            key = self._definition_key()
+            if key is None:
+                self._define()
+                return self._definition
+            definition = _DEFINITIONS.get(key)
+            if definition is None:
+                self._define()
+                if self._definition is not None:
+                    _DEFINITIONS[key] = list(self._definition)
+                    if len(_DEFINITIONS) > _DEFINITIONS_SIZE:
+                        _DEFINITIONS.popitem(last=False)
+            else:
+                _DEFINITIONS.move_to_end(key)
+                self._definition = list(definition)
         return self._definition
 
     @definition.setter
@@ -153,6 +301,38 @@ class Instruction:
         """Set matrix representation"""
         self._definition = array
 
+    def _definition_key(self):
+        """Return the key of the cached definition of the instruction, or None
+        if it cannot be cached."""
+        if type(self)._define is Instruction._define or hasattr(self, '__dict__'):
+            return None
+        try:
+            key = (type(self), self.name, self.num_qubits, self.num_clbits,
+                   tuple(_definition_param_key(param) for param in self._params))
+            hash(key)
+        except TypeError:  # unhashable params, such as mutable sympy matrices
+            return None
+        return key
+
+    def _copy_with_definition(self, definition, name=None):
+        """Return a copy of the instruction with another definition.
+
+        Unlike ``copy()``, the current definition is not copied, which makes
+        mirroring and inverting large composite instructions much cheaper.
+        """
+        cpy = self.__copy__()
+        if name:
+            cpy.name = name
+        cpy._definition = definition
+        if self._definition and type(self)._define is Instruction._define:
+            # params derived from the current definition
+            cpy._params = []
+        else:
+            cpy._params = deepcopy(self._params)
+        if hasattr(self, '__dict__'):
+            cpy.__dict__.update(deepcopy(self.__dict__))
+        return cpy
+
     def mirror(self):
         """For a composite instruction, reverse the order of sub-gates.
 
@@ -163,10 +343,9 @@ class Instruction:
             Instruction: a fresh gate with sub-gates reversed
         """
         if not self._definition:
-            return self.copy()
+            return self._copy_with_definition(None if self._definition is None else [])
 
-        reverse_inst = self.copy(name=self.name+'_mirror')
-        reverse_inst.definition = []
+        reverse_inst = self._copy_with_definition([], self.name+'_mirror')
         for inst, qargs, cargs in reversed(self._definition):
             reverse_inst._definition.append((inst.mirror(), qargs, cargs))
         return reverse_inst
@@ -190,8 +369,7 @@ class Instruction:
         if not self.definition:
             raise QiskitError("inverse() not implemented for %s." %
                               self.name)
-        inverse_gate = self.copy(name=self.name+'_dg')
-        inverse_gate._definition = []
+        inverse_gate = self._copy_with_definition([], self.name+'_dg')
         for inst, qargs, cargs in reversed(self._definition):
             inverse_gate._definition.append((inst.inverse(), qargs, cargs))
         return inverse_gate
@@ -217,7 +395,8 @@ class Instruction:
           Instruction: a deepcopy of the current instruction, with the name
             updated if it was provided
         """
-        cpy = deepcopy(self)
+        # deepcopy returns shared instances as they are
+        cpy = self.__copy__() if self._is_flyweight() else deepcopy(self)
         if name:
             cpy.name = name
         return cpy
@@ -237,6 +416,52 @@ class Instruction:
         name_param = self.name
         if self.params:
             name_param = "%s(%s)" % (name_param,
-                                     ",".join([str(i) for i in self.params]))
+                                     ",".join([_qasm_param(i) for i in self.params]))
 
         return self._qasmif(name_param)
+
+
+def _qasm_param(param):
+    """Return the OpenQASM representation of an instruction parameter."""
+    if isinstance(param, float):
+        # shortest repr that round-trips, with the dot required by OpenQASM reals
+        string = repr(param)
+        if 'e' in string and '.' not in string:
+            string = string.replace('e', '.0e')
+        return string
+    return str(param)
+
+
+def _definition_param_key(param):
+    """Return a hashable key of a param, which is only equal to the keys of the
+    params of the same type and value."""
+    if isinstance(param, numpy.ndarray):
+        return (numpy.ndarray, param.shape, param.dtype.str, param.tobytes())
+    return (type(param), param)
+
+
+class ConditionCounter:
+    """Number of changes of the conditions of the instructions of a circuit,
+    which the instructions count once the circuit caches its properties."""
+
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+
+def _flyweight(cls):
+    """Return the shared instance of an instruction class, or None if the
+    class has no instance that can be shared."""
+    try:
+        return _FLYWEIGHTS[cls]
+    except KeyError:
+        pass
+    try:
+        shared = cls()
+    except TypeError:
+        shared = None
+    if shared is not None and (shared._params or hasattr(shared, '__dict__')):
+        shared = None
+    _FLYWEIGHTS[cls] = shared
+    return shared
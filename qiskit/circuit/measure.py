@@ -16,6 +16,8 @@ from qiskit.circuit.quantumcircuit import QuantumCircuit
 class Measure(Instruction):
     """Quantum measurement in the computational basis."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new measurement instruction."""
         super().__init__("measure", 1, 1, [])
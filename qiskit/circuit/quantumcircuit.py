@@ -7,8 +7,7 @@
 
 """Quantum circuit object."""
 
-from copy import deepcopy
-import itertools
+from copy import copy, deepcopy
 import sys
 import multiprocessing as mp
 import sympy
@@ -18,6 +17,13 @@ from qiskit.exceptions import QiskitError
 from .quantumregister import QuantumRegister
 from .classicalregister import ClassicalRegister
 from .variabletable import VariableTable
+from .fingerprint import circuit_fingerprint
+from .columnardata import ColumnarData
+from .instruction import ConditionCounter
+
+# compiler and simulator directives, which are not counted in the size and
+# the depth of circuits
+_DIRECTIVES = ('barrier', 'snapshot')
 
 
 class QuantumCircuit:
@@ -29,7 +35,7 @@ class QuantumCircuit:
     header = "OPENQASM 2.0;"
     extension_lib = "include \"qelib1.inc\";"
 
-    def __init__(self, *regs, name=None):
+    def __init__(self, *regs, name=None, columnar=False):
         """Create a new circuit.
 
         A circuit is a list of instructions bound to some registers.
@@ -38,6 +44,9 @@ class QuantumCircuit:
             *regs (Registers): registers to include in the circuit.
             name (str or None): the name of the quantum circuit. If
                 None, an automatically generated string will be assigned.
+            columnar (bool): if True, the instructions are stored in a
+                ``ColumnarData`` instead of a list, which makes the circuit
+                metrics and the assembly of large circuits faster.
 
         Raises:
             QiskitError: if the circuit name, if given, is not valid.
@@ -57,26 +66,81 @@ class QuantumCircuit:
 
         self.name = name
 
-        # Data contains a list of instructions and their contexts,
-        # in the order they were applied.
-        self.data = []
+        # Seed of the swap mapper chosen by transpile() among several, to map
+        # the circuit again with the same result, or None.
+        self.seed_mapper = None
 
         # This is a map of registers bound to this circuit, by name.
         self.qregs = []
         self.cregs = []
+
+        # Data contains a list of instructions and their contexts,
+        # in the order they were applied.
+        self.data = ColumnarData(self.qregs, self.cregs) if columnar else _InstructionList()
+
         self.add_register(*regs)
 
         # Variable table tracks instructions with variable parameters.
         self._variable_table = VariableTable()
 
+        # (data, key, {name: value}) of the properties computed last, see _metric()
+        self._metrics_cache = None
+        # changes of the conditions of the instructions since then
+        self._condition_counter = ConditionCounter()
+
     def __str__(self):
         return str(self.draw(output='text'))
 
     def __eq__(self, other):
+        if not isinstance(other, QuantumCircuit):
+            return False
+        # different fingerprints prove the circuits differ, but equal ones can
+        # be a hash collision, so equality is decided on the instructions
+        if self.fingerprint(params=False) != other.fingerprint(params=False):
+            return False
+        if self._same_data(other):
+            return True
+        # the independent instructions can still be in another order
         # TODO: remove the DAG from this function
         from qiskit.converters import circuit_to_dag
         return circuit_to_dag(self) == circuit_to_dag(other)
 
+    def _same_data(self, other):
+        """Return True if other has the same registers and the same
+        instructions in the same order, with params equal up to a tolerance.
+        """
+        if self.qregs != other.qregs or self.cregs != other.cregs or \
+                len(self.data) != len(other.data):
+            return False
+        return all(qargs == other_qargs and cargs == other_cargs and
+                   instruction.control == other_instruction.control and
+                   (instruction is other_instruction or instruction == other_instruction)
+                   for (instruction, qargs, cargs), (other_instruction, other_qargs, other_cargs)
+                   in zip(self.data, other.data))
+
+    def fingerprint(self, params=True):
+        """Return a fingerprint of the structure of the circuit.
+
+        The fingerprint only depends on the DAG of the circuit, and not on the
+        order in which its independent instructions were applied. Equal
+        circuits have equal fingerprints, and different circuits have different
+        fingerprints except for hash collisions.
+
+        Args:
+            params (bool): if False, the parameters of the instructions are
+                left out of the fingerprint.
+
+        Returns:
+            int: the fingerprint of the circuit.
+        """
+        wires = [(register, index)
+                 for register in self.qregs + self.cregs for index in range(register.size)]
+        return circuit_fingerprint(
+            wires,
+            ((instruction, qargs, cargs, instruction.control)
+             for instruction, qargs, cargs in self.data),
+            params)
+
     @classmethod
     def _increment_instances(cls):
         cls.instances += 1
@@ -121,7 +185,7 @@ class QuantumCircuit:
             QuantumCircuit: the mirrored circuit
         """
         reverse_circ = self.copy(name=self.name+'_mirror')
-        reverse_circ.data = []
+        reverse_circ.data = _InstructionList()
         for inst, qargs, cargs in reversed(self.data):
             reverse_circ.data.append((inst.mirror(), qargs, cargs))
         return reverse_circ
@@ -138,7 +202,7 @@ class QuantumCircuit:
             QiskitError: if the circuit cannot be inverted.
         """
         inverse_circ = self.copy(name=self.name+'_dg')
-        inverse_circ.data = []
+        inverse_circ.data = _InstructionList()
         for inst, qargs, cargs in reversed(self.data):
             inverse_circ.data.append((inst.inverse(), qargs, cargs))
         return inverse_circ
@@ -157,9 +221,10 @@ class QuantumCircuit:
         # Check registers in LHS are compatible with RHS
         self._check_compatible_regs(rhs)
 
-        # Make new circuit with combined registers
-        combined_qregs = deepcopy(self.qregs)
-        combined_cregs = deepcopy(self.cregs)
+        # Make new circuit with combined registers, which are shared since
+        # the instructions of both circuits already refer to them
+        combined_qregs = list(self.qregs)
+        combined_cregs = list(self.cregs)
 
         for element in rhs.qregs:
             if element not in self.qregs:
@@ -167,9 +232,10 @@ class QuantumCircuit:
         for element in rhs.cregs:
             if element not in self.cregs:
                 combined_cregs.append(element)
-        circuit = QuantumCircuit(*combined_qregs, *combined_cregs)
-        for instruction_context in itertools.chain(self.data, rhs.data):
-            circuit.append(*instruction_context)
+        circuit = QuantumCircuit(*combined_qregs, *combined_cregs,
+                                 columnar=isinstance(self.data, ColumnarData))
+        circuit._append_circuit_data(self)
+        circuit._append_circuit_data(rhs)
         return circuit
 
     def extend(self, rhs):
@@ -195,10 +261,21 @@ class QuantumCircuit:
                 self.cregs.append(element)
 
         # Add new gates
-        for instruction_context in rhs.data:
-            self.append(*instruction_context)
+        self._append_circuit_data(rhs)
         return self
 
+    def _append_circuit_data(self, circuit):
+        """Append the instructions of a circuit whose registers are all in this
+        circuit, without checking each of them again."""
+        if isinstance(circuit.data, ColumnarData):
+            instructions = list(circuit.data.instructions())
+        else:
+            instructions = [instruction for instruction, _, _ in circuit.data]
+        self.data.extend(circuit.data)
+        for instruction in instructions:
+            if instruction.params:
+                self._update_variable_table(instruction)
+
     def __add__(self, rhs):
         """Overload + to implement self.combine."""
         return self.combine(rhs)
@@ -250,7 +327,12 @@ class QuantumCircuit:
         instruction_context = instruction, qargs, cargs
         self.data.append(instruction_context)
 
-        # track variable parameters in instruction
+        self._update_variable_table(instruction)
+
+        return instruction
+
+    def _update_variable_table(self, instruction):
+        """Track the variable parameters of an instruction in the circuit."""
         for param_index, param in enumerate(instruction.params):
             if isinstance(param, sympy.Expr):
                 current_symbols = set(self._variable_table.keys())
@@ -264,8 +346,6 @@ class QuantumCircuit:
                     for symbol in common_symbols:
                         self._variable_table[symbol].append((instruction, param_index))
 
-        return instruction
-
     def _attach(self, instruction, qargs, cargs):
         """DEPRECATED after 0.8"""
         self.append(instruction, qargs, cargs)
@@ -328,6 +408,7 @@ class QuantumCircuit:
         Returns:
             QuantumCircuit: a circuit one level decomposed
         """
+        # pylint: disable=cyclic-import
         from qiskit.transpiler.passes.decompose import Decompose
         from qiskit.converters.circuit_to_dag import circuit_to_dag
         from qiskit.converters.dag_to_circuit import dag_to_circuit
@@ -433,11 +514,7 @@ class QuantumCircuit:
         Returns:
             int: Total number of gate operations.
         """
-        gate_ops = 0
-        for item in self.data:
-            if item.name not in ['barrier', 'snapshot']:
-                gate_ops += 1
-        return gate_ops
+        return self._metric('size')
 
     def depth(self):
         """Return circuit depth (i.e. length of critical path).
@@ -451,50 +528,7 @@ class QuantumCircuit:
             The circuit depth and the DAG depth need not bt the
             same.
         """
-        # Labels the registers by ints
-        # and then the qubit position in
-        # a register is given by reg_int+qubit_num
-        reg_offset = 0
-        reg_map = {}
-        for reg in self.qregs+self.cregs:
-            reg_map[reg.name] = reg_offset
-            reg_offset += reg.size
-
-        # A list that holds the height of each qubit
-        # and classical bit.
-        op_stack = [0]*reg_offset
-        # Here we are playing a modified version of
-        # Tetris where we stack gates, but multi-qubit
-        # gates, or measurements have a block for each
-        # qubit or cbit that are connected by a virtual
-        # line so that they all stacked at the same depth.
-        # Conditional gates act on all cbits in the register
-        # they are conditioned on.
-        # We do not consider barriers or snapshots as
-        # They are transpiler and simulator directives.
-        # The max stack height is the circuit depth.
-        for op in self.data:
-            if op[0].name not in ['barrier', 'snapshot']:
-                levels = []
-                reg_ints = []
-                for ind, reg in enumerate(op[1]+op[2]):
-                    # Add to the stacks of the qubits and
-                    # cbits used in the gate.
-                    reg_ints.append(reg_map[reg[0].name]+reg[1])
-                    levels.append(op_stack[reg_ints[ind]] + 1)
-                if op[0].control:
-                    # Controls operate over all bits in the
-                    # classical register they use.
-                    cint = reg_map[op[0].control[0].name]
-                    for off in range(op[0].control[0].size):
-                        if cint+off not in reg_ints:
-                            reg_ints.append(cint+off)
-                            levels.append(op_stack[cint+off]+1)
-
-                max_level = max(levels)
-                for ind in reg_ints:
-                    op_stack[ind] = max_level
-        return max(op_stack)
+        return self._metric('depth')
 
     def width(self):
         """Return number of qubits plus clbits in circuit.
@@ -503,7 +537,7 @@ class QuantumCircuit:
             int: Width of circuit.
 
         """
-        return sum(reg.size for reg in self.qregs+self.cregs)
+        return self._metric('width')
 
     def count_ops(self):
         """Count each operation kind in the circuit.
@@ -511,13 +545,7 @@ class QuantumCircuit:
         Returns:
             dict: a breakdown of how many operations of each kind.
         """
-        count_ops = {}
-        for op in self.data:
-            if op[0].name in count_ops.keys():
-                count_ops[op[0].name] += 1
-            else:
-                count_ops[op[0].name] = 1
-        return count_ops
+        return dict(self._metric('operations'))
 
     def num_connected_components(self, unitary_only=False):
         """How many non-entangled subcircuits can the circuit be factored to.
@@ -528,76 +556,146 @@ class QuantumCircuit:
         Returns:
             int: Number of connected components in circuit.
         """
-        # Convert registers to ints (as done in depth).
-        reg_offset = 0
-        reg_map = {}
+        return self._metric('factors' if unitary_only else 'components')
+
+    def properties(self):
+        """Return a dictionary of circuit properties, computed together in a
+        single pass over the instructions.
 
-        if unitary_only:
-            regs = self.qregs
+        Returns:
+            dict: the size, depth and width of the circuit, its number of
+                clbits ('bits'), its numbers of unitary factors ('factors')
+                and of connected components ('components'), and the count of
+                each operation kind ('operations').
+        """
+        names = ['size', 'depth', 'width', 'bits', 'factors', 'components', 'operations']
+        properties = {name: self._metric(name) for name in names}
+        properties['operations'] = dict(properties['operations'])
+        return properties
+
+    def _metric(self, name):
+        """Return a property of the circuit, see ``properties()``.
+
+        The properties are cached until the instructions, their conditions or
+        the registers of the circuit change, if the data of the circuit counts
+        its modifications. As an instruction can be conditioned after it was
+        appended, the instructions count the changes of their conditions in
+        the condition counter of the circuit once the properties are cached.
+        """
+        data = self.data
+        version = getattr(data, 'version', None)
+        # counter of the conditions, when the properties are computed anew
+        counter = None
+        if version is None:
+            # the modifications of a plain list are not counted
+            metrics = {}
         else:
-            regs = self.qregs+self.cregs
+            key = (version, self._condition_counter.count, len(self.qregs), len(self.cregs))
+            cache = self._metrics_cache
+            if cache is None or cache[0] is not data or cache[1] != key:
+                cache = self._metrics_cache = (data, key, {})
+                counter = self._condition_counter
+            metrics = cache[2]
+        if isinstance(data, ColumnarData):
+            if counter is not None:
+                _count_condition_changes(data.table, counter)
+            if name not in metrics:
+                metrics[name] = self._columnar_metric(name)
+        elif name not in metrics:
+            metrics.update(self._compute_metrics(counter))
+        return metrics[name]
+
+    def _columnar_metric(self, name):
+        """Compute a property of a circuit whose data is a ``ColumnarData``."""
+        if name == 'width':
+            return sum(reg.size for reg in self.qregs + self.cregs)
+        if name == 'bits':
+            return sum(reg.size for reg in self.cregs)
+        if name == 'operations':
+            return self.data.count_ops()
+        if name in ('factors', 'components'):
+            return self.data.num_connected_components(unitary_only=name == 'factors')
+        return getattr(self.data, name)()
+
+    def _compute_metrics(self, counter=None):
+        """Compute all the properties of the circuit in a single pass over the
+        instructions, see ``properties()``.
 
-        for reg in regs:
+        Args:
+            counter (ConditionCounter): if given, the instructions count the
+                changes of their conditions in it.
+
+        Returns:
+            dict: the properties, by name.
+        """
+        # pylint: disable=protected-access
+        # Labels the registers by ints
+        # and then the qubit position in
+        # a register is given by reg_int+qubit_num
+        reg_offset = 0
+        reg_map = {}
+        for reg in self.qregs+self.cregs:
             reg_map[reg.name] = reg_offset
             reg_offset += reg.size
-        # Start with each qubit or cbit being its own subgraph.
-        sub_graphs = [[bit] for bit in range(reg_offset)]
+        num_qubits = sum(reg.size for reg in self.qregs)
 
-        num_sub_graphs = len(sub_graphs)
-
-        # Here we are traversing the gates and looking to see
-        # which of the sub_graphs the gate joins together.
-        for op in self.data:
-            if unitary_only:
-                args = op[1]
-                num_qargs = len(args)
-            else:
-                args = op[1]+op[2]
-                num_qargs = len(args) + (1 if op[0].control else 0)
-
-            if num_qargs >= 2 and op[0].name not in ['barrier', 'snapshot']:
-                graphs_touched = []
-                num_touched = 0
-                # Controls necessarily join all the cbits in the
-                # register that they use.
-                if op[0].control and not unitary_only:
-                    creg = op[0].control[0]
-                    creg_int = reg_map[creg.name]
-                    for coff in range(creg.size):
-                        temp_int = creg_int+coff
-                        for k in range(num_sub_graphs):
-                            if temp_int in sub_graphs[k]:
-                                graphs_touched.append(k)
-                                num_touched += 1
-                                break
-
-                for item in args:
-                    reg_int = reg_map[item[0].name]+item[1]
-                    for k in range(num_sub_graphs):
-                        if reg_int in sub_graphs[k]:
-                            if k not in graphs_touched:
-                                graphs_touched.append(k)
-                                num_touched += 1
-                                break
-
-                # If the gate touches more than one subgraph
-                # join those graphs together and return
-                # reduced number of subgraphs
-                if num_touched > 1:
-                    connections = []
-                    for idx in graphs_touched:
-                        connections.extend(sub_graphs[idx])
-                    _sub_graphs = []
-                    for idx in range(num_sub_graphs):
-                        if idx not in graphs_touched:
-                            _sub_graphs.append(sub_graphs[idx])
-                    _sub_graphs.append(connections)
-                    sub_graphs = _sub_graphs
-                    num_sub_graphs -= (num_touched-1)
-            # Cannot go lower than one so break
-            if num_sub_graphs == 1:
-                break
-        return num_sub_graphs
+        # A list that holds the height of each qubit
+        # and classical bit.
+        op_stack = [0]*reg_offset
+        # Here we are playing a modified version of
+        # Tetris where we stack gates, but multi-qubit
+        # gates, or measurements have a block for each
+        # qubit or cbit that are connected by a virtual
+        # line so that they all stacked at the same depth.
+        # Conditional gates act on all cbits in the register
+        # they are conditioned on.
+        # We do not consider barriers or snapshots as
+        # They are transpiler and simulator directives.
+        # The max stack height is the circuit depth.
+        # The bits joined by the instructions are merged in union-find
+        # forests, over all the bits for the connected components and over
+        # the qubits for the unitary factors.
+        # The merging stops once the bits are all connected.
+        components = list(range(reg_offset))
+        factors = list(range(num_qubits))
+        num_components = reg_offset
+        num_factors = num_qubits
+        size = 0
+        count_ops = {}
+        for instruction, qargs, cargs in self.data:
+            # the shared instructions cannot be conditioned
+            if counter is not None and not instruction._is_flyweight():
+                instruction._count_condition_changes(counter)
+            name = instruction.name
+            count_ops[name] = count_ops.get(name, 0) + 1
+            if name in _DIRECTIVES:
+                continue
+            size += 1
+            qubits = [reg_map[reg.name] + index for reg, index in qargs]
+            bits = qubits + [reg_map[reg.name] + index for reg, index in cargs]
+            if instruction.control:
+                # Controls operate over all bits in the
+                # classical register they use.
+                creg = instruction.control[0]
+                cint = reg_map[creg.name]
+                bits += [bit for bit in range(cint, cint + creg.size) if bit not in bits]
+            if not bits:
+                continue
+            level = max([op_stack[bit] for bit in bits]) + 1
+            for bit in bits:
+                op_stack[bit] = level
+            if num_components > 1 and len(bits) > 1:
+                num_components -= _union(components, bits)
+            if num_factors > 1 and len(qubits) > 1:
+                num_factors -= _union(factors, qubits)
+
+        return {'size': size,
+                'depth': max(op_stack, default=0),
+                'width': reg_offset,
+                'bits': reg_offset - num_qubits,
+                'factors': num_factors,
+                'components': num_components,
+                'operations': count_ops}
 
     def num_unitary_factors(self):
         """Computes the number of tensor factors in the unitary
@@ -616,19 +714,51 @@ class QuantumCircuit:
         """
         return self.num_unitary_factors()
 
-    def copy(self, name=None):
+    def copy(self, name=None, shallow=False):
         """
         Args:
           name (str): name to be given to the copied circuit, if None then the name stays the same
+          shallow (bool): if True, the copy shares the registers and the instructions
+                          without variables with the current circuit, which must then
+                          not be modified in place (e.g. with ``c_if``)
         Returns:
-          QuantumCircuit: a deepcopy of the current circuit, with the name updated if
-                          it was provided
+          QuantumCircuit: a deepcopy of the current circuit, or a shallow copy if asked,
+                          with the name updated if it was provided
         """
-        cpy = deepcopy(self)
+        cpy = self._shallow_copy() if shallow else deepcopy(self)
         if name:
             cpy.name = name
         return cpy
 
+    def _shallow_copy(self):
+        """Return a copy of the circuit that only copies the instructions with
+        variables, so that binding the variables of the copy does not modify
+        this circuit."""
+        copies = {}
+        variable_table = VariableTable()
+        for variable, entries in self._variable_table.items():
+            copied_entries = []
+            for instruction, param_index in entries:
+                if id(instruction) not in copies:
+                    copies[id(instruction)] = instruction.copy()
+                copied_entries.append((copies[id(instruction)], param_index))
+            variable_table[variable] = copied_entries
+
+        cpy = copy(self)
+        cpy._condition_counter = ConditionCounter()
+        cpy.qregs = list(self.qregs)
+        cpy.cregs = list(self.cregs)
+        if isinstance(self.data, ColumnarData):
+            cpy.data = self.data.copy(cpy.qregs, cpy.cregs, copies)
+        elif copies:
+            cpy.data = _InstructionList(
+                (copies.get(id(instruction), instruction), qargs, cargs)
+                for instruction, qargs, cargs in self.data)
+        else:
+            cpy.data = _InstructionList(self.data)
+        cpy._variable_table = variable_table
+        return cpy
+
     @staticmethod
     def from_qasm_file(path):
         """Take in a QASM file and generate a QuantumCircuit object.
@@ -680,8 +810,90 @@ class QuantumCircuit:
 
 def _circuit_from_qasm(qasm):
     # pylint: disable=cyclic-import
-    from qiskit.converters import ast_to_dag
-    from qiskit.converters import dag_to_circuit
-    ast = qasm.parse()
-    dag = ast_to_dag(ast)
-    return dag_to_circuit(dag)
+    from qiskit.converters import qasm_to_circuit
+    return qasm_to_circuit(qasm)
+
+
+def _count_condition_changes(instructions, counter):
+    """Make instructions count the changes of their conditions in counter."""
+    # pylint: disable=protected-access
+    for instruction in instructions:
+        # the shared instructions cannot be conditioned
+        if instruction is not None and not instruction._is_flyweight():
+            instruction._count_condition_changes(counter)
+
+
+class _InstructionList(list):
+    """List of the instructions of a circuit, which counts its modifications
+    so that the circuit can cache its properties."""
+
+    version = 0
+
+    def __setitem__(self, index, item):
+        self.version += 1
+        super().__setitem__(index, item)
+
+    def __delitem__(self, index):
+        self.version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self.version += 1
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self.version += 1
+        return super().__imul__(other)
+
+    def append(self, item):
+        self.version += 1
+        super().append(item)
+
+    def extend(self, items):
+        self.version += 1
+        super().extend(items)
+
+    def insert(self, index, item):
+        self.version += 1
+        super().insert(index, item)
+
+    def remove(self, item):
+        self.version += 1
+        super().remove(item)
+
+    def pop(self, index=-1):
+        self.version += 1
+        return super().pop(index)
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def reverse(self):
+        self.version += 1
+        super().reverse()
+
+    def sort(self, *args, **kwargs):
+        self.version += 1
+        super().sort(*args, **kwargs)
+
+
+def _find(parents, bit):
+    """Return the root of the tree of a bit in a union-find forest."""
+    while parents[bit] != bit:
+        parents[bit] = parents[parents[bit]]
+        bit = parents[bit]
+    return bit
+
+
+def _union(parents, bits):
+    """Merge the trees of some bits in a union-find forest, and return the
+    number of trees merged into another one."""
+    merged = 0
+    root = _find(parents, bits[0])
+    for bit in bits[1:]:
+        bit_root = _find(parents, bit)
+        if bit_root != root:
+            parents[bit_root] = root
+            merged += 1
+    return merged
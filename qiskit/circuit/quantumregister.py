@@ -15,6 +15,8 @@ from .register import Register
 
 class QuantumRegister(Register):
     """Implement a quantum register."""
+
+    __slots__ = ()
     # Counter for the number of instances in this class.
     instances_counter = itertools.count()
     # Prefix to use for auto naming.
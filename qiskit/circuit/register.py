@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 class Register:
     """Implement a generic register."""
 
+    __slots__ = ('name', 'size', '_bits')
+
     # Counter for the number of instances in this class.
     instances_counter = itertools.count()
     # Prefix to use for auto naming.
@@ -44,6 +46,17 @@ class Register:
         self.size = size
         if size <= 0:
             raise QiskitError("register size must be positive")
+        # (register, index) tuples of the bits, shared by all the circuits
+        # using the register
+        self._bits = None
+
+    def __setstate__(self, state):
+        # registers pickled before Register had slots have a dict state
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        self._bits = None
+        for attributes in (dict_state, slot_state):
+            for attribute, value in (attributes or {}).items():
+                setattr(self, attribute, value)
 
     def __repr__(self):
         """Return the official string representing the register."""
@@ -83,15 +96,16 @@ class Register:
         if isinstance(key, int) and key < 0:
             key = self.size + key
         self.check_range(key)
+        bits = self._get_bits()
         if isinstance(key, slice):
-            return [(self, ind) for ind in range(*key.indices(len(self)))]
+            return bits[key]
         elif isinstance(key, list):  # list of qubit indices
             if max(key) < len(self):
-                return [(self, ind) for ind in key]
+                return [bits[ind] for ind in key]
             else:
                 raise QiskitError('register index out of range')
         else:
-            return self, key
+            return bits[key]
 
     def __iter__(self):
         """
@@ -99,7 +113,13 @@ class Register:
             iterator: an iterator over the bits/qubits of the register, in the
                 form `tuple (Register, int)`.
         """
-        return zip([self]*self.size, range(self.size))
+        return iter(self._get_bits())
+
+    def _get_bits(self):
+        """Return the list of the bits of the register."""
+        if self._bits is None:
+            self._bits = [(self, index) for index in range(self.size)]
+        return self._bits
 
     def __eq__(self, other):
         """Two Registers are the same if they are of the same type
@@ -16,6 +16,8 @@ from .decorators import _op_expand
 class Reset(Instruction):
     """Qubit reset."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new reset instruction."""
         super().__init__("reset", 1, 0, [])
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Binding of many sets of values to the variables of a circuit.
+"""
+import copy
+
+import numpy
+import sympy
+
+from qiskit.exceptions import QiskitError
+from .quantumcircuit import QuantumCircuit
+
+
+class VariableBinder:
+    """Bind sets of values to the variables of a template circuit.
+
+    The variable parameters of the template are compiled once into numeric
+    functions of the variables, which are evaluated for all the sets of
+    values in a single vectorized call. The bound circuits share the
+    registers and the instructions without variable parameters with the
+    template, so only the instructions with variable parameters are copied.
+    """
+
+    def __init__(self, circuit, variables=None):
+        """Create a new binder.
+
+        Args:
+            circuit (QuantumCircuit): template circuit.
+            variables (list[sympy.Symbol]): variables to bind, in the order of
+                the columns of the values given to ``bind_all()``. If None,
+                all the variables of the circuit sorted by name.
+        """
+        if variables is None:
+            variables = sorted(circuit.variables, key=str)
+        self._circuit = circuit
+        self._variables = list(variables)
+        variable_set = set(self._variables)
+
+        # data indices of the instructions with variable parameters, the
+        # indices of their parameters that depend on the bound variables, and
+        # whether they still have variable parameters once bound
+        self._instructions = []
+        # (data_index, param_index) of each parameter that is bound
+        self._slots = []
+        # numeric function of the variables for each slot, or the expression
+        # if it also depends on other variables
+        self._functions = []
+        for data_index, (instruction, _, _) in enumerate(circuit.data):
+            param_indices = []
+            is_variable = False
+            is_bound = True
+            for param_index, param in enumerate(instruction.params):
+                if not isinstance(param, sympy.Expr) or not param.free_symbols:
+                    continue
+                is_variable = True
+                # snapshot params are labels and not angles
+                if instruction.name == 'snapshot' or not param.free_symbols & variable_set:
+                    is_bound = False
+                    continue
+                param_indices.append(param_index)
+                self._slots.append((data_index, param_index))
+                if param.free_symbols <= variable_set:
+                    self._functions.append(sympy.lambdify(self._variables, param, 'numpy'))
+                else:
+                    is_bound = False
+                    self._functions.append(param)
+            if is_variable:
+                self._instructions.append((data_index, param_indices, is_bound))
+
+    @property
+    def circuit(self):
+        """Return the template circuit."""
+        return self._circuit
+
+    @property
+    def variables(self):
+        """Return the bound variables, in the order of the values columns."""
+        return list(self._variables)
+
+    @property
+    def slots(self):
+        """Return the ``(data_index, param_index)`` of the bound parameters."""
+        return list(self._slots)
+
+    def evaluate(self, values):
+        """Evaluate the bound parameters for some sets of values.
+
+        Args:
+            values (dict or array_like): either a dict ``{variable: values}``
+                where each entry is a value or a sequence of values, or an
+                array of shape ``(number of sets, number of variables)``.
+
+        Returns:
+            list[list]: for each slot, the list of its values for every set.
+
+        Raises:
+            QiskitError: if the values do not match the variables.
+        """
+        columns, num_sets = self._value_columns(values)
+
+        evaluated = []
+        for function in self._functions:
+            if isinstance(function, sympy.Expr):
+                slot_values = [function.subs(zip(self._variables, row))
+                               for row in zip(*columns)]
+            else:
+                slot_values = numpy.broadcast_to(function(*columns), (num_sets,))
+                if numpy.iscomplexobj(slot_values) and not numpy.any(slot_values.imag):
+                    slot_values = slot_values.real
+                slot_values = slot_values.tolist()
+            evaluated.append(slot_values)
+        return evaluated
+
+    def num_sets(self, values):
+        """Return the number of sets of values in ``values``.
+
+        Args:
+            values (dict or array_like): see ``evaluate()``.
+
+        Returns:
+            int: the number of sets.
+        """
+        return self._value_columns(values)[1]
+
+    def bind(self, values):
+        """Bind a single set of values.
+
+        Args:
+            values (dict): ``{variable: value}`` for all the variables.
+
+        Returns:
+            QuantumCircuit: the bound circuit.
+        """
+        return self.bind_all({variable: [value] for variable, value in values.items()})[0]
+
+    def bind_all(self, values):
+        """Bind several sets of values.
+
+        Args:
+            values (dict or array_like): see ``evaluate()``.
+
+        Returns:
+            list[QuantumCircuit]: a bound circuit for each set of values.
+        """
+        evaluated = self.evaluate(values)
+        num_sets = self.num_sets(values)
+        slot_rows = {slot: row for row, slot in enumerate(self._slots)}
+        template = self._circuit
+
+        circuits = []
+        for set_index in range(num_sets):
+            data = list(template.data)
+            variable_instructions = []
+            for data_index, param_indices, is_bound in self._instructions:
+                instruction, qargs, cargs = data[data_index]
+                params = list(instruction.params)
+                for param_index in param_indices:
+                    params[param_index] = \
+                        evaluated[slot_rows[(data_index, param_index)]][set_index]
+                bound = copy.copy(instruction)
+                bound.params = params
+                data[data_index] = (bound, qargs, cargs)
+                if not is_bound:
+                    variable_instructions.append(bound)
+
+            circuit = QuantumCircuit(*template.qregs, *template.cregs, name=template.name)
+            circuit.data = data
+            for instruction in variable_instructions:
+                circuit._update_variable_table(instruction)  # pylint: disable=protected-access
+            circuits.append(circuit)
+        return circuits
+
+    def _value_columns(self, values):
+        """Return the values of each variable as arrays, and the number of sets."""
+        if isinstance(values, dict):
+            missing = [variable for variable in self._variables if variable not in values]
+            if missing:
+                raise QiskitError("No values given for variables %s." %
+                                  ", ".join(str(variable) for variable in missing))
+            columns = [numpy.atleast_1d(numpy.asarray(values[variable]))
+                       for variable in self._variables]
+            try:
+                columns = numpy.broadcast_arrays(*columns)
+            except ValueError:
+                raise QiskitError("The variables have different numbers of values.")
+        else:
+            matrix = numpy.asarray(values)
+            if matrix.ndim == 1 and len(self._variables) == 1:
+                matrix = matrix.reshape(-1, 1)
+            if matrix.ndim != 2 or matrix.shape[1] != len(self._variables):
+                raise QiskitError("Expected values of shape (sets, %d), got %s." %
+                                  (len(self._variables), matrix.shape))
+            columns = list(matrix.T)
+        num_sets = len(columns[0]) if columns else 1
+        return columns, num_sets
@@ -11,5 +11,5 @@
 
 from .run_config import RunConfig
 from .transpile_config import TranspileConfig
-from .assembler import assemble_circuits
+from .assembler import assemble_circuits, assemble_circuit_sweep
 from .transpiler import transpile
@@ -12,6 +12,8 @@ import numpy
 import sympy
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.columnardata import ColumnarData
+from qiskit.circuit.variablebinder import VariableBinder
 from qiskit.compiler.run_config import RunConfig
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader, QobjHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
@@ -68,6 +70,9 @@ def assemble_circuits(circuits, run_config=None, qobj_header=None, qobj_id=None)
                                                 memory_slots=memory_slots,
                                                 creg_sizes=creg_sizes,
                                                 name=circuit.name)
+        # the seed chosen by transpile among several, to map the circuit again
+        if circuit.seed_mapper is not None:
+            experimentheader.seed_mapper = circuit.seed_mapper
         # TODO: why do we need n_qubits and memory_slots in both the header and the config
         experimentconfig = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
 
@@ -77,22 +82,16 @@ def assemble_circuits(circuits, run_config=None, qobj_header=None, qobj_id=None)
         # their clbit_index, create a new register slot for every conditional gate
         # and add a bfunc to map the creg=val mask onto the gating register bit.
 
-        is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
+        indexed_data = list(_indexed_data(circuit))
+        is_conditional_experiment = any(op.control for op, _, _ in indexed_data)
         max_conditional_idx = 0
 
         instructions = []
-        for op_context in circuit.data:
-            op = op_context[0]
-            qargs = op_context[1]
-            cargs = op_context[2]
+        for op, qubit_indices, clbit_indices in indexed_data:
             current_instruction = QasmQobjInstruction(name=op.name)
-            if qargs:
-                qubit_indices = [qubit_labels.index([qubit[0].name, qubit[1]])
-                                 for qubit in qargs]
+            if qubit_indices:
                 current_instruction.qubits = qubit_indices
-            if cargs:
-                clbit_indices = [clbit_labels.index([clbit[0].name, clbit[1]])
-                                 for clbit in cargs]
+            if clbit_indices:
                 current_instruction.memory = clbit_indices
 
                 # If the experiment has conditional instructions, assume every
@@ -101,7 +100,7 @@ def assemble_circuits(circuits, run_config=None, qobj_header=None, qobj_id=None)
                     current_instruction.register = clbit_indices
 
             if op.params:
-                params = list(map(lambda x: x.evalf(), op.params))
+                params = [x.evalf() if isinstance(x, sympy.Basic) else x for x in op.params]
                 params = [sympy.matrix2numpy(x, dtype=complex)
                           if isinstance(x, sympy.Matrix) else x for x in params]
                 if len(params) == 1 and isinstance(params[0], numpy.ndarray):
@@ -154,3 +153,103 @@ def assemble_circuits(circuits, run_config=None, qobj_header=None, qobj_id=None)
 
     return QasmQobj(qobj_id=qobj_id or str(uuid.uuid4()), config=userconfig,
                     experiments=experiments, header=qobj_header)
+
+
+def assemble_circuit_sweep(circuit, values, variables=None, transpile_config=None,
+                           run_config=None, qobj_header=None, qobj_id=None):
+    """Assembles a qobj sweeping the variables of a circuit over sets of values.
+
+    The circuit is transpiled and assembled once with its variable parameters,
+    and an experiment is then derived from it for each set of values by only
+    replacing the parameters that depend on the variables. The experiments
+    share their configs and the instructions that do not depend on the
+    variables. The experiment of the i-th set of values is named
+    ``'<circuit name>[i]'``, so that its results can be looked up by name.
+
+    Args:
+        circuit (QuantumCircuit): circuit with variable parameters
+        values (dict or array_like): sets of values of the variables, either as
+            a dict ``{variable: values}`` or as an array of shape
+            ``(number of sets, number of variables)``
+        variables (list[sympy.Symbol]): variables to sweep, in the order of the
+            columns of ``values``. If None, all the variables of the circuit
+            sorted by name.
+        transpile_config (TranspileConfig): if given, configuration used for
+            transpiling the circuit before assembling it
+        run_config (RunConfig): RunConfig object
+        qobj_header (QobjHeader): header to pass to the results
+        qobj_id (int): identifier for the generated qobj
+
+    Returns:
+        QasmQobj: the Qobj to be run on the backends, with an experiment for
+            each set of values
+    """
+    if transpile_config is not None:
+        # pylint: disable=cyclic-import
+        from qiskit.compiler.transpiler import transpile
+        circuit = transpile(circuit, transpile_config)
+
+    binder = VariableBinder(circuit, variables)
+    qobj = assemble_circuits([circuit], run_config=run_config,
+                             qobj_header=qobj_header, qobj_id=qobj_id)
+    template = qobj.experiments[0]
+
+    # map the data index of each instruction to its index in the experiment,
+    # as conditional instructions are preceded by a bfunc
+    experiment_indices = []
+    experiment_index = 0
+    for op, _, _ in circuit.data:
+        if op.control:
+            experiment_index += 1
+        experiment_indices.append(experiment_index)
+        experiment_index += 1
+
+    patches = {}
+    for row, (data_index, param_index) in enumerate(binder.slots):
+        patches.setdefault(experiment_indices[data_index], []).append((param_index, row))
+
+    evaluated = binder.evaluate(values)
+    experiments = []
+    for set_index in range(binder.num_sets(values)):
+        instructions = list(template.instructions)
+        for experiment_index, param_rows in patches.items():
+            instruction = _shallow_copy(instructions[experiment_index])
+            params = list(instruction.params)
+            for param_index, row in param_rows:
+                value = evaluated[row][set_index]
+                params[param_index] = value.evalf() if isinstance(value, sympy.Basic) else value
+            instruction.params = params
+            instructions[experiment_index] = instruction
+        experiment = _shallow_copy(template)
+        experiment.instructions = instructions
+        experiment.header = _shallow_copy(template.header)
+        experiment.header.name = '%s[%d]' % (template.header.name, set_index)
+        experiments.append(experiment)
+
+    qobj.experiments = experiments
+    return qobj
+
+
+def _indexed_data(circuit):
+    """Return an iterator over the ``(instruction, qubit_indices, clbit_indices)``
+    of a circuit, where the indices are the positions of the bits in the
+    registers of the circuit, in order."""
+    if isinstance(circuit.data, ColumnarData):
+        # the columns already hold the indices
+        return circuit.data.indexed()
+
+    qubit_indices = {qubit: index for index, qubit in
+                     enumerate(qubit for qreg in circuit.qregs for qubit in qreg)}
+    clbit_indices = {clbit: index for index, clbit in
+                     enumerate(clbit for creg in circuit.cregs for clbit in creg)}
+    return ((op,
+             [qubit_indices[qubit] for qubit in qargs],
+             [clbit_indices[clbit] for clbit in cargs])
+            for op, qargs, cargs in circuit.data)
+
+
+def _shallow_copy(model):
+    """Return a shallow copy of a validated model, without validating it again."""
+    copied = model.__class__.__new__(model.__class__)
+    copied.__dict__.update(model.__dict__)
+    return copied
@@ -20,6 +20,8 @@ class TranspileConfigSchema(BaseSchema):
     # None
 
     # Optional properties.
+    num_seeds = Integer(validate=Range(min=1))
+    optimization_level = Integer(validate=Range(min=0, max=3))
 
 
 class RunConfigSchema(BaseSchema):
@@ -32,6 +32,9 @@ def transpile(circuits, transpile_config=None):
     basis_gates = getattr(transpile_config, 'basis_gates', None)
     coupling_map = getattr(transpile_config, 'coupling_map', None)
     seed_mapper = getattr(transpile_config, 'seed_mapper', None)
+    num_seeds = getattr(transpile_config, 'num_seeds', None)
+    cost_function = getattr(transpile_config, 'cost_function', None)
+    optimization_level = getattr(transpile_config, 'optimization_level', None)
 
     if initial_layout is not None and not isinstance(initial_layout, Layout):
         initial_layout = Layout(initial_layout)
@@ -39,7 +42,8 @@ def transpile(circuits, transpile_config=None):
     pass_manager = None
     backend = getattr(transpile_config, 'backend', None)
     new_circuits = transpiler.transpile(circuits, backend, basis_gates, coupling_map,
-                                        initial_layout, seed_mapper, pass_manager)
+                                        initial_layout, seed_mapper, pass_manager,
+                                        num_seeds, cost_function, optimization_level)
     # ---------
 
     # THE IDEAL CODE HERE WILL BE.
@@ -206,6 +206,10 @@ class AstInterpreter:
         self._process_node(node.children[2])
         self.condition = None
 
+    def process_statement(self, node):
+        """Carry out the action associated with a top-level statement node."""
+        self._process_node(node)
+
     def _process_children(self, node):
         """Call process_node for all children of node."""
         for kid in node.children:
@@ -255,7 +259,8 @@ class AstInterpreter:
             args = self._process_node(node.children[0])
             qid = self._process_bit_id(node.children[1])
             for element in qid:
-                self.dag.apply_operation_back(UBase(*args, element), self.condition)
+                self.dag.apply_operation_back(UBase(*[arg.sym() for arg in args]),
+                                              [element], [], self.condition)
 
         elif node.type == "cnot":
             self._process_cnot(node)
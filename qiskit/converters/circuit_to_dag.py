@@ -35,7 +35,8 @@ def circuit_to_dag(circuit):
         else:
             control = (instruction.control[0], instruction.control[1])
 
-        instruction = copy.deepcopy(instruction)
+        # parameterless gates such as h and cx are shared instead of copied
+        instruction = instruction.flyweight() or copy.deepcopy(instruction)
         dagcircuit.apply_operation_back(instruction, qargs, cargs, control)
 
     return dagcircuit
@@ -50,8 +50,11 @@ def dag_to_circuit(dag):
         else:
             control = (node.condition[0], node.condition[1])
 
-        inst = copy.deepcopy(node.op)
-        inst.control = control
+        # parameterless gates such as h and cx are shared instead of copied
+        inst = node.op.flyweight() if control is None else None
+        if inst is None:
+            inst = copy.deepcopy(node.op)
+            inst.control = control
         circuit.append(inst, qubits, clbits)
 
     return circuit
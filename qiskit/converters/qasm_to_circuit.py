@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+OpenQASM to QuantumCircuit converter.
+
+Interprets each statement of an OpenQASM program as soon as it is parsed,
+appending the instructions directly to a ``QuantumCircuit``, without keeping
+the AST of the whole program or building a ``DAGCircuit``.
+"""
+from collections import OrderedDict
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.converters.ast_to_dag import AstInterpreter
+
+
+def qasm_to_circuit(qasm):
+    """Build a ``QuantumCircuit`` object from a ``Qasm`` object.
+
+    Args:
+        qasm (Qasm): the OpenQASM program.
+
+    Return:
+        QuantumCircuit: the circuit representing the OpenQASM program.
+
+    Raises:
+        QasmError: if the program could not be parsed.
+        QiskitError: if the program is malformed.
+    """
+    circuit = QuantumCircuit()
+    interpreter = AstInterpreter(_CircuitBuilder(circuit))
+    qasm.parse(statement_callback=interpreter.process_statement)
+
+    return circuit
+
+
+class _CircuitBuilder:
+    """Append the operations of an ``AstInterpreter`` to a ``QuantumCircuit``.
+
+    Provides the subset of the ``DAGCircuit`` interface used by the
+    interpreter.
+    """
+
+    def __init__(self, circuit):
+        self.circuit = circuit
+        self.qregs = OrderedDict()
+        self.cregs = OrderedDict()
+
+    def add_qreg(self, qreg):
+        """Add a quantum register to the circuit."""
+        self.circuit.add_register(qreg)
+        self.qregs[qreg.name] = qreg
+
+    def add_creg(self, creg):
+        """Add a classical register to the circuit."""
+        self.circuit.add_register(creg)
+        self.cregs[creg.name] = creg
+
+    def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
+        """Append an operation to the circuit."""
+        if condition is None:
+            # share the instances of parameterless gates such as h and cx
+            op = op.flyweight() or op
+        else:
+            op.control = condition
+        self.circuit.append(op, qargs, cargs)
@@ -25,6 +25,7 @@ import networkx as nx
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
 from qiskit.circuit.gate import Gate
+from qiskit.circuit.fingerprint import circuit_fingerprint
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
 
@@ -739,6 +740,19 @@ class DAGCircuit:
         return full_pred_map, full_succ_map
 
     def __eq__(self, other):
+        if not isinstance(other, DAGCircuit):
+            return False
+        # different fingerprints prove the dags differ, but equal ones can be
+        # a hash collision, so equality is decided on the ops
+        if self.fingerprint(params=False) != other.fingerprint(params=False):
+            return False
+        if set(self.wires) == set(other.wires):
+            nodes = list(self.topological_op_nodes())
+            other_nodes = list(other.topological_op_nodes())
+            if len(nodes) == len(other_nodes) and \
+                    all(map(DAGNode.semantic_eq, nodes, other_nodes)):
+                return True
+
         # TODO this works but is a horrible way to do this
         slf = copy.deepcopy(self.multi_graph)
         oth = copy.deepcopy(other.multi_graph)
@@ -751,6 +765,26 @@ class DAGCircuit:
         return nx.is_isomorphic(slf, oth,
                                 node_match=lambda x, y: DAGNode.semantic_eq(x['node'], y['node']))
 
+    def fingerprint(self, params=True):
+        """Return a fingerprint of the structure of the dag.
+
+        Equal dags have equal fingerprints, and different dags have different
+        fingerprints except for hash collisions. The fingerprint of a dag is
+        the same as the one of the equivalent ``QuantumCircuit``.
+
+        Args:
+            params (bool): if False, the parameters of the operations are
+                left out of the fingerprint.
+
+        Returns:
+            int: the fingerprint of the dag.
+        """
+        return circuit_fingerprint(
+            self.wires,
+            ((node.op, node.qargs, node.cargs, node.condition)
+             for node in nx.topological_sort(self.multi_graph) if node.type == 'op'),
+            params)
+
     def topological_nodes(self):
         """
         Yield nodes in topological order.
@@ -799,12 +833,14 @@ class DAGCircuit:
             to_replay = []
             for sorted_node in nx.topological_sort(input_dag.multi_graph):
                 if sorted_node.type == "op":
-                    sorted_node.op.control = condition
-                    to_replay.append(sorted_node)
+                    # the op can be a shared instance
+                    op = copy.copy(sorted_node.op)
+                    op.control = condition
+                    to_replay.append((op, sorted_node))
             for input_node in input_dag.op_nodes():
                 input_dag.remove_op_node(input_node)
-            for replay_node in to_replay:
-                input_dag.apply_operation_back(replay_node.op, replay_node.qargs,
+            for op, replay_node in to_replay:
+                input_dag.apply_operation_back(op, replay_node.qargs,
                                                replay_node.cargs, condition=condition)
 
         if wires is None:
@@ -891,6 +927,31 @@ class DAGCircuit:
 
                 self.multi_graph.remove_edge(p[0], self.output_map[w])
 
+    def substitute_node(self, node, op):
+        """Replace the operation of a node, in place, with an operation on the
+        same number of qubits and clbits.
+
+        Unlike substitute_node_with_dag, the node and its edges are kept.
+
+        Args:
+            node (DAGNode): op node to substitute
+            op (Instruction): the operation that will substitute the one of the node
+
+        Raises:
+            DAGCircuitError: if the node is not an op node, or if the operation
+                does not have the same number of qubits and clbits as the node.
+        """
+        if node.type != 'op':
+            raise DAGCircuitError('Only op nodes can be substituted, got a "%s" node.'
+                                  % node.type)
+        if op.num_qubits != len(node.qargs) or op.num_clbits != len(node.cargs):
+            raise DAGCircuitError('Cannot substitute the operation %s on %d qubits and %d '
+                                  'clbits for %s on %d qubits and %d clbits.'
+                                  % (op.name, op.num_qubits, op.num_clbits, node.name,
+                                     len(node.qargs), len(node.cargs)))
+        node.data_dict['op'] = op
+        node.name = op.name
+
     def node(self, node_id):
         """Get the node in the dag.
 
@@ -29,7 +29,7 @@ logger = logging.getLogger(__name__)
 def execute(circuits, backend, qobj_header=None, config=None, basis_gates=None,
             coupling_map=None, initial_layout=None, shots=1024, max_credits=10,
             seed=None, qobj_id=None, seed_mapper=None, pass_manager=None,
-            memory=False, **kwargs):
+            memory=False, optimization_level=None, **kwargs):
     """Executes a set of circuits.
 
     Args:
@@ -48,6 +48,8 @@ def execute(circuits, backend, qobj_header=None, config=None, basis_gates=None,
         qobj_id (int): identifier for the generated qobj
         pass_manager (PassManager): a pass manger for the transpiler pipeline
         memory (bool): if True, per-shot measurement bitstrings are returned as well.
+        optimization_level (int): how much to simplify the circuits, from 0, the
+            fastest transpilation, to 3, the most simplified circuits. Default: 2
         kwargs: extra arguments used by AER for running configurable backends.
                 Refer to the backend documentation for details on these arguments
 
@@ -70,6 +72,8 @@ def execute(circuits, backend, qobj_header=None, config=None, basis_gates=None,
         transpile_config.initial_layout = initial_layout
     if seed_mapper:
         transpile_config.seed_mapper = seed_mapper
+    if optimization_level is not None:
+        transpile_config.optimization_level = optimization_level
     if shots:
         run_config.shots = shots
     if max_credits:
@@ -122,8 +126,9 @@ def execute_circuits(circuits, backend, qobj_header=None,
         # required by by the backend.
         run_config = RunConfig(shots=1024, max_credits=10, memory=False)
 
-    # transpiling the circuits using the transpiler_config
-    new_circuits = transpile(circuits, transpile_config=transpile_config)
+    # transpiling the circuits using the transpiler_config, once for each
+    # group of identical circuits
+    new_circuits = _transpile_unique(circuits, transpile_config)
 
     # assembling the circuits into a qobj to be run on the backend
     qobj = assemble_circuits(new_circuits, qobj_header=qobj_header,
@@ -131,3 +136,50 @@ def execute_circuits(circuits, backend, qobj_header=None,
 
     # executing the circuits on the backend and returning the job
     return backend.run(qobj, **kwargs)
+
+
+def _transpile_unique(circuits, transpile_config):
+    """Transpile circuits, transpiling identical circuits only once.
+
+    Args:
+        circuits (QuantumCircuit or list[QuantumCircuit]): circuits to transpile
+        transpile_config (TranspileConfig): configuration for the transpiler
+
+    Returns:
+        QuantumCircuit or list[QuantumCircuit]: the transpiled circuits, with
+            the names of the input circuits
+    """
+    if not isinstance(circuits, list):
+        return transpile(circuits, transpile_config=transpile_config)
+
+    # index in unique_circuits of each circuit
+    unique_indices = []
+    unique_circuits = []
+    candidates = {}
+    for circuit in circuits:
+        group = candidates.setdefault(circuit.fingerprint(), [])
+        for unique_index in group:
+            if unique_circuits[unique_index] == circuit:
+                break
+        else:
+            unique_index = len(unique_circuits)
+            unique_circuits.append(circuit)
+            group.append(unique_index)
+        unique_indices.append(unique_index)
+
+    if len(unique_circuits) == len(circuits):
+        return transpile(circuits, transpile_config=transpile_config)
+
+    logger.info('Transpiling %d unique circuits out of %d.',
+                len(unique_circuits), len(circuits))
+    transpiled = transpile(unique_circuits, transpile_config=transpile_config)
+
+    new_circuits = []
+    used = set()
+    for circuit, unique_index in zip(circuits, unique_indices):
+        new_circuit = transpiled[unique_index]
+        if unique_index in used or new_circuit.name != circuit.name:
+            new_circuit = new_circuit.copy(name=circuit.name)
+        used.add(unique_index)
+        new_circuits.append(new_circuit)
+    return new_circuits
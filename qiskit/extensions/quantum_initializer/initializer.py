@@ -9,9 +9,10 @@
 Initialize qubit registers to desired arbitrary state.
 """
 
+import functools
 import math
+
 import numpy as np
-import scipy
 
 from qiskit.exceptions import QiskitError
 from qiskit.circuit import QuantumCircuit
@@ -32,6 +33,9 @@ class InitializeGate(Gate):  # pylint: disable=abstract-method
     flexible collection of qubit registers (assuming the qubits are in the
     zero state).
     """
+
+    __slots__ = ()
+
     def __init__(self, params):
         """Create new initialize composite gate.
 
@@ -119,64 +123,56 @@ class InitializeGate(Gate):  # pylint: disable=abstract-method
                                     .
                                         .
           0         0           Ry(theta_2^n).Rz(phi_2^n)]]
-        """
-        remaining_vector = []
-        thetas = []
-        phis = []
-
-        param_len = len(local_param)
 
-        for i in range(param_len // 2):
-            # Ry and Rz rotations to move bloch vector from 0 to "imaginary"
-            # qubit
-            # (imagine a qubit state signified by the amplitudes at index 2*i
-            # and 2*(i+1), corresponding to the select qubits of the
-            # multiplexor being in state |i>)
-            (remains,
-             add_theta,
-             add_phi) = InitializeGate._bloch_angles(
-                 local_param[2*i: 2*(i + 1)])
-
-            remaining_vector.append(remains)
-
-            # rotations for all imaginary qubits of the full vector
-            # to move from where it is to zero, hence the negative sign
-            thetas.append(-add_theta)
-            phis.append(-add_phi)
+        The angles of all the imaginary qubits (the pairs of amplitudes at
+        index 2*i and 2*i+1, corresponding to the select qubits of the
+        multiplexor being in state |i>) are computed at once.
+        """
+        pairs = np.asarray(local_param, dtype=complex).reshape(-1, 2)
+        remaining_vector, add_thetas, add_phis = InitializeGate._bloch_angles(pairs.T)
 
-        return remaining_vector, thetas, phis
+        # rotations for all imaginary qubits of the full vector
+        # to move from where it is to zero, hence the negative sign
+        # (adding 0. turns the -0. of zero rotations into 0.)
+        return remaining_vector, (0. - add_thetas).tolist(), (0. - add_phis).tolist()
 
     @staticmethod
     def _bloch_angles(pair_of_complex):
         """
         Static internal method to work out rotation to create the passed in
         qubit from the zero vector.
+
+        The amplitudes can be arrays, to work out the rotations of several
+        qubits at once.
         """
         [a_complex, b_complex] = pair_of_complex
         # Force a and b to be complex, as otherwise numpy.angle might fail.
-        a_complex = complex(a_complex)
-        b_complex = complex(b_complex)
+        a_complex = np.asarray(a_complex, dtype=complex)
+        b_complex = np.asarray(b_complex, dtype=complex)
         mag_a = np.absolute(a_complex)
-        final_r = float(np.sqrt(mag_a ** 2 + np.absolute(b_complex) ** 2))
-        if final_r < _EPS:
-            theta = 0
-            phi = 0
-            final_r = 0
-            final_t = 0
-        else:
-            theta = float(2 * np.arccos(mag_a / final_r))
-            a_arg = np.angle(a_complex)
-            b_arg = np.angle(b_complex)
-            final_t = a_arg + b_arg
-            phi = b_arg - a_arg
+        final_r = np.sqrt(mag_a ** 2 + np.absolute(b_complex) ** 2)
+        is_zero = final_r < _EPS
+        # avoid dividing by zero, the angles of zero vectors are zero
+        safe_r = np.where(is_zero, 1., final_r)
+        theta = np.where(is_zero, 0., 2 * np.arccos(np.minimum(mag_a / safe_r, 1.)))
+        a_arg = np.angle(a_complex)
+        b_arg = np.angle(b_complex)
+        final_t = np.where(is_zero, 0., a_arg + b_arg)
+        phi = np.where(is_zero, 0., b_arg - a_arg)
+        final_r = np.where(is_zero, 0., final_r)
 
         return final_r * np.exp(1.J * final_t/2), theta, phi
 
     def _multiplex(self, target_gate, list_of_angles):
         """
-        Return a recursive implementation of a multiplexor circuit,
-        where each instruction itself has a decomposition based on
-        smaller multiplexors.
+        Return an implementation of a multiplexor circuit.
+
+        The multiplexor is defined recursively: a multiplexor over k select
+        qubits is a multiplexor over k-1 select qubits, a CNOT, the mirrored
+        second multiplexor over k-1 select qubits (which cancels the adjacent
+        CNOTs) and a final CNOT. The recursion is flattened into a sequence of
+        rotations and CNOTs, and the angles of all the multiplexors of a level
+        of the recursion are computed at once.
 
         The LSB is the multiplexor "data" and the other bits are multiplexor "select".
 
@@ -186,7 +182,7 @@ class InitializeGate(Gate):  # pylint: disable=abstract-method
             list_of_angles (list[float]): list of rotation angles to apply Ry and Rz
 
         Returns:
-            DAGCircuit: the circuit implementing the multiplexor's action
+            QuantumCircuit: the circuit implementing the multiplexor's action
         """
         list_len = len(list_of_angles)
         local_num_qubits = int(math.log2(list_len)) + 1
@@ -195,41 +191,43 @@ class InitializeGate(Gate):  # pylint: disable=abstract-method
         circuit = QuantumCircuit(q, name="multiplex"+local_num_qubits.__str__())
 
         lsb = q[0]
-        msb = q[local_num_qubits - 1]
-
-        # case of no multiplexing: base case for recursion
-        if local_num_qubits == 1:
-            circuit.append(target_gate(list_of_angles[0]), [q[0]])
-            return circuit
-
-        # calc angle weights, assuming recursion (that is the lower-level
-        # requested angles have been correctly implemented by recursion
-        angle_weight = scipy.kron([[0.5, 0.5], [0.5, -0.5]],
-                                  np.identity(2 ** (local_num_qubits - 2)))
-
-        # calc the combo angles
-        list_of_angles = angle_weight.dot(np.array(list_of_angles)).tolist()
 
-        # recursive step on half the angles fulfilling the above assumption
-        multiplex_1 = self._multiplex(target_gate, list_of_angles[0:(list_len // 2)])
-        circuit.append(multiplex_1.to_instruction(), q[0:-1])
-
-        # attach CNOT as follows, thereby flipping the LSB qubit
-        circuit.append(CnotGate(), [msb, lsb])
+        # calc the combo angles of each level, assuming recursion (that is the
+        # lower-level requested angles have been correctly implemented by
+        # recursion), by applying kron([[0.5, 0.5], [0.5, -0.5]], identity) to
+        # the angles of each multiplexor of the level
+        angles = np.asarray(list_of_angles, dtype=float)
+        length = list_len
+        while length > 1:
+            halves = angles.reshape(-1, 2, length // 2)
+            angles = np.concatenate((halves[:, 0] + halves[:, 1],
+                                     halves[:, 0] - halves[:, 1]), axis=1).reshape(-1) / 2
+            length //= 2
+        angles = angles.tolist()
+
+        # the operations are checked once, by construction
+        circuit.data = [(target_gate(angles[step]), [lsb], []) if step >= 0
+                        else (CnotGate(), [q[-step], lsb], [])
+                        for step in _multiplexor_steps(list_len)]
+        return circuit
 
-        # implement extra efficiency from the paper of cancelling adjacent
-        # CNOTs (by leaving out last CNOT and reversing (NOT inverting) the
-        # second lower-level multiplex)
-        multiplex_2 = self._multiplex(target_gate, list_of_angles[(list_len // 2):])
-        if list_len > 1:
-            circuit.append(multiplex_2.to_instruction().mirror(), q[0:-1])
-        else:
-            circuit.append(multiplex_2.to_instruction(), q[0:-1])
 
-        # attach a final CNOT
-        circuit.append(CnotGate(), [msb, lsb])
+@functools.lru_cache(maxsize=32)
+def _multiplexor_steps(num_angles):
+    """Return the steps of a multiplexor of ``num_angles`` angles.
 
-        return circuit
+    A step ``i >= 0`` is the rotation of the LSB by the combo angle ``i``, and a
+    step ``-k`` is a CNOT from the select qubit ``k`` to the LSB. Mirroring a
+    multiplexor reverses its steps.
+    """
+    if num_angles == 1:
+        return (0,)
+    half = num_angles // 2
+    msb = int(math.log2(num_angles))
+    first = _multiplexor_steps(half)
+    second = tuple(step + half if step >= 0 else step
+                   for step in reversed(_multiplexor_steps(half)))
+    return first + (-msb,) + second + (-msb,)
 
 
 def initialize(self, params, qubits):
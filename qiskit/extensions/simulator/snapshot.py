@@ -18,6 +18,8 @@ from qiskit.extensions.exceptions import ExtensionError
 class Snapshot(Instruction):
     """Simulator snapshot instruction."""
 
+    __slots__ = ()
+
     def __init__(self, num_qubits, num_clbits, label, snap_type):
         """Create new snapshot instruction."""
         super().__init__("snapshot", num_qubits, num_clbits, [label, snap_type])
@@ -17,6 +17,8 @@ from qiskit.circuit import Instruction
 class Barrier(Instruction):
     """Barrier instruction."""
 
+    __slots__ = ()
+
     def __init__(self, num_qubits):
         """Create new barrier instruction."""
         super().__init__("barrier", num_qubits, 0, [])
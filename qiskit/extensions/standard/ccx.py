@@ -22,6 +22,8 @@ from qiskit.extensions.standard.t import TdgGate
 class ToffoliGate(Gate):
     """Toffoli gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Toffoli gate."""
         super().__init__("ccx", 3, [])
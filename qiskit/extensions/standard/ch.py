@@ -26,6 +26,8 @@ from qiskit.extensions.standard.s import SdgGate
 class CHGate(Gate):
     """controlled-H gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new CH gate."""
         super().__init__("ch", 2, [])
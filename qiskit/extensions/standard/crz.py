@@ -20,6 +20,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class CrzGate(Gate):
     """controlled-rz gate."""
 
+    __slots__ = ()
+
     def __init__(self, theta):
         """Create new crz gate."""
         super().__init__("crz", 2, [theta])
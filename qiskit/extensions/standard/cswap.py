@@ -20,6 +20,8 @@ from qiskit.extensions.standard.ccx import ToffoliGate
 class FredkinGate(Gate):
     """Fredkin gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Fredkin gate."""
         super().__init__("cswap", 3, [])
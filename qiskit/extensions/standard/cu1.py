@@ -20,6 +20,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class Cu1Gate(Gate):
     """controlled-u1 gate."""
 
+    __slots__ = ()
+
     def __init__(self, theta):
         """Create new cu1 gate."""
         super().__init__("cu1", 2, [theta])
@@ -21,6 +21,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class Cu3Gate(Gate):
     """controlled-u3 gate."""
 
+    __slots__ = ()
+
     def __init__(self, theta, phi, lam):
         """Create new cu3 gate."""
         super().__init__("cu3", 2, [theta, phi, lam])
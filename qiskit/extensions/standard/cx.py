@@ -21,6 +21,8 @@ from qiskit.extensions.standard.cxbase import CXBase
 class CnotGate(Gate):
     """controlled-NOT gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new CNOT gate."""
         super().__init__("cx", 2, [])
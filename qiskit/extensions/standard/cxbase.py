@@ -17,6 +17,8 @@ from qiskit.circuit.decorators import _op_expand
 class CXBase(Gate):  # pylint: disable=abstract-method
     """Fundamental controlled-NOT gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new CX instruction."""
         super().__init__("CX", 2, [])
@@ -23,6 +23,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class CyGate(Gate):
     """controlled-Y gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new CY gate."""
         super().__init__("cy", 2, [])
@@ -22,6 +22,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class CzGate(Gate):
     """controlled-Z gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new CZ gate."""
         super().__init__("cz", 2, [])
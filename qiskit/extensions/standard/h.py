@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u2 import U2Gate
 class HGate(Gate):
     """Hadamard gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Hadamard gate."""
         super().__init__("h", 1, [])
@@ -21,6 +21,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class IdGate(Gate):
     """Identity gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Identity gate."""
         super().__init__("id", 1, [])
@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class RXGate(Gate):
     """rotation around the x-axis."""
 
+    __slots__ = ()
+
     def __init__(self, theta):
         """Create new rx single qubit gate."""
         super().__init__("rx", 1, [theta])
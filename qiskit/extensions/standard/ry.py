@@ -21,6 +21,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class RYGate(Gate):
     """rotation around the y-axis."""
 
+    __slots__ = ()
+
     def __init__(self, theta):
         """Create new ry single qubit gate."""
         super().__init__("ry", 1, [theta])
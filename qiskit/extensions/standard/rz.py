@@ -21,6 +21,8 @@ from qiskit.extensions.standard.u1 import U1Gate
 class RZGate(Gate):
     """rotation around the z-axis."""
 
+    __slots__ = ()
+
     def __init__(self, phi):
         """Create new rz single qubit gate."""
         super().__init__("rz", 1, [phi])
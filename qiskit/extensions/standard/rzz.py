@@ -20,6 +20,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class RZZGate(Gate):
     """Two-qubit ZZ-rotation gate."""
 
+    __slots__ = ()
+
     def __init__(self, theta):
         """Create new rzz gate."""
         super().__init__("rzz", 2, [theta])
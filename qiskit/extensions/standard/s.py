@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u1 import U1Gate
 class SGate(Gate):
     """S=diag(1,i) Clifford phase gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new S gate."""
         super().__init__("s", 1, [])
@@ -47,6 +49,8 @@ class SGate(Gate):
 class SdgGate(Gate):
     """Sdg=diag(1,-i) Clifford adjoint phase gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Sdg gate."""
         super().__init__("sdg", 1, [])
@@ -21,6 +21,8 @@ from qiskit.extensions.standard.cx import CnotGate
 class SwapGate(Gate):
     """SWAP gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new SWAP gate."""
         super().__init__("swap", 2, [])
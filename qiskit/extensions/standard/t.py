@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u1 import U1Gate
 class TGate(Gate):
     """T Gate: pi/4 rotation around Z axis."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new T gate."""
         super().__init__("t", 1, [])
@@ -47,6 +49,8 @@ class TGate(Gate):
 class TdgGate(Gate):
     """T Gate: -pi/4 rotation around Z axis."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Tdg gate."""
         super().__init__("tdg", 1, [])
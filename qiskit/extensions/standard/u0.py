@@ -21,6 +21,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class U0Gate(Gate):
     """Wait gate."""
 
+    __slots__ = ()
+
     def __init__(self, m):
         """Create new u0 gate."""
         super().__init__("u0", 1, [m])
@@ -21,6 +21,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class U1Gate(Gate):
     """Diagonal single-qubit gate."""
 
+    __slots__ = ()
+
     def __init__(self, theta):
         """Create new diagonal single-qubit gate."""
         super().__init__("u1", 1, [theta])
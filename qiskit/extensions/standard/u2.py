@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class U2Gate(Gate):
     """One-pulse single-qubit gate."""
 
+    __slots__ = ()
+
     def __init__(self, phi, lam):
         """Create new one-pulse single-qubit gate."""
         super().__init__("u2", 1, [phi, lam])
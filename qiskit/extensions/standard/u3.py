@@ -21,6 +21,8 @@ from qiskit.extensions.standard.ubase import UBase
 class U3Gate(Gate):
     """Two-pulse single-qubit gate."""
 
+    __slots__ = ()
+
     def __init__(self, theta, phi, lam):
         """Create new two-pulse single qubit gate."""
         super().__init__("u3", 1, [theta, phi, lam])
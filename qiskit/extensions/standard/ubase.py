@@ -19,6 +19,8 @@ from qiskit.circuit.decorators import _op_expand
 class UBase(Gate):  # pylint: disable=abstract-method
     """Element of SU(2)."""
 
+    __slots__ = ()
+
     def __init__(self, theta, phi, lam):
         super().__init__("U", 1, [theta, phi, lam])
 
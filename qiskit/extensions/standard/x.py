@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class XGate(Gate):
     """Pauli X (bit-flip) gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new X gate."""
         super().__init__("x", 1, [])
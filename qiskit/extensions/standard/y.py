@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u3 import U3Gate
 class YGate(Gate):
     """Pauli Y (bit-phase-flip) gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Y gate."""
         super().__init__("y", 1, [])
@@ -22,6 +22,8 @@ from qiskit.extensions.standard.u1 import U1Gate
 class ZGate(Gate):
     """Pauli Z (phase-flip) gate."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Create new Z gate."""
         super().__init__("z", 1, [])
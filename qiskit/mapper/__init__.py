@@ -11,3 +11,4 @@ from .compiling import two_qubit_kak, euler_angles_1q
 from .coupling import CouplingMap
 from .layout import Layout
 from .exceptions import CouplingError, LayoutError
+from .error_distance import ErrorDistance
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Error-weighted distances between physical qubits, from calibration data.
+
+The reliability of a CNOT between two physical qubits is the reliability of the
+most reliable way to execute it: directly, if the qubits are coupled, or else
+after swapping the first qubit next to the second one, along the path of swaps
+with the smallest error. The error distance is minus the logarithm of this
+reliability, so that the error distances of independent gates add up.
+
+The readout errors are collected along with the cx errors, but are not part of
+the distances: a qubit is read out once, where it ends up, whatever the swaps
+that brought it next to the qubits it interacts with. They are for the layout
+passes, such as NoiseAdaptiveLayout, that choose where the qubits are placed.
+
+The distances are computed once per snapshot of the backend properties, and are
+shared by the mapping passes, such as NoiseAdaptiveLayout for choosing a layout
+and the swap mappers for choosing the swaps.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+
+class ErrorDistance:
+    """
+    Error-weighted distances between the physical qubits of a backend.
+
+    Attributes:
+        cx_reliability (dict): one minus the error of the cx gate on each pair
+            of physical qubits, in the order of the backend properties.
+        readout_reliability (dict): one minus the readout error of each
+            physical qubit. It does not weigh the distances.
+        coupled_qubits (list): physical qubits of the cx gates, in the order of
+            their first cx gate.
+        reliability (ndarray): reliability of the most reliable cx gate between
+            two physical qubits, after swapping the first one next to the second.
+        distance (ndarray): symmetric error distance between two physical
+            qubits, infinite if they are not connected.
+
+    The instances returned by `from_backend_properties` are shared, and should
+    not be modified.
+    """
+
+    def __init__(self, cx_reliability, readout_reliability):
+        """
+        Compute the error distances from the gate reliabilities.
+
+        Args:
+            cx_reliability (dict): one minus the error of the cx gate, keyed by
+                pairs of physical qubits.
+            readout_reliability (dict): one minus the readout error, keyed by
+                physical qubit.
+        """
+        self.cx_reliability = cx_reliability
+        self.readout_reliability = readout_reliability
+        self.coupled_qubits = list(dict.fromkeys(qubit for edge in cx_reliability
+                                                 for qubit in edge))
+        size = 1 + max(self.coupled_qubits + list(readout_reliability), default=-1)
+
+        # swap error of the edges, and cx reliability in any direction,
+        # preferring the given direction when both are calibrated
+        swap_error = np.full((size, size), np.inf)
+        np.fill_diagonal(swap_error, 0)
+        cx_matrix = np.zeros((size, size))
+        coupled = np.zeros((size, size), dtype=bool)
+        for (qubit0, qubit1), reliability in cx_reliability.items():
+            swap_error[qubit0, qubit1] = swap_error[qubit1, qubit0] = \
+                -math.log(pow(reliability, 3))
+            cx_matrix[qubit0, qubit1] = reliability
+            if (qubit1, qubit0) not in cx_reliability:
+                cx_matrix[qubit1, qubit0] = reliability
+            coupled[qubit0, qubit1] = coupled[qubit1, qubit0] = True
+
+        # Floyd-Warshall, through the qubits in the same order as networkx
+        for qubit in self.coupled_qubits:
+            np.minimum(swap_error, swap_error[:, qubit, None] + swap_error[None, qubit, :],
+                       out=swap_error)
+
+        swap_reliability = np.exp(-swap_error)
+        self.reliability = np.zeros((size, size))
+        for qubit in self.coupled_qubits:
+            np.maximum(self.reliability, np.outer(swap_reliability[:, qubit], cx_matrix[qubit]),
+                       out=self.reliability)
+        self.reliability[coupled] = cx_matrix[coupled]
+
+        with np.errstate(divide='ignore'):
+            self.distance = -np.log(self.reliability)
+        np.minimum(self.distance, self.distance.T, out=self.distance)
+        np.fill_diagonal(self.distance, 0)
+
+    @classmethod
+    def from_backend_properties(cls, backend_prop):
+        """
+        Return the error distances of the calibration data of a backend.
+
+        The distances are cached, and computed again only if the cx or readout
+        errors of the backend properties change.
+
+        Args:
+            backend_prop (BackendProperties): backend properties object
+
+        Returns:
+            ErrorDistance: the shared error distances of the backend.
+        """
+        cx_reliability = []
+        for ginfo in backend_prop.gates:
+            if ginfo.gate == 'cx':
+                reliability = 1.0
+                for item in ginfo.parameters:
+                    if item.name == 'gate_error':
+                        reliability = 1.0 - item.value
+                        break
+                cx_reliability.append(((ginfo.qubits[0], ginfo.qubits[1]), reliability))
+        readout_reliability = []
+        for idx, qubit in enumerate(backend_prop.qubits):
+            for nduv in qubit:
+                if nduv.name == 'readout_error':
+                    readout_reliability.append((idx, 1.0 - nduv.value))
+        return _error_distance(cls, tuple(cx_reliability), tuple(readout_reliability))
+
+    def routing_cost(self, coupling_map):
+        """
+        Return a cost matrix for routing on a coupling map.
+
+        The cost is the distance in the coupling map, plus the error distance
+        scaled below one, so that among the paths of the same length, the swap
+        mappers prefer the most reliable ones. As the distances, it does not
+        depend on the readout errors.
+
+        Args:
+            coupling_map (CouplingMap): Directed graph representing a coupling
+                map, with the physical qubits of the backend.
+
+        Returns:
+            ndarray: the routing cost between two physical qubits.
+        """
+        if coupling_map._dist_matrix is None:
+            coupling_map._compute_distance_matrix()
+        hops = coupling_map._dist_matrix
+        errors = np.zeros(hops.shape)
+        common = min(hops.shape[0], self.distance.shape[0])
+        errors[:common, :common] = self.distance[:common, :common]
+        infinite = errors == np.inf
+        largest = errors[~infinite].max()
+        errors[infinite] = largest
+        return hops + errors / (1 + largest)
+
+
+# number of error distances cached, for distinct calibrations
+_ERROR_DISTANCE_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=_ERROR_DISTANCE_CACHE_SIZE)
+def _error_distance(cls, cx_reliability, readout_reliability):
+    """Return the error distances of the reliabilities, given as tuples of
+    (key, reliability) pairs."""
+    return cls(dict(cx_reliability), dict(readout_reliability))
@@ -38,12 +38,21 @@ class Qasm:
         with QasmParser(self._filename) as qasm_p:
             return qasm_p.get_tokens()
 
-    def parse(self):
-        """Parse the data."""
+    def parse(self, statement_callback=None):
+        """Parse the data.
+
+        Args:
+            statement_callback (callable): if given, it is called with the
+                node of each top-level statement as soon as it is parsed,
+                instead of keeping the statements in the returned AST.
+
+        Returns:
+            Program: the root node of the AST.
+        """
         if self._filename:
             with open(self._filename) as ifile:
                 self._data = ifile.read()
 
         with QasmParser(self._filename) as qasm_p:
             qasm_p.parse_debug(False)
-            return qasm_p.parse(self._data)
+            return qasm_p.parse(self._data, statement_callback=statement_callback)
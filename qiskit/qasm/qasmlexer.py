@@ -13,6 +13,7 @@ by creating a stack of lexers.
 """
 
 import os
+import sys
 
 import ply.lex as lex
 from sympy import Number
@@ -99,7 +100,16 @@ class QasmLexer:
 
     def t_REAL(self, t):
         r'(([0-9]+|([0-9]+)?\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+)|(([0-9]+)?\.[0-9]+|[0-9]+\.)'
-        t.value = Number(t.value)
+        # Parsing the string with sympy is slow, so go through float when it
+        # does not lose precision (sympy uses 15 digits for shorter strings),
+        # that is when the value is also in the range of the normal floats.
+        digits = t.value.lower().split('e')[0].replace('.', '').lstrip('0')
+        value = float(t.value)
+        if len(digits) <= 15 and \
+                (not digits or sys.float_info.min <= abs(value) <= sys.float_info.max):
+            t.value = Number(value)
+        else:
+            t.value = Number(t.value)
         # tad nasty, see mkfloat.py to see how this is derived from python spec
         return t
 
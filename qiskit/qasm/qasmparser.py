@@ -7,9 +7,8 @@
 
 """OpenQASM parser."""
 
-import os
-import shutil
-import tempfile
+import collections
+import copy
 
 import ply.yacc as yacc
 import sympy
@@ -18,27 +17,31 @@ from . import node
 from .exceptions import QasmError
 from .qasmlexer import QasmLexer
 
+# LALR tables of a PLY parser, that can be bound to the rules of other parsers.
+_ParseTables = collections.namedtuple('_ParseTables', ['productions', 'action', 'goto'])
+
 
 class QasmParser:
     """OPENQASM Parser."""
 
     # pylint: disable=unused-argument,missing-docstring,invalid-name
 
+    # LALR tables, generated once and shared by all the parsers.
+    _parse_tables = None
+
     def __init__(self, filename):
         """Create the parser."""
         if filename is None:
             filename = ""
         self.lexer = QasmLexer(filename)
         self.tokens = self.lexer.tokens
-        self.parse_dir = tempfile.mkdtemp(prefix='qiskit')
         self.precedence = (
             ('left', '+', '-'),
             ('left', '*', '/'),
             ('left', 'negative', 'positive'),
             ('right', '^'))
-        # For yacc, also, write_tables = Bool and optimize = Bool
-        self.parser = yacc.yacc(module=self, debug=False,
-                                outputdir=self.parse_dir)
+        self.parser = self._make_parser()
+        self.statement_callback = None
         self.qasm = None
         self.parse_deb = False
         self.global_symtab = {}                          # global symtab
@@ -51,8 +54,31 @@ class QasmParser:
         return self
 
     def __exit__(self, *args):
-        if os.path.exists(self.parse_dir):
-            shutil.rmtree(self.parse_dir)
+        pass
+
+    def _make_parser(self):
+        """Create a PLY parser bound to this instance.
+
+        Generating the LALR tables is expensive, so they are generated the
+        first time a parser is created and reused afterwards, binding the
+        grammar rules to the methods of each new instance.
+        """
+        if QasmParser._parse_tables is None:
+            parser = yacc.yacc(module=self, debug=False, write_tables=False)
+            QasmParser._parse_tables = _ParseTables(parser.productions, parser.action,
+                                                    parser.goto)
+            return parser
+
+        parse_tables = QasmParser._parse_tables
+        tables = yacc.LRTable()
+        tables.lr_action = parse_tables.action
+        tables.lr_goto = parse_tables.goto
+        tables.lr_productions = [copy.copy(production)
+                                 for production in parse_tables.productions]
+        tables.bind_callables({production.func: getattr(self, production.func)
+                               for production in parse_tables.productions
+                               if production.func})
+        return yacc.LRParser(tables, self.p_error)
 
     def update_symtab(self, obj):
         """Update a node in the symbol table.
@@ -274,14 +300,22 @@ class QasmParser:
         """
            program : statement
         """
-        program[0] = node.Program([program[1]])
+        program[0] = node.Program([])
+        self._add_statement(program[0], program[1])
 
     def p_program_1(self, program):
         """
            program : program statement
         """
         program[0] = program[1]
-        program[0].add_child(program[2])
+        self._add_statement(program[0], program[2])
+
+    def _add_statement(self, program, statement):
+        """Add a statement to the program, or pass it to ``statement_callback``."""
+        if self.statement_callback is None:
+            program.add_child(statement)
+        else:
+            self.statement_callback(statement)
 
     # ----------------------------------------
     #  statement : decl
@@ -1060,9 +1094,26 @@ class QasmParser:
             raise QasmError("Illegal debug value '" + str(val)
                             + "' must be True or False.")
 
-    def parse(self, data):
-        """Parse some data."""
-        self.parser.parse(data, lexer=self.lexer, debug=self.parse_deb)
+    def parse(self, data, statement_callback=None):
+        """Parse some data.
+
+        Args:
+            data (str): the OPENQASM program.
+            statement_callback (callable): if given, it is called with the
+                node of each top-level statement as soon as it is parsed, and
+                the statements are not kept in the returned ``Program``.
+
+        Returns:
+            Program: the root node of the AST.
+
+        Raises:
+            QasmError: if the data could not be parsed.
+        """
+        self.statement_callback = statement_callback
+        try:
+            self.parser.parse(data, lexer=self.lexer, debug=self.parse_deb)
+        finally:
+            self.statement_callback = None
         if self.qasm is None:
             raise QasmError("Uncaught exception in parser; "
                             + "see previous messages for details.")
@@ -32,6 +32,10 @@ from qiskit.exceptions import QiskitError
 
 _CUTOFF_PRECISION = 1e-10
 
+# seed and number of the random combinations tried for diagonalizing M2
+_DIAGONALIZATION_SEED = 2019
+_DIAGONALIZATION_TRIALS = 100
+
 
 def euler_angles_1q(unitary_matrix):
     """Compute Euler angles for a single-qubit gate.
@@ -57,11 +61,9 @@ def euler_angles_1q(unitary_matrix):
     # U[0, 1] = -exp(-i(phi-lambda)/2) * sin(theta/2)
     # U[1, 0] = exp(i(phi-lambda)/2) * sin(theta/2)
     # U[1, 1] = exp(i(phi+lambda)/2) * cos(theta/2)
-    # Find theta
-    if abs(U[0, 0]) > _CUTOFF_PRECISION:
-        theta = 2 * math.acos(abs(U[0, 0]))
-    else:
-        theta = 2 * math.asin(abs(U[1, 0]))
+    # Find theta, with atan2 which is accurate when U[0, 0] or U[1, 0]
+    # is close to 1 in absolute value, unlike acos and asin
+    theta = 2 * math.atan2(abs(U[1, 0]), abs(U[0, 0]))
     # Find phi and lambda
     phase11 = 0.0
     phase10 = 0.0
@@ -156,18 +158,24 @@ def two_qubit_kak(unitary):
     M2 = Uprime.T.dot(Uprime)
 
     # Diagonalize M2
-    # Must use diagonalization routine which finds a real orthogonal matrix P
-    # when M2 is real.
-    D, P = la.eig(M2)
-    D = np.diag(D)
-    # If det(P) == -1 then in O(4), apply a swap to make P in SO(4)
-    if abs(la.det(P)+1) < 1e-5:
-        swap = np.array([[1, 0, 0, 0],
-                         [0, 0, 1, 0],
-                         [0, 1, 0, 0],
-                         [0, 0, 0, 1]], dtype=complex)
-        P = P.dot(swap)
-        D = swap.dot(D.dot(swap))
+    # Must use diagonalization routine which finds a real orthogonal matrix P.
+    # The real and imaginary parts of the symmetric unitary M2 commute, so a
+    # random real combination of them has the eigenvectors of M2, which eigh
+    # finds orthogonal even when eigenvalues are degenerate (e.g. for
+    # Clifford unitaries).
+    rng = np.random.RandomState(_DIAGONALIZATION_SEED)
+    for _ in range(_DIAGONALIZATION_TRIALS):
+        weight = rng.rand()
+        _, P = la.eigh(weight * M2.real + (1 - weight) * M2.imag)
+        D = np.diag(P.T.dot(M2).dot(P).diagonal())
+        if np.allclose(P.dot(D).dot(P.T), M2, atol=1e-12):
+            break
+    else:
+        raise QiskitError("two_qubit_kak: cannot diagonalize the unitary")
+    P = P.astype(complex)
+    # If det(P) == -1 then in O(4), flip an eigenvector to make P in SO(4)
+    if la.det(P).real < 0:
+        P[:, -1] = -P[:, -1]
 
     Q = np.sqrt(D)  # array from elementwise sqrt
     # Want to take square root so that Q has determinant 1
@@ -207,10 +215,13 @@ def two_qubit_kak(unitary):
                    [0, 0, -1, 0],
                    [0, 0, 0, 1]], dtype=complex)
 
-    A_real_tr = A.real.trace()
-    alpha = math.atan2(A.dot(xx).imag.trace(), A_real_tr)
-    beta = math.atan2(A.dot(yy).imag.trace(), A_real_tr)
-    gamma = math.atan2(A.dot(zz).imag.trace(), A_real_tr)
+    # xx, yy and zz are diagonal in the basis of B, with orthogonal +-1
+    # diagonals, and A = B . Q . Bdag, so the parameters are read from the
+    # phases of Q, once they are chosen to sum to 0 as det(Q) = 1
+    phases = np.angle(Q.diagonal())
+    phases[0] -= phases.sum()
+    alpha, beta, gamma = [Bdag.dot(pauli.dot(B)).diagonal().real.dot(phases) / 4
+                          for pauli in (xx, yy, zz)]
 
     # K1 = kron(U1, U2) and K2 = kron(V1, V2)
     # Find the matrices U1, U2, V1, V2
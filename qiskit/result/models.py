@@ -7,9 +7,11 @@
 
 """Schema and helper models for schema-conformant Results."""
 
+from marshmallow import ValidationError
 from marshmallow.validate import Length, OneOf, Regexp, Range
 
-from qiskit.validation.base import BaseModel, BaseSchema, ObjSchema, bind_schema
+from qiskit.validation.base import BaseModel, BaseSchema, Obj, ObjSchema, bind_schema
+from qiskit.validation.exceptions import ModelValidationError
 from qiskit.validation.fields import Complex, ByType
 from qiskit.validation.fields import Boolean, DateTime, Integer, List, Nested, Raw, String
 from qiskit.validation.validate import PatternProperties
@@ -32,6 +34,11 @@ class ExperimentResultDataSchema(BaseSchema):
                    validate=Length(min=1))
 
 
+class ExperimentResultHeaderSchema(ObjSchema):
+    """Schema for the header of an ExperimentResult."""
+    pass
+
+
 class ExperimentResultSchema(BaseSchema):
     """Schema for ExperimentResult."""
 
@@ -48,7 +55,7 @@ class ExperimentResultSchema(BaseSchema):
     meas_level = Integer(validate=Range(min=0, max=2))
     meas_return = String(validate=OneOf(choices=(MeasReturnType.AVERAGE,
                                                  MeasReturnType.SINGLE)))
-    header = Nested(ObjSchema)
+    header = ByType([Nested(ExperimentResultHeaderSchema), Nested(ObjSchema)])
 
 
 class ResultSchema(BaseSchema):
@@ -69,6 +76,35 @@ class ResultSchema(BaseSchema):
     header = Nested(ObjSchema)
 
 
+DEFERRABLE_DATA_FIELDS = ('memory', 'statevector', 'unitary', 'snapshots')
+"""Fields of ``ExperimentResultData`` that can be deserialized on first access."""
+
+
+@bind_schema(ExperimentResultHeaderSchema)
+class ExperimentResultHeader(Obj):
+    """Model for the header of an ExperimentResult.
+
+    Headers count the changes of their ``name``, so that ``Result`` can tell
+    when its index of the experiment names is stale.
+
+    Attributes:
+        name_changes (int): number of changes of the name of any header, or
+            of the header of any experiment result.
+    """
+
+    name_changes = 0
+
+    def __setattr__(self, name, value):
+        if name == 'name':
+            ExperimentResultHeader.name_changes += 1
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if name == 'name':
+            ExperimentResultHeader.name_changes += 1
+        super().__delattr__(name)
+
+
 @bind_schema(ExperimentResultDataSchema)
 class ExperimentResultData(BaseModel):
     """Model for ExperimentResultData.
@@ -76,8 +112,103 @@ class ExperimentResultData(BaseModel):
     Please note that this class only describes the required fields. For the
     full description of the model, please check
     ``ExperimentResultDataSchema``.
+
+    Some fields can be kept in their serialized form (see ``defer_fields()``)
+    and are deserialized and validated the first time they are accessed.
     """
-    pass
+
+    # Serialized values of the deferred fields, kept outside of ``__dict__``.
+    __slots__ = ('_deferred',)
+
+    def __init__(self, **kwargs):
+        self._deferred = {}
+
+        super().__init__(**kwargs)
+
+    def __getattr__(self, name):
+        """Deserialize a deferred field on first access."""
+        if name == '_deferred':
+            raise AttributeError(name)
+
+        try:
+            value = self._deferred[name]
+        except KeyError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                self.__class__.__name__, name)) from None
+
+        try:
+            value = self.schema.fields[name].deserialize(value)
+        except ValidationError as ex:
+            raise ModelValidationError(
+                ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
+
+        # Only drop the serialized value once it is valid, so that it is not
+        # lost if deserializing it fails.
+        del self._deferred[name]
+        setattr(self, name, value)
+        return value
+
+    def __contains__(self, item):
+        return item in self.__dict__ or item in self._deferred
+
+    def __eq__(self, other):
+        self._load_deferred()
+        if isinstance(other, ExperimentResultData):
+            other._load_deferred()
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        self._load_deferred()
+        return super().__reduce__()
+
+    def defer_fields(self, serialized_fields):
+        """Set fields from their serialized form, deserializing them on first access.
+
+        Args:
+            serialized_fields (dict): serialized values of some of the fields
+                in ``DEFERRABLE_DATA_FIELDS``, as in the output of ``to_dict()``.
+        """
+        for name, value in serialized_fields.items():
+            self.__dict__.pop(name, None)
+            self._deferred[name] = value
+
+    def serialized(self, name):
+        """Return the serialized form of a single field.
+
+        Deferred fields are returned as they are, without deserializing them.
+
+        Args:
+            name (str): name of the field.
+
+        Returns:
+            object: the serialized value, as in the output of ``to_dict()``.
+
+        Raises:
+            KeyError: if the field is not set.
+        """
+        if name in self._deferred:
+            return self._deferred[name]
+        if name not in self.__dict__:
+            raise KeyError(name)
+        if name in self.schema.fields:
+            return self.schema.fields[name].serialize(name, self)
+        return self.__dict__[name]
+
+    def to_dict(self):
+        deferred, self._deferred = self._deferred, {}
+        try:
+            data = super().to_dict()
+        finally:
+            self._deferred = deferred
+        data.update(deferred)
+        return data
+
+    def _load_deferred(self):
+        """Deserialize all the deferred fields."""
+        for name in list(self._deferred):
+            getattr(self, name)
 
 
 @bind_schema(ExperimentResultSchema)
@@ -101,3 +232,13 @@ class ExperimentResult(BaseModel):
         self.meas_level = meas_level
 
         super().__init__(**kwargs)
+
+    def __setattr__(self, name, value):
+        if name == 'header':
+            ExperimentResultHeader.name_changes += 1
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if name == 'header':
+            ExperimentResultHeader.name_changes += 1
+        super().__delattr__(name)
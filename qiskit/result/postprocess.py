@@ -128,6 +128,9 @@ def format_level_1_memory(memory):
 def format_level_2_memory(memory, header=None):
     """ Format an experiment result memory object for measurement level 2.
 
+    Each distinct readout is formatted only once, and the formatted values are
+    then scattered to all the shots.
+
     Args:
         memory (list): Memory from experiment with `meas_level==2` and `memory==True`.
         header (dict): the experiment header dictionary containing
@@ -136,10 +139,41 @@ def format_level_2_memory(memory, header=None):
     Returns:
         list[str]: List of bitstrings
     """
-    memory_list = []
-    for shot_memory in memory:
-        memory_list.append(format_counts_memory(shot_memory, header))
-    return memory_list
+    distinct, inverse = np.unique(np.asarray(memory, dtype=str), return_inverse=True)
+    formatted = np.array([format_counts_memory(shot_memory, header)
+                          for shot_memory in distinct], dtype=object)
+    return formatted[inverse].tolist()
+
+
+def format_level_2_memory_array(memory, header=None):
+    """ Format an experiment result memory object for measurement level 2 as bits.
+
+    Args:
+        memory (list): Memory from experiment with `meas_level==2` and `memory==True`.
+        header (dict): the experiment header dictionary containing
+            useful information for postprocessing. Only ``memory_slots`` is
+            used.
+
+    Returns:
+        np.ndarray: uint8 array with shape (shots, memory_slots), where
+            ``array[shot][k]`` is the value of memory slot ``k``. If the header
+            does not contain ``memory_slots``, the number of columns is the
+            length of the longest readout.
+    """
+    distinct, inverse = np.unique(np.asarray(memory, dtype=str), return_inverse=True)
+    values = [int(shot_memory, 16) if shot_memory.startswith('0x') else int(shot_memory, 2)
+              for shot_memory in distinct]
+
+    memory_slots = (header or {}).get('memory_slots', None)
+    if not memory_slots:
+        memory_slots = max([value.bit_length() for value in values] + [1])
+
+    bits = np.zeros((len(values), memory_slots), dtype=np.uint8)
+    for row, value in enumerate(values):
+        bitstring = format(value, '0{}b'.format(memory_slots))[::-1]
+        bits[row] = np.frombuffer(bitstring[:memory_slots].encode('ascii'),
+                                  dtype=np.uint8) - ord('0')
+    return bits[inverse]
 
 
 def format_counts(counts, header=None):
@@ -172,10 +206,7 @@ def format_statevector(vec, decimals=None):
     Returns:
         list[complex]: a list of python complex numbers.
     """
-    num_basis = len(vec)
-    vec_complex = np.zeros(num_basis, dtype=complex)
-    for i in range(num_basis):
-        vec_complex[i] = vec[i][0] + 1j * vec[i][1]
+    vec_complex = _list_to_complex_array(vec)
     if decimals:
         vec_complex = np.around(vec_complex, decimals=decimals)
     return vec_complex
@@ -192,8 +223,4 @@ def format_unitary(mat, decimals=None):
     Returns:
         list[list[complex]]: a matrix of complex numbers
     """
-    num_basis = len(mat)
-    mat_complex = np.zeros((num_basis, num_basis), dtype=complex)
-    for i, vec in enumerate(mat):
-        mat_complex[i] = format_statevector(vec, decimals)
-    return mat_complex
+    return format_statevector(mat, decimals)
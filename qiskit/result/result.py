@@ -7,13 +7,15 @@
 
 """Model for schema-conformant Results."""
 
+import numpy as np
+
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.pulse.schedule import Schedule
 from qiskit.exceptions import QiskitError
 
 from qiskit.validation.base import BaseModel, bind_schema
 from qiskit.result import postprocess
-from .models import ResultSchema
+from .models import ResultSchema, ExperimentResultHeader, DEFERRABLE_DATA_FIELDS
 
 
 @bind_schema(ResultSchema)
@@ -34,6 +36,11 @@ class Result(BaseModel):
             experiments of the input qobj
     """
 
+    # Post-processed data and the experiment name index are cached outside of
+    # ``__dict__``, so they are not considered part of the model when
+    # serializing or comparing.
+    __slots__ = ('_postprocessed', '_name_index')
+
     def __init__(self, backend_name, backend_version, qobj_id, job_id, success,
                  results, **kwargs):
         self.backend_name = backend_name
@@ -42,9 +49,48 @@ class Result(BaseModel):
         self.job_id = job_id
         self.success = success
         self.results = results
+        self._postprocessed = {}
+        self._name_index = (None, 0, 0, None)
 
         super().__init__(**kwargs)
 
+    @classmethod
+    def from_dict(cls, dict_):
+        """Deserialize a dict of simple types into a Result.
+
+        The bulky fields of the experiments data (``memory``, ``statevector``,
+        ``unitary`` and ``snapshots``) are kept in their serialized form, and
+        only deserialized and validated the first time they are accessed.
+
+        Args:
+            dict_ (dict): the serialized Result.
+
+        Returns:
+            Result: the deserialized Result.
+        """
+        deferred = []
+        if isinstance(dict_, dict) and isinstance(dict_.get('results'), list):
+            results = []
+            for exp_result in dict_['results']:
+                data = exp_result.get('data') if isinstance(exp_result, dict) else None
+                serialized_fields = {}
+                if isinstance(data, dict):
+                    serialized_fields = {key: data[key] for key in DEFERRABLE_DATA_FIELDS
+                                         if key in data}
+                if serialized_fields:
+                    exp_result = dict(exp_result)
+                    exp_result['data'] = {key: value for key, value in data.items()
+                                          if key not in serialized_fields}
+                results.append(exp_result)
+                deferred.append(serialized_fields)
+            dict_ = dict(dict_, results=results)
+
+        result = super().from_dict(dict_)
+        for exp_result, serialized_fields in zip(result.results, deferred):
+            exp_result.data.defer_fields(serialized_fields)
+
+        return result
+
     def data(self, experiment=None):
         """Get the raw data for an experiment.
 
@@ -98,7 +144,7 @@ class Result(BaseModel):
         except (KeyError, TypeError):
             raise QiskitError('No data for experiment "{0}"'.format(experiment))
 
-    def get_memory(self, experiment=None):
+    def get_memory(self, experiment=None, as_array=False):
         """Get the sequence of memory states (readouts) for each shot
         The data from the experiment is a list of format
         ['00000', '01000', '10100', '10100', '11101', '11100', '00101', ..., '01010']
@@ -106,6 +152,10 @@ class Result(BaseModel):
         Args:
             experiment (str or QuantumCircuit or Schedule or int or None): the index of the
                 experiment, as specified by ``data()``.
+            as_array (bool): for `meas_level==2`, return the readouts as a
+                numpy uint8 array with shape (shots, memory_slots) instead of
+                a list of formatted bitstrings, where ``memory[shot][k]`` is
+                the value of memory slot ``k``.
 
         Returns:
             List[str] or np.ndarray: Either the list of each outcome, formatted according to
@@ -124,19 +174,18 @@ class Result(BaseModel):
         """
         try:
             exp_result = self._get_experiment(experiment)
-
-            try:  # header is not available
-                header = exp_result.header.to_dict()
-            except (AttributeError, QiskitError):
-                header = None
-
             meas_level = exp_result.meas_level
 
-            memory = self.data(experiment)['memory']
-
             if meas_level == 2:
-                return postprocess.format_level_2_memory(memory, header)
-            elif meas_level == 1:
+                if as_array:
+                    return self._postprocess(
+                        exp_result, 'memory_array', postprocess.format_level_2_memory_array,
+                        'memory').copy()
+                return list(self._postprocess(
+                    exp_result, 'memory', postprocess.format_level_2_memory, 'memory'))
+
+            memory = exp_result.data.serialized('memory')
+            if meas_level == 1:
                 return postprocess.format_level_1_memory(memory)
             elif meas_level == 0:
                 return postprocess.format_level_0_memory(memory)
@@ -163,17 +212,64 @@ class Result(BaseModel):
             QiskitError: if there are no counts for the experiment.
         """
         try:
-            exp = self._get_experiment(experiment)
-            try:
-                header = exp.header.to_dict()
-            except (AttributeError, QiskitError):  # header is not available
-                header = None
-
-            return postprocess.format_counts(self.data(experiment)['counts'],
-                                             header)
+            exp_result = self._get_experiment(experiment)
+            return dict(self._postprocess(exp_result, 'counts',
+                                          postprocess.format_counts, 'counts'))
         except KeyError:
             raise QiskitError('No counts for experiment "{0}"'.format(experiment))
 
+    def get_counts_all(self):
+        """Get the histogram data of all the experiments.
+
+        Returns:
+            list[dict[str:int]]: the counts of each experiment, in the order of
+                the experiments, formatted as in ``get_counts()``.
+
+        Raises:
+            QiskitError: if there are no counts for any of the experiments.
+        """
+        return [self.get_counts(index) for index in range(len(self.results))]
+
+    def _postprocess(self, exp_result, kind, format_function, data_key):
+        """Return post-processed data of an experiment, formatting it only once.
+
+        The formatted data is cached per experiment result. Callers should
+        return a copy of it, so that the cache cannot be modified by users.
+
+        Args:
+            exp_result (ExperimentResult): the experiment result.
+            kind (str): name of the post-processed data in the cache.
+            format_function (callable): function taking the raw data and the
+                experiment header dict, and returning the formatted data.
+            data_key (str): key of the raw data in the experiment data.
+
+        Returns:
+            object: the formatted data.
+
+        Raises:
+            KeyError: if the experiment data does not contain ``data_key``.
+        """
+        if data_key not in exp_result.data:
+            raise KeyError(data_key)
+
+        cached_result, cached_data = self._postprocessed.get(id(exp_result), (None, {}))
+        if cached_result is not exp_result:
+            # Drop the entries of experiment results no longer in the Result.
+            if len(self._postprocessed) >= len(self.results):
+                self._postprocessed.clear()
+            cached_data = {}
+            self._postprocessed[id(exp_result)] = (exp_result, cached_data)
+
+        if kind not in cached_data:
+            try:  # header is not available
+                header = exp_result.header.to_dict()
+            except (AttributeError, QiskitError):
+                header = None
+
+            cached_data[kind] = format_function(exp_result.data.serialized(data_key), header)
+
+        return cached_data[kind]
+
     def get_statevector(self, experiment=None, decimals=None):
         """Get the final statevector of an experiment.
 
@@ -190,11 +286,15 @@ class Result(BaseModel):
             QiskitError: if there is no statevector for the experiment.
         """
         try:
-            return postprocess.format_statevector(self.data(experiment)['statevector'],
-                                                  decimals=decimals)
+            statevector = self._postprocess(self._get_experiment(experiment), 'statevector',
+                                            _format_statevector, 'statevector')
         except KeyError:
             raise QiskitError('No statevector for experiment "{0}"'.format(experiment))
 
+        if decimals:
+            return np.around(statevector, decimals=decimals)
+        return statevector.copy()
+
     def get_unitary(self, experiment=None, decimals=None):
         """Get the final unitary of an experiment.
 
@@ -212,11 +312,15 @@ class Result(BaseModel):
             QiskitError: if there is no unitary for the experiment.
         """
         try:
-            return postprocess.format_unitary(self.data(experiment)['unitary'],
-                                              decimals=decimals)
+            unitary = self._postprocess(self._get_experiment(experiment), 'unitary',
+                                        _format_unitary, 'unitary')
         except KeyError:
             raise QiskitError('No unitary for experiment "{0}"'.format(experiment))
 
+        if decimals:
+            return np.around(unitary, decimals=decimals)
+        return unitary.copy()
+
     def _get_experiment(self, key=None):
         """Return a single experiment result from a given key.
 
@@ -252,11 +356,64 @@ class Result(BaseModel):
         if isinstance(key, (QuantumCircuit, Schedule)):
             key = key.name
 
-        try:
-            # Look into `result[x].header.name` for the names.
-            return next(result for result in self.results
-                        if getattr(getattr(result, 'header', None),
-                                   'name', '') == key)
-        except StopIteration:
+        name_index = self._get_name_index()
+        if name_index is None:
+            # The names cannot be tracked: find the first match by scanning.
+            index = next((index for index, result in enumerate(self.results)
+                          if _experiment_name(result) == key), None)
+        else:
+            index = name_index.get(key)
+            if index is not None and _experiment_name(self.results[index]) != key:
+                # An experiment result was replaced after building the index.
+                index = self._get_name_index(rebuild=True).get(key)
+        if index is None:
             raise QiskitError('Data for experiment "%s" could not be found.' %
                               key)
+
+        return self.results[index]
+
+    def _get_name_index(self, rebuild=False):
+        """Return the map from experiment names to their first index in ``results``.
+
+        The map is built on first use, and rebuilt if ``results`` is replaced,
+        its length changes or an experiment is renamed. Renames are only
+        tracked for ``ExperimentResultHeader`` headers, as built when loading
+        the results: if any experiment has another kind of header, the map is
+        not built.
+
+        Args:
+            rebuild (bool): force rebuilding the map.
+
+        Returns:
+            dict[str:int]: the map from names to indices, or None if the names
+                of the experiments cannot be tracked.
+        """
+        results, length, name_changes, name_index = self._name_index
+        if (rebuild or results is not self.results or length != len(self.results)
+                or name_changes != ExperimentResultHeader.name_changes):
+            name_index = {}
+            for index, result in enumerate(self.results):
+                header = getattr(result, 'header', None)
+                if header is not None and not isinstance(header, ExperimentResultHeader):
+                    name_index = None
+                    break
+                name_index.setdefault(_experiment_name(result), index)
+            self._name_index = (self.results, len(self.results),
+                                ExperimentResultHeader.name_changes, name_index)
+
+        return name_index
+
+
+def _format_statevector(vec, _):
+    """Format a statevector for ``Result._postprocess``."""
+    return postprocess.format_statevector(vec)
+
+
+def _format_unitary(mat, _):
+    """Format a unitary for ``Result._postprocess``."""
+    return postprocess.format_unitary(mat)
+
+
+def _experiment_name(exp_result):
+    """Return the name of an experiment result, from ``header.name``."""
+    return getattr(getattr(exp_result, 'header', None), 'name', '')
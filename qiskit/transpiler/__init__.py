@@ -13,3 +13,4 @@ from .exceptions import TranspilerError, TranspilerAccessError
 from .fencedobjs import FencedDAGCircuit, FencedPropertySet
 from .basepasses import AnalysisPass, TransformationPass
 from .transpiler import transpile, transpile_dag
+from .preset_passmanagers import preset_pass_manager
@@ -9,17 +9,25 @@
 Pass for detecting commutativity in a circuit.
 
 Property_set['commutation_set'] is a dictionary that describes
-the commutation relations on a given wire, all the gates on a wire
-are grouped into a set of gates that commute.
+the commutation relations on each wire of the circuit: the op nodes on a wire
+are grouped into lists of consecutive nodes that commute, by wire.
+Property_set['commutation_group_ids'] gives, by node id, the index of the
+group of the node on each of its wires, in the order of its qargs, the bits
+of its condition and its cargs.
 
 This pass also provides useful methods to determine if two gates
 can commute in the circuit.
 
-TODO: the current pass determines commutativity through matrix multiplication.
-A rule-based analysis would be potentially faster, but more limited.
+Commutation is first decided with a table of rules: two gates commute if,
+on each qubit they share, both act along the same axis (e.g. diagonal gates
+and controls along Z, x, rx and the target of cx along X). The other pairs
+are decided by matrix multiplication, and the results are cached by the names
+and the params of the gates and their relative placement on the qubits.
+Nodes that share a classical bit only commute if they both only read it in
+their conditions.
 """
 
-from collections import defaultdict
+from functools import lru_cache
 import numpy as np
 from qiskit.transpiler.exceptions import TranspilerError
 
@@ -31,49 +39,34 @@ _CUTOFF_PRECISION = 1E-10
 class CommutationAnalysis(AnalysisPass):
     """An analysis pass to find commutation relations between DAG nodes."""
 
-    def __init__(self):
-        super().__init__()
-        self.gates_on_wire = {}
-
     def run(self, dag):
         """
         Run the pass on the DAG, and write the discovered commutation relations
         into the property_set.
-        """
-        # Initiate the commutation set
-        self.property_set['commutation_set'] = defaultdict(list)
 
-        # Build a dictionary to keep track of the gates on each qubit
-        for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
-            self.property_set['commutation_set'][wire_name] = []
+        The op nodes are visited once, in topological order, and each node is
+        compared with the last node on each of its wires.
+        """
+        commutation_set = {wire: [] for wire in dag.wires}
+        group_ids = {}
 
-        # Add edges to the dictionary for each qubit
         for node in dag.topological_op_nodes():
-            for (_, _, edge_data) in dag.multi_graph.edges(node, data=True):
-
-                edge_name = edge_data['name']
-                self.property_set['commutation_set'][(node, edge_name)] = -1
-
-        for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
-
-            for current_gate in dag.nodes_on_wire(wire):
-
-                current_comm_set = self.property_set['commutation_set'][wire_name]
-                if not current_comm_set:
-                    current_comm_set.append([current_gate])
-
-                if current_gate not in current_comm_set[-1]:
-                    prev_gate = current_comm_set[-1][-1]
-                    if _commute(current_gate, prev_gate):
-                        current_comm_set[-1].append(current_gate)
-
-                    else:
-                        current_comm_set.append([current_gate])
-
-                temp_len = len(current_comm_set)
-                self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
+            wires = []
+            for wire in node.qargs + dag._bits_in_condition(node.condition) + node.cargs:
+                if wire not in wires:
+                    wires.append(wire)
+            node_group_ids = []
+            for wire in wires:
+                wire_groups = commutation_set[wire]
+                if wire_groups and _commute(node, wire_groups[-1][-1]):
+                    wire_groups[-1].append(node)
+                else:
+                    wire_groups.append([node])
+                node_group_ids.append(len(wire_groups) - 1)
+            group_ids[node._node_id] = tuple(node_group_ids)
+
+        self.property_set['commutation_set'] = commutation_set
+        self.property_set['commutation_group_ids'] = group_ids
 
 
 def _gate_master_def(name, params=None):
@@ -155,77 +148,134 @@ def _gate_master_def(name, params=None):
     raise TranspilerError("The gate %s isn't supported" % name)
 
 
-def _calc_product(node1, node2):
-
-    wire_num = len(set(node1.qargs + node2.qargs))
-    wires = sorted(list(map(lambda x: "{0}[{1}]".format(str(x[0].name), str(x[1])),
-                            list(set(node1.qargs + node2.qargs)))))
-    final_unitary = np.identity(2 ** wire_num, dtype=np.complex)
-
-    for node in [node1, node2]:
-
-        qstate_list = [np.identity(2)] * wire_num
-
-        if node.name in ['cx', 'cy', 'cz']:
-
-            qstate_list_ext = [np.identity(2)] * wire_num
+# axis along which each gate acts on each of its qubits: the gate is a sum of
+# products of operators that are diagonal in the eigenbasis of the Pauli
+# operator of the axis, so that gates acting along the same axis on each
+# shared qubit commute
+_AXES = {
+    'id': ('*',),
+    'z': ('z',), 's': ('z',), 'sdg': ('z',), 't': ('z',), 'tdg': ('z',),
+    'rz': ('z',), 'u1': ('z',),
+    'x': ('x',), 'rx': ('x',),
+    'y': ('y',), 'ry': ('y',),
+    'cx': ('z', 'x'), 'cy': ('z', 'y'), 'cz': ('z', 'z'),
+    'crz': ('z', 'z'), 'cu1': ('z', 'z'), 'rzz': ('z', 'z'),
+    'ccx': ('z', 'z', 'x'),
+}
 
-            node_ctrl = "{0}[{1}]".format(str(node.qargs[0][0].name), str(node.qargs[0][1]))
-            node_tgt = "{0}[{1}]".format(str(node.qargs[1][0].name), str(node.qargs[1][1]))
-            ctrl = wires.index(node_ctrl)
-            tgt = wires.index(node_tgt)
+# target of the controlled gates whose matrices are computed
+_CONTROLLED_GATES = {'cx': 'x', 'cy': 'y', 'cz': 'z'}
 
-            qstate_list[ctrl] = _gate_master_def(name='P0')
-            qstate_list[tgt] = _gate_master_def(name='Id')
-            qstate_list_ext[ctrl] = _gate_master_def(name='P1')
-            if node.name == 'cx':
-                qstate_list_ext[tgt] = _gate_master_def(name='x')
-            if node.name == 'cy':
-                qstate_list_ext[tgt] = _gate_master_def(name='y')
-            if node.name == 'cz':
-                qstate_list_ext[tgt] = _gate_master_def(name='z')
-
-            rt_list = [qstate_list] + [qstate_list_ext]
-
-        else:
-
-            mat = _gate_master_def(name=node.name, params=node.op.params)
-            node_num = "{0}[{1}]".format(str(node.qargs[0][0].name),
-                                         str(node.qargs[0][1]))
-            qstate_list[wires.index(node_num)] = mat
-
-            rt_list = [qstate_list]
-
-        crt = np.zeros([2 ** wire_num, 2 ** wire_num])
-
-        for state in rt_list:
-            crt = crt + _kron_list(state)
-
-        final_unitary = np.dot(crt, final_unitary)
-    return final_unitary
-
-
-def _kron_list(args):
-    ret = args[0]
-    for item in args[1:]:
-        ret = np.kron(ret, item)
-    return ret
-
-
-def _matrix_commute(node1, node2):
-    # Good for composite gates or any future
-    # user-defined gate of equal or less than 2 qubits.
-    ret = False
-    if set(node1.qargs) & set(node2.qargs) == set():
-        ret = True
-    if _calc_product(node1, node2) is not None:
-        ret = np.allclose(_calc_product(node1, node2),
-                          _calc_product(node2, node1),
-                          atol=_CUTOFF_PRECISION)
-    return ret
+# number of matrix-based commutation results cached
+_MATRIX_COMMUTE_CACHE_SIZE = 4096
 
 
 def _commute(node1, node2):
     if node1.type != "op" or node2.type != "op":
         return False
-    return _matrix_commute(node1, node2)
+    # on a shared classical bit, the nodes only commute if neither writes it
+    clbits1 = set(node1.cargs)
+    clbits2 = set(node2.cargs)
+    if clbits1 & (clbits2 | _condition_bits(node2)) or clbits2 & _condition_bits(node1):
+        return False
+    qargs1 = node1.qargs
+    qargs2 = node2.qargs
+    if not set(qargs1) & set(qargs2):
+        return True
+    if _rule_commute(node1.name, qargs1, node2.name, qargs2):
+        return True
+    # relative placement of the qubits of node2, the qubits of node1 being
+    # numbered first
+    wires = list(qargs1)
+    for qarg in qargs2:
+        if qarg not in wires:
+            wires.append(qarg)
+    placement = tuple(wires.index(qarg) for qarg in qargs2)
+    params1 = _params_key(node1.op.params)
+    params2 = _params_key(node2.op.params)
+    try:
+        hash((params1, params2))
+    except TypeError:
+        # unhashable params, such as matrices, are not cached
+        return _matrix_commute.__wrapped__(node1.name, params1, node2.name, params2,
+                                           len(qargs1), placement)
+    return _matrix_commute(node1.name, params1, node2.name, params2,
+                           len(qargs1), placement)
+
+
+def _condition_bits(node):
+    """Return the set of the classical bits read by the condition of a node."""
+    if node.condition is None:
+        return set()
+    register = node.condition[0]
+    return {(register, index) for index in range(register.size)}
+
+
+def _rule_commute(name1, qargs1, name2, qargs2):
+    """Return True if the rule table tells that the gates commute, False if
+    it cannot tell."""
+    axes1 = _AXES.get(name1)
+    axes2 = _AXES.get(name2)
+    if axes1 is None or axes2 is None or \
+            len(axes1) != len(qargs1) or len(axes2) != len(qargs2):
+        return False
+    for qarg, axis1 in zip(qargs1, axes1):
+        if qarg in qargs2:
+            axis2 = axes2[qargs2.index(qarg)]
+            if axis1 != axis2 and '*' not in (axis1, axis2):
+                return False
+    return True
+
+
+def _params_key(params):
+    """Return the params as a hashable key, with the numbers as floats."""
+    key = []
+    for param in params:
+        try:
+            key.append(float(param))
+        except TypeError:
+            key.append(param)
+    return tuple(key)
+
+
+@lru_cache(maxsize=_MATRIX_COMMUTE_CACHE_SIZE)
+def _matrix_commute(name1, params1, name2, params2, num_qubits1, placement):
+    """Return whether two gates commute, by comparing the products of their
+    matrices. The first gate acts on the first ``num_qubits1`` wires and the
+    second on the wires of ``placement``. Gates without a known matrix, or
+    with params that are not numbers, do not commute."""
+    num_qubits = max(num_qubits1, max(placement) + 1)
+    try:
+        # both matrices are looked up before embedding them, as a gate without
+        # a matrix, such as a barrier, can act on many qubits
+        matrix1 = _gate_matrix(name1, params1)
+        matrix2 = _gate_matrix(name2, params2)
+        matrix1 = _embedded_matrix(matrix1, range(num_qubits1), num_qubits)
+        matrix2 = _embedded_matrix(matrix2, placement, num_qubits)
+    except (TranspilerError, TypeError):
+        return False
+    return np.allclose(matrix1.dot(matrix2), matrix2.dot(matrix1), atol=_CUTOFF_PRECISION)
+
+
+def _gate_matrix(name, params):
+    """Return the matrix of a gate, in the order of its qubits."""
+    if name in _CONTROLLED_GATES:
+        return (np.kron(_gate_master_def(name='P0'), _gate_master_def(name='Id')) +
+                np.kron(_gate_master_def(name='P1'),
+                        _gate_master_def(name=_CONTROLLED_GATES[name])))
+    return _gate_master_def(name=name, params=params)
+
+
+def _embedded_matrix(matrix, positions, num_qubits):
+    """Return the matrix of a gate acting on the given positions of
+    ``num_qubits`` wires, the first wire being the most significant."""
+    positions = list(positions)
+    if matrix.shape[0] != 2 ** len(positions):
+        raise TranspilerError("The gate does not act on %d qubits" % len(positions))
+    rest = num_qubits - len(positions)
+    full = np.kron(matrix, np.identity(2 ** rest)).reshape([2] * (2 * num_qubits))
+    # axis i of full is the wire order[i]
+    order = positions + [wire for wire in range(num_qubits) if wire not in positions]
+    perm = list(np.argsort(order))
+    full = full.transpose(perm + [num_qubits + axis for axis in perm])
+    return full.reshape(2 ** num_qubits, 2 ** num_qubits)
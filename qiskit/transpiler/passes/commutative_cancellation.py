@@ -48,24 +48,25 @@ class CommutativeCancellation(TransformationPass):
         # Gate sets to be cancelled
         cancellation_sets = defaultdict(lambda: [])
 
+        commutation_set = self.property_set['commutation_set']
+        group_ids = self.property_set['commutation_group_ids']
         for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
-            wire_commutation_set = self.property_set['commutation_set'][wire_name]
-
-            for com_set_idx, com_set in enumerate(wire_commutation_set):
-                if com_set[0].type in ['in', 'out']:
-                    continue
+            # only the gates on qubits are cancelled
+            if not isinstance(wire[0], QuantumRegister):
+                continue
+            for com_set_idx, com_set in enumerate(commutation_set[wire]):
                 for node in com_set:
+                    if node.condition is not None:
+                        continue
                     num_qargs = len(node.qargs)
                     if num_qargs == 1 and node.name in q_gate_list:
-                        cancellation_sets[(node.name, wire_name, com_set_idx)].append(node)
+                        cancellation_sets[(node.name, wire, com_set_idx)].append(node)
                     if num_qargs == 1 and node.name in ['u1', 'rz', 't', 's']:
-                        cancellation_sets[('z_rotation', wire_name, com_set_idx)].append(node)
+                        cancellation_sets[('z_rotation', wire, com_set_idx)].append(node)
                     elif num_qargs == 2 and node.qargs[0] == wire:
-                        second_op_name = "{0}[{1}]".format(str(node.qargs[1][0].name),
-                                                           str(node.qargs[1][1]))
-                        q2_key = (node.name, wire_name, second_op_name,
-                                  self.property_set['commutation_set'][(node, second_op_name)])
+                        # index of the group of the node on its second qubit
+                        q2_key = (node.name, wire, node.qargs[1],
+                                  group_ids[node._node_id][1])
                         cancellation_sets[q2_key].append(node)
 
         for cancel_set_key in cancellation_sets:
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Replace each block of consecutive gates on a pair of qubits, as found by
+Collect2qBlocks, with its KAK decomposition when the decomposition has fewer
+CNOTs than the block.
+
+The unitary of each block is computed by multiplying the runs of single qubit
+gates on each qubit as batches of 2x2 matrices, and only forming 4x4 products
+at the CNOTs.
+"""
+
+import numpy as np
+
+from qiskit.converters import circuit_to_dag
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.unitary import Unitary
+from qiskit.quantum_info.synthesis import two_qubit_kak
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes.collect_2q_blocks import Collect2qBlocks
+
+# number of CNOTs of the KAK decomposition of any two-qubit unitary
+_KAK_NUM_CX = 3
+
+_P0 = np.array([[1, 0], [0, 0]], dtype=complex)
+_P1 = np.array([[0, 0], [0, 1]], dtype=complex)
+_X = np.array([[0, 1], [1, 0]], dtype=complex)
+_I = np.identity(2, dtype=complex)
+
+
+class ConsolidateBlocks(TransformationPass):
+    """Re-synthesize the two-qubit blocks of the circuit with fewer CNOTs."""
+
+    def __init__(self):
+        super().__init__()
+        self.requires.append(Collect2qBlocks())
+
+    def run(self, dag):
+        """Run one pass of block consolidation on the circuit.
+
+        Args:
+            dag (DAGCircuit): the directed acyclic graph to run on.
+        Returns:
+            DAGCircuit: Transformed DAG.
+        """
+        for block in self.property_set['block_list']:
+            cx_nodes = [node for node in block if node.name == 'cx']
+            if len(cx_nodes) <= _KAK_NUM_CX or \
+                    any(node.condition is not None for node in block):
+                continue
+            qubits = cx_nodes[0].qargs
+            try:
+                matrix = _block_matrix(block, qubits)
+                kak_circuit = two_qubit_kak(Unitary(matrix))
+            except (TypeError, QiskitError):
+                # unbound params, or a failed decomposition
+                continue
+            for node in block:
+                if node is not cx_nodes[0]:
+                    dag.remove_op_node(node)
+            dag.substitute_node_with_dag(cx_nodes[0], circuit_to_dag(kak_circuit))
+        return dag
+
+
+def _block_matrix(block, qubits):
+    """Return the unitary of a block of u1, u2, u3, id and cx gates acting on
+    two qubits, the first of ``qubits`` being the least significant.
+
+    Returns:
+        ndarray: the 4x4 unitary of the block.
+
+    Raises:
+        TypeError: if a param is not a number.
+    """
+    one_qubit_nodes = [node for node in block if node.name != 'cx']
+    matrices = iter(_u3_matrices([_u3_params(node) for node in one_qubit_nodes]))
+    # products of the single qubit gates met on each qubit since the last cx
+    pending = [_I, _I]
+    matrix = np.identity(4, dtype=complex)
+    for node in block:
+        if node.name != 'cx':
+            index = qubits.index(node.qargs[0])
+            pending[index] = next(matrices).dot(pending[index])
+            continue
+        matrix = np.kron(pending[1], pending[0]).dot(matrix)
+        pending = [_I, _I]
+        if node.qargs[0] == qubits[0]:
+            cx_matrix = np.kron(_I, _P0) + np.kron(_X, _P1)
+        else:
+            cx_matrix = np.kron(_P0, _I) + np.kron(_P1, _X)
+        matrix = cx_matrix.dot(matrix)
+    return np.kron(pending[1], pending[0]).dot(matrix)
+
+
+def _u3_params(node):
+    """Return the u3 params of a u1, u2, u3 or id node, as floats."""
+    params = [float(param) for param in node.op.params]
+    if node.name == 'u1':
+        return [0.0, 0.0] + params
+    if node.name == 'u2':
+        return [np.pi / 2] + params
+    if node.name == 'id':
+        return [0.0, 0.0, 0.0]
+    return params
+
+
+def _u3_matrices(params):
+    """Return the matrices of u3 gates, given an array of their params."""
+    params = np.asarray(params, dtype=float).reshape(-1, 3)
+    theta, phi, lam = params.T
+    cos = np.cos(theta / 2)
+    sin = np.sin(theta / 2)
+    matrices = np.empty((len(params), 2, 2), dtype=complex)
+    matrices[:, 0, 0] = cos
+    matrices[:, 0, 1] = -np.exp(1j * lam) * sin
+    matrices[:, 1, 0] = np.exp(1j * phi) * sin
+    matrices[:, 1, 1] = np.exp(1j * (phi + lam)) * cos
+    return matrices
@@ -15,6 +15,8 @@ in the transpiler architecture it is best passed around between passes by
 being set in `property_set`.
 """
 
+from functools import lru_cache
+
 import numpy as np
 import scipy.sparse as sp
 import scipy.sparse.csgraph as cs
@@ -51,12 +53,16 @@ class DenseLayout(AnalysisPass):
             dag (DAGCircuit): DAG to find layout for.
 
         Raises:
-            TranspilerError: if dag wider than self.coupling_map
+            TranspilerError: if dag wider than self.coupling_map, or than its
+                connected components
         """
         num_dag_qubits = sum([qreg.size for qreg in dag.qregs.values()])
         if num_dag_qubits > self.coupling_map.size():
             raise TranspilerError('Number of qubits greater than device.')
         best_sub = self._best_subset(num_dag_qubits)
+        if best_sub is None:
+            raise TranspilerError('No connected subset of %d qubits in the coupling map.'
+                                  % num_dag_qubits)
         layout = Layout()
         map_iter = 0
         for qreg in dag.qregs.values():
@@ -72,50 +78,119 @@ class DenseLayout(AnalysisPass):
             n_qubits (int): Number of subset qubits to consider.
 
         Returns:
-            ndarray: Array of qubits to use for best connectivity mapping.
+            ndarray: Array of qubits to use for best connectivity mapping, or
+                None if no connected component has n_qubits qubits.
         """
         if n_qubits == 1:
             return np.array([0])
+        edges = tuple(tuple(edge) for edge in self.coupling_map.get_edges())
+        best_map = _best_subset(edges, self.coupling_map.size(), n_qubits)
+        # the cached array is not shared with the caller
+        return None if best_map is None else best_map.copy()
+
+
+# number of best subsets cached, for distinct coupling maps and numbers of qubits
+_BEST_SUBSET_CACHE_SIZE = 64
+
+# number of starting nodes whose subsets are compared at once
+_CHUNK_SIZE = 256
+
 
-        device_qubits = self.coupling_map.size()
-
-        cmap = np.asarray(self.coupling_map.get_edges())
-        data = np.ones_like(cmap[:, 0])
-        sp_cmap = sp.coo_matrix((data, (cmap[:, 0], cmap[:, 1])),
-                                shape=(device_qubits, device_qubits)).tocsr()
-        best = 0
-        best_map = None
-        # do bfs with each node as starting point
-        for k in range(sp_cmap.shape[0]):
-            bfs = cs.breadth_first_order(sp_cmap, i_start=k, directed=False,
-                                         return_predecessors=False)
-
-            connection_count = 0
-            sub_graph = []
-            for i in range(n_qubits):
-                node_idx = bfs[i]
-                for j in range(sp_cmap.indptr[node_idx],
-                               sp_cmap.indptr[node_idx + 1]):
-                    node = sp_cmap.indices[j]
-                    for counter in range(n_qubits):
-                        if node == bfs[counter]:
-                            connection_count += 1
-                            sub_graph.append([node_idx, node])
-                            break
-
-            if connection_count > best:
-                best = connection_count
-                best_map = bfs[0:n_qubits]
-                # Return a best mapping that has reduced bandwidth
-                mapping = {}
-                for edge in range(best_map.shape[0]):
-                    mapping[best_map[edge]] = edge
-                new_cmap = [[mapping[c[0]], mapping[c[1]]] for c in sub_graph]
-                rows = [edge[0] for edge in new_cmap]
-                cols = [edge[1] for edge in new_cmap]
-                data = [1]*len(rows)
-                sp_sub_graph = sp.coo_matrix((data, (rows, cols)),
-                                             shape=(n_qubits, n_qubits)).tocsr()
-                perm = cs.reverse_cuthill_mckee(sp_sub_graph)
-                best_map = best_map[perm]
-        return best_map
+@lru_cache(maxsize=_BEST_SUBSET_CACHE_SIZE)
+def _best_subset(edges, device_qubits, n_qubits):
+    """Return the first n_qubits nodes of the breadth first order, from any
+    node, with the most edges between them, ordered by reverse Cuthill-McKee.
+
+    Args:
+        edges (tuple): edges of the coupling map.
+        device_qubits (int): number of qubits of the coupling map.
+        n_qubits (int): Number of subset qubits to consider.
+
+    Returns:
+        ndarray: Array of qubits to use for best connectivity mapping, or None
+            if no connected component has n_qubits qubits.
+    """
+    cmap = np.asarray(edges)
+    data = np.ones_like(cmap[:, 0])
+    sp_cmap = sp.coo_matrix((data, (cmap[:, 0], cmap[:, 1])),
+                            shape=(device_qubits, device_qubits)).tocsr()
+    subsets = _bfs_prefixes(sp_cmap, n_qubits)
+    # number of edges between the nodes of each subset
+    rows = np.repeat(np.arange(device_qubits), np.diff(sp_cmap.indptr))
+    cols = sp_cmap.indices
+    connection_counts = np.empty(device_qubits, dtype=int)
+    for chunk in range(0, device_qubits, _CHUNK_SIZE):
+        chunk_subsets = subsets[chunk:chunk + _CHUNK_SIZE]
+        in_subset = np.zeros((len(chunk_subsets), device_qubits + 1), dtype=bool)
+        # nodes missing from subsets that are too small are -1, the last column
+        in_subset[np.arange(len(chunk_subsets))[:, None], chunk_subsets] = True
+        connection_counts[chunk:chunk + _CHUNK_SIZE] = np.count_nonzero(
+            in_subset[:, rows] & in_subset[:, cols], axis=1)
+    connection_counts[(subsets < 0).any(axis=1)] = 0
+    start = np.argmax(connection_counts)
+    if connection_counts[start] == 0:
+        return None
+    best_map = subsets[start]
+    # Return a best mapping that has reduced bandwidth
+    sp_sub_graph = sp_cmap[best_map][:, best_map]
+    sp_sub_graph.data[:] = 1
+    sp_sub_graph.sort_indices()
+    perm = cs.reverse_cuthill_mckee(sp_sub_graph)
+    return best_map[perm]
+
+
+def _bfs_prefixes(sp_cmap, n_qubits):
+    """Return the first n_qubits nodes of the breadth first orders of the
+    undirected graph, from each of its nodes, as the rows of an array.
+
+    The searches from all the nodes are done together, a level at a time, and
+    stop after n_qubits nodes. As scipy.sparse.csgraph.breadth_first_order,
+    the successors of each node are visited before its predecessors. Subsets of
+    components with less than n_qubits nodes are completed with -1.
+    """
+    num_nodes = sp_cmap.shape[0]
+    sp_cmap_t = sp_cmap.T.tocsr()
+    sp_cmap_t.sort_indices()
+    # neighbours of each node, in the order they are visited
+    degrees = np.diff(sp_cmap.indptr) + np.diff(sp_cmap_t.indptr)
+    neighbours_ptr = np.concatenate([[0], np.cumsum(degrees)])
+    neighbours = np.empty(neighbours_ptr[-1], dtype=int)
+    out_position = np.repeat(neighbours_ptr[:-1] - sp_cmap.indptr[:-1],
+                             np.diff(sp_cmap.indptr)) + np.arange(sp_cmap.nnz)
+    neighbours[out_position] = sp_cmap.indices
+    in_position = np.repeat(neighbours_ptr[:-1] + np.diff(sp_cmap.indptr) -
+                            sp_cmap_t.indptr[:-1],
+                            np.diff(sp_cmap_t.indptr)) + np.arange(sp_cmap_t.nnz)
+    neighbours[in_position] = sp_cmap_t.indices
+
+    prefixes = np.full((num_nodes, n_qubits), -1, dtype=int)
+    prefixes[:, 0] = np.arange(num_nodes)
+    visited = np.identity(num_nodes, dtype=bool)
+    sizes = np.ones(num_nodes, dtype=int)
+    # nodes of the current level, sorted by search and by rank in the search
+    searches = np.arange(num_nodes)
+    nodes = np.arange(num_nodes)
+    while nodes.size:
+        node_degrees = degrees[nodes]
+        total = node_degrees.sum()
+        searches = np.repeat(searches, node_degrees)
+        positions = np.arange(total) - np.repeat(np.cumsum(node_degrees) - node_degrees,
+                                                 node_degrees)
+        nodes = neighbours[np.repeat(neighbours_ptr[nodes], node_degrees) + positions]
+        unvisited = ~visited[searches, nodes]
+        searches, nodes = searches[unvisited], nodes[unvisited]
+        # the entries are sorted by search, and by rank and position of the node
+        # they are visited from: keep the first visit of each node
+        _, first = np.unique(searches * num_nodes + nodes, return_index=True)
+        first.sort()
+        searches, nodes = searches[first], nodes[first]
+        # rank of the nodes in their search
+        group_starts = np.flatnonzero(np.append(True, searches[1:] != searches[:-1]))
+        ranks = sizes[searches] + np.arange(len(searches)) - \
+            np.repeat(group_starts, np.diff(np.append(group_starts, len(searches))))
+        kept = ranks < n_qubits
+        searches, nodes, ranks = searches[kept], nodes[kept], ranks[kept]
+        prefixes[searches, ranks] = nodes
+        visited[searches, nodes] = True
+        sizes += np.bincount(searches, minlength=num_nodes)
+    return prefixes
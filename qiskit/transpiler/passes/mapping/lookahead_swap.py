@@ -47,7 +47,7 @@ from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
-from qiskit.mapper import Layout
+from qiskit.mapper import ErrorDistance, Layout
 from qiskit.dagcircuit import DAGNode
 
 from .barrier_before_final_measurements import BarrierBeforeFinalMeasurements
@@ -59,17 +59,21 @@ SEARCH_WIDTH = 4
 class LookaheadSwap(TransformationPass):
     """Map input circuit onto a backend topology via insertion of SWAPs."""
 
-    def __init__(self, coupling_map, initial_layout=None):
+    def __init__(self, coupling_map, initial_layout=None, backend_prop=None):
         """Initialize a LookaheadSwap instance.
 
         Arguments:
             coupling_map (CouplingMap): CouplingMap of the target backend.
             initial_layout (Layout): The initial layout of the DAG to analyze.
+            backend_prop (BackendProperties): if given, the SWAPs are ranked by
+                the error-weighted routing cost of the backend, instead of the
+                distance in the coupling map only.
         """
 
         super().__init__()
         self._coupling_map = coupling_map
         self.initial_layout = initial_layout
+        self.backend_prop = backend_prop
         self.requires.append(BarrierBeforeFinalMeasurements())
 
     def run(self, dag):
@@ -100,13 +104,18 @@ class LookaheadSwap(TransformationPass):
             raise TranspilerError(
                 "Mappers require to have the layout to be the same size as the coupling map")
 
+        cost_matrix = None
+        if self.backend_prop is not None:
+            cost_matrix = ErrorDistance.from_backend_properties(
+                self.backend_prop).routing_cost(coupling_map)
+
         mapped_gates = []
         layout = self.initial_layout.copy()
         gates_remaining = ordered_virtual_gates.copy()
 
         while gates_remaining:
             best_step = _search_forward_n_swaps(layout, gates_remaining,
-                                                coupling_map)
+                                                coupling_map, cost_matrix=cost_matrix)
 
             layout = best_step['layout']
             gates_mapped = best_step['gates_mapped']
@@ -124,7 +133,7 @@ class LookaheadSwap(TransformationPass):
 
 
 def _search_forward_n_swaps(layout, gates, coupling_map,
-                            depth=SEARCH_DEPTH, width=SEARCH_WIDTH):
+                            depth=SEARCH_DEPTH, width=SEARCH_WIDTH, cost_matrix=None):
     """Search for SWAPs which allow for application of largest number of gates.
 
     Arguments:
@@ -133,6 +142,8 @@ def _search_forward_n_swaps(layout, gates, coupling_map,
         coupling_map (CouplingMap): CouplingMap of the target backend.
         depth (int): Number of SWAP layers to search before choosing a result.
         width (int): Number of SWAPs to consider at each layer.
+        cost_matrix (ndarray): Cost of the CNOTs between physical qubits, by
+            which the SWAPs are ranked. Defaults to the coupling map distance.
     Returns:
         dict: Describes solution step found.
             layout (Layout): Virtual to physical qubit map after SWAPs.
@@ -157,7 +168,8 @@ def _search_forward_n_swaps(layout, gates, coupling_map,
         """Calculate the relative score for a given SWAP."""
         trial_layout = layout.copy()
         trial_layout.swap(*swap)
-        return _calc_layout_distance(gates, coupling_map, trial_layout)
+        return _calc_layout_distance(gates, coupling_map, trial_layout,
+                                     cost_matrix=cost_matrix)
 
     ranked_swaps = sorted(possible_swaps, key=_score_swap)
 
@@ -166,7 +178,7 @@ def _search_forward_n_swaps(layout, gates, coupling_map,
         trial_layout = layout.copy()
         trial_layout.swap(*swap)
         next_step = _search_forward_n_swaps(trial_layout, gates_remaining,
-                                            coupling_map, depth - 1, width)
+                                            coupling_map, depth - 1, width, cost_matrix)
 
         # ranked_swaps already sorted by distance, so distance is the tie-breaker.
         if best_swap is None or _score_step(next_step) > _score_step(best_step):
@@ -236,15 +248,20 @@ def _map_free_gates(layout, gates, coupling_map):
     return mapped_gates, remaining_gates
 
 
-def _calc_layout_distance(gates, coupling_map, layout, max_gates=None):
+def _calc_layout_distance(gates, coupling_map, layout, max_gates=None, cost_matrix=None):
     """Return the sum of the distances of two-qubit pairs in each CNOT in gates
-    according to the layout and the coupling.
+    according to the layout and the coupling, or the sum of their costs if a
+    cost matrix is given.
     """
 
     if max_gates is None:
         max_gates = 50 + 10 * len(coupling_map.physical_qubits)
 
-    return sum(coupling_map.distance(*[layout[q] for q in gate['partition'][0]])
+    distance = coupling_map.distance
+    if cost_matrix is not None:
+        distance = cost_matrix.item
+
+    return sum(distance(*[layout[q] for q in gate['partition'][0]])
                for gate in gates[:max_gates]
                if gate['partition'] and len(gate['partition'][0]) == 2)
 
@@ -279,10 +296,9 @@ def _transform_gate_for_layout(gate, layout):
 
     mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
 
-    # Workaround until #1816, apply mapped to qargs to both DAGNode and op
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
     mapped_qargs = [(device_qreg, layout[a]) for a in mapped_op_node.qargs]
-    mapped_op_node.qargs = mapped_op_node.op.qargs = mapped_qargs
+    mapped_op_node.qargs = mapped_qargs
 
     mapped_op_node.pop('name')
 
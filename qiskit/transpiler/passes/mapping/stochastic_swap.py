@@ -18,7 +18,7 @@ from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
-from qiskit.mapper import Layout
+from qiskit.mapper import ErrorDistance, Layout
 from .barrier_before_final_measurements import BarrierBeforeFinalMeasurements
 # pylint: disable=no-name-in-module, import-error
 from .cython.stochastic_swap.utils import nlayout_from_layout
@@ -44,7 +44,7 @@ class StochasticSwap(TransformationPass):
     """
 
     def __init__(self, coupling_map, initial_layout=None,
-                 trials=20, seed=None):
+                 trials=20, seed=None, backend_prop=None):
         """
         Map a DAGCircuit onto a `coupling_map` using swap gates.
 
@@ -68,6 +68,9 @@ class StochasticSwap(TransformationPass):
             initial_layout (Layout): initial layout of qubits in mapping
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            backend_prop (BackendProperties): if given, the swaps are chosen
+                by the error-weighted routing cost of the backend, instead of
+                the distance in the coupling map only.
         """
         super().__init__()
         self.coupling_map = coupling_map
@@ -75,6 +78,8 @@ class StochasticSwap(TransformationPass):
         self.input_layout = None
         self.trials = trials
         self.seed = seed
+        self.backend_prop = backend_prop
+        self.cost_matrix = None
         self.qregs = None
         self.rng = None
         self.requires.append(BarrierBeforeFinalMeasurements())
@@ -114,6 +119,9 @@ class StochasticSwap(TransformationPass):
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
         self.rng = np.random.RandomState(self.seed)
         logger.debug("StochasticSwap RandomState seeded with seed=%s", self.seed)
+        if self.backend_prop is not None:
+            self.cost_matrix = ErrorDistance.from_backend_properties(
+                self.backend_prop).routing_cost(self.coupling_map)
 
         new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
         # self.property_set["layout"] = self.initial_layout
@@ -156,7 +164,7 @@ class StochasticSwap(TransformationPass):
         return _layer_permutation(layer_partition, self.initial_layout,
                                   layout, qubit_subset,
                                   coupling, trials,
-                                  self.qregs, self.rng)
+                                  self.qregs, self.rng, self.cost_matrix)
 
     def _layer_update(self, i, first_layer, best_layout, best_depth,
                       best_circuit, layer_list):
@@ -388,7 +396,7 @@ class StochasticSwap(TransformationPass):
 
 
 def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
-                       coupling, trials, qregs, rng):
+                       coupling, trials, qregs, rng, cost_matrix=None):
     """Find a swap circuit that implements a permutation for this layer.
 
     Args:
@@ -407,6 +415,9 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
         trials (int): Number of attempts the randomized algorithm makes.
         qregs (OrderedDict): Ordered dict of registers from input DAG.
         rng (RandomState): Random number generator.
+        cost_matrix (ndarray): cost of the two-qubit gates between physical
+            qubits, that the swaps minimize. Defaults to the distance in the
+            coupling map.
 
     Returns:
         Tuple: success_flag, best_circuit, best_depth, best_layout, trivial_flag
@@ -449,7 +460,9 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
     best_circuit = None  # initialize best swap circuit
     best_layout = None  # initialize best final layout
 
-    cdist2 = coupling._dist_matrix**2
+    if cost_matrix is None:
+        cost_matrix = coupling._dist_matrix
+    cdist2 = cost_matrix**2
     # Scaling matrix
     scale = np.zeros((num_qubits, num_qubits))
 
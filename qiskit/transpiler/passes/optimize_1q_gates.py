@@ -12,6 +12,7 @@ a single gate.
 """
 
 import numpy as np
+import sympy
 
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.extensions.standard.u1 import U1Gate
@@ -36,131 +37,37 @@ class Optimize1qGates(TransformationPass):
 
     def run(self, dag):
         """Return a new circuit that has been optimized."""
-        runs = dag.collect_runs(["u1", "u2", "u3", "id"])
+        runs = [numeric_run for run in dag.collect_runs(["u1", "u2", "u3", "id"])
+                for numeric_run in _numeric_runs(run)]
+        results = {}
+        # Runs that need a general composition of u3 gates, with the u3 parameters
+        # of the product of their first nodes and their remaining nodes. They are
+        # composed afterwards, all together.
+        pending = []
         for run in runs:
             right_name = "u1"
             right_parameters = (0, 0, 0)  # (theta, phi, lambda)
 
-            for current_node in run:
-                left_name = current_node.name
-                if (current_node.condition is not None
-                        or len(current_node.qargs) != 1
-                        or left_name not in ["u1", "u2", "u3", "id"]):
-                    raise TranspilerError("internal error")
-                if left_name == "u1":
-                    left_parameters = (0, 0, current_node.op.params[0])
-                elif left_name == "u2":
-                    left_parameters = (np.pi / 2, current_node.op.params[0],
-                                       current_node.op.params[1])
-                elif left_name == "u3":
-                    left_parameters = tuple(current_node.op.params)
-                else:
-                    left_name = "u1"  # replace id with u1
-                    left_parameters = (0, 0, 0)
-                # If there are any sympy objects coming from the gate convert
-                # to numpy.
-                left_parameters = tuple([float(x) for x in left_parameters])
-                # Compose gates
-                name_tuple = (left_name, right_name)
-                if name_tuple == ("u1", "u1"):
-                    # u1(lambda1) * u1(lambda2) = u1(lambda1 + lambda2)
-                    right_parameters = (0, 0, right_parameters[2] +
-                                        left_parameters[2])
-                elif name_tuple == ("u1", "u2"):
-                    # u1(lambda1) * u2(phi2, lambda2) = u2(phi2 + lambda1, lambda2)
-                    right_parameters = (np.pi / 2, right_parameters[1] +
-                                        left_parameters[2], right_parameters[2])
-                elif name_tuple == ("u2", "u1"):
-                    # u2(phi1, lambda1) * u1(lambda2) = u2(phi1, lambda1 + lambda2)
-                    right_name = "u2"
-                    right_parameters = (np.pi / 2, left_parameters[1],
-                                        right_parameters[2] + left_parameters[2])
-                elif name_tuple == ("u1", "u3"):
-                    # u1(lambda1) * u3(theta2, phi2, lambda2) =
-                    #     u3(theta2, phi2 + lambda1, lambda2)
-                    right_parameters = (right_parameters[0], right_parameters[1] +
-                                        left_parameters[2], right_parameters[2])
-                elif name_tuple == ("u3", "u1"):
-                    # u3(theta1, phi1, lambda1) * u1(lambda2) =
-                    #     u3(theta1, phi1, lambda1 + lambda2)
-                    right_name = "u3"
-                    right_parameters = (left_parameters[0], left_parameters[1],
-                                        right_parameters[2] + left_parameters[2])
-                elif name_tuple == ("u2", "u2"):
-                    # Using Ry(pi/2).Rz(2*lambda).Ry(pi/2) =
-                    #    Rz(pi/2).Ry(pi-2*lambda).Rz(pi/2),
-                    # u2(phi1, lambda1) * u2(phi2, lambda2) =
-                    #    u3(pi - lambda1 - phi2, phi1 + pi/2, lambda2 + pi/2)
-                    right_name = "u3"
-                    right_parameters = (np.pi - left_parameters[2] -
-                                        right_parameters[1], left_parameters[1] +
-                                        np.pi / 2, right_parameters[2] +
-                                        np.pi / 2)
-                elif name_tuple[1] == "nop":
-                    right_name = left_name
-                    right_parameters = left_parameters
-                else:
-                    # For composing u3's or u2's with u3's, use
-                    # u2(phi, lambda) = u3(pi/2, phi, lambda)
-                    # together with the qiskit.mapper.compose_u3 method.
-                    right_name = "u3"
-                    # Evaluate the symbolic expressions for efficiency
-                    right_parameters = Optimize1qGates.compose_u3(left_parameters[0],
-                                                                  left_parameters[1],
-                                                                  left_parameters[2],
-                                                                  right_parameters[0],
-                                                                  right_parameters[1],
-                                                                  right_parameters[2])
-                    # Why evalf()? This program:
-                    #   OPENQASM 2.0;
-                    #   include "qelib1.inc";
-                    #   qreg q[2];
-                    #   creg c[2];
-                    #   u3(0.518016983430947*pi,1.37051598592907*pi,1.36816383603222*pi) q[0];
-                    #   u3(1.69867232277986*pi,0.371448347747471*pi,0.461117217930936*pi) q[0];
-                    #   u3(0.294319836336836*pi,0.450325871124225*pi,1.46804720442555*pi) q[0];
-                    #   measure q -> c;
-                    # took >630 seconds (did not complete) to optimize without
-                    # calling evalf() at all, 19 seconds to optimize calling
-                    # evalf() AFTER compose_u3, and 1 second to optimize
-                    # calling evalf() BEFORE compose_u3.
-                # 1. Here down, when we simplify, we add f(theta) to lambda to
-                # correct the global phase when f(theta) is 2*pi. This isn't
-                # necessary but the other steps preserve the global phase, so
-                # we continue in that manner.
-                # 2. The final step will remove Z rotations by 2*pi.
-                # 3. Note that is_zero is true only if the expression is exactly
-                # zero. If the input expressions have already been evaluated
-                # then these final simplifications will not occur.
-                # TODO After we refactor, we should have separate passes for
-                # exact and approximate rewriting.
-
-                # Y rotation is 0 mod 2*pi, so the gate is a u1
-                if np.mod(right_parameters[0], (2 * np.pi)) == 0 \
-                        and right_name != "u1":
-                    right_name = "u1"
-                    right_parameters = (0, 0, right_parameters[1] +
-                                        right_parameters[2] +
-                                        right_parameters[0])
-                # Y rotation is pi/2 or -pi/2 mod 2*pi, so the gate is a u2
-                if right_name == "u3":
-                    # theta = pi/2 + 2*k*pi
-                    if np.mod((right_parameters[0] - np.pi / 2), (2 * np.pi)) == 0:
-                        right_name = "u2"
-                        right_parameters = (np.pi / 2, right_parameters[1],
-                                            right_parameters[2] +
-                                            (right_parameters[0] - np.pi / 2))
-                    # theta = -pi/2 + 2*k*pi
-                    if np.mod((right_parameters[0] + np.pi / 2), (2 * np.pi)) == 0:
-                        right_name = "u2"
-                        right_parameters = (np.pi / 2, right_parameters[1] +
-                                            np.pi, right_parameters[2] -
-                                            np.pi + (right_parameters[0] +
-                                                     np.pi / 2))
-                # u1 and lambda is 0 mod 2*pi so gate is nop (up to a global phase)
-                if right_name == "u1" and np.mod(right_parameters[2], (2 * np.pi)) == 0:
-                    right_name = "nop"
+            for index, current_node in enumerate(run):
+                left_name, left_parameters = _node_parameters(current_node)
+                composed = _compose_exact(left_name, left_parameters,
+                                          right_name, right_parameters)
+                if composed is None:
+                    pending.append((run, right_parameters, run[index:]))
+                    break
+                right_name, right_parameters = _simplify(*composed)
+            else:
+                results[run] = (right_name, right_parameters)
 
+        if pending:
+            sequences = [[right_parameters] +
+                         [_node_parameters(node)[1] for node in nodes]
+                         for _, right_parameters, nodes in pending]
+            for (run, _, _), parameters in zip(pending, _compose_u3_sequences(sequences)):
+                results[run] = _simplify("u3", parameters)
+
+        for run in runs:
+            right_name, right_parameters = results[run]
             # Replace the the first node in the run with a dummy DAG which contains a dummy
             # qubit. The name is irrelevant, because substitute_node_with_dag will take care of
             # putting it in the right place.
@@ -230,3 +137,192 @@ class Optimize1qGates(TransformationPass):
         out_angles = tuple(0 if np.abs(angle) < _CHOP_THRESHOLD else angle
                            for angle in out_angles)
         return out_angles
+
+
+def _has_variables(node):
+    """Return True if a param of the node depends on variables."""
+    return any(isinstance(param, sympy.Basic) and param.free_symbols
+               for param in node.op.params)
+
+
+def _numeric_runs(run):
+    """Split a run at the nodes whose params depend on variables, which are
+    left as they are, since they cannot be composed numerically.
+
+    Returns:
+        list(tuple(DAGNode)): the runs of nodes with numeric params.
+    """
+    numeric_runs = [[]]
+    for node in run:
+        if _has_variables(node):
+            numeric_runs.append([])
+        else:
+            numeric_runs[-1].append(node)
+    return [tuple(numeric_run) for numeric_run in numeric_runs if numeric_run]
+
+
+def _node_parameters(node):
+    """Return the name and the (theta, phi, lambda) parameters of a node of a run,
+    an id being a u1.
+
+    Returns:
+        tuple(str, tuple(float)): the name and the parameters of the node.
+
+    Raises:
+        TranspilerError: if the node cannot be part of a run.
+    """
+    name = node.name
+    if (node.condition is not None
+            or len(node.qargs) != 1
+            or name not in ["u1", "u2", "u3", "id"]):
+        raise TranspilerError("internal error")
+    if name == "u1":
+        parameters = (0, 0, node.op.params[0])
+    elif name == "u2":
+        parameters = (np.pi / 2, node.op.params[0], node.op.params[1])
+    elif name == "u3":
+        parameters = tuple(node.op.params)
+    else:
+        name = "u1"  # replace id with u1
+        parameters = (0, 0, 0)
+    # If there are any sympy objects coming from the gate convert
+    # to numpy.
+    return name, tuple([float(x) for x in parameters])
+
+
+# the products ``left * right`` of gates that have a closed form, by names,
+# as functions of the parameters of both gates
+_EXACT_COMPOSITIONS = {
+    # u1(lambda1) * u1(lambda2) = u1(lambda1 + lambda2)
+    ("u1", "u1"): lambda left, right: ("u1", (0, 0, right[2] + left[2])),
+    # u1(lambda1) * u2(phi2, lambda2) = u2(phi2 + lambda1, lambda2)
+    ("u1", "u2"): lambda left, right: ("u2", (np.pi / 2, right[1] + left[2], right[2])),
+    # u2(phi1, lambda1) * u1(lambda2) = u2(phi1, lambda1 + lambda2)
+    ("u2", "u1"): lambda left, right: ("u2", (np.pi / 2, left[1], right[2] + left[2])),
+    # u1(lambda1) * u3(theta2, phi2, lambda2) =
+    #     u3(theta2, phi2 + lambda1, lambda2)
+    ("u1", "u3"): lambda left, right: ("u3", (right[0], right[1] + left[2], right[2])),
+    # u3(theta1, phi1, lambda1) * u1(lambda2) =
+    #     u3(theta1, phi1, lambda1 + lambda2)
+    ("u3", "u1"): lambda left, right: ("u3", (left[0], left[1], right[2] + left[2])),
+    # Using Ry(pi/2).Rz(2*lambda).Ry(pi/2) =
+    #    Rz(pi/2).Ry(pi-2*lambda).Rz(pi/2),
+    # u2(phi1, lambda1) * u2(phi2, lambda2) =
+    #    u3(pi - lambda1 - phi2, phi1 + pi/2, lambda2 + pi/2)
+    ("u2", "u2"): lambda left, right: ("u3", (np.pi - left[2] - right[1],
+                                              left[1] + np.pi / 2, right[2] + np.pi / 2)),
+}
+
+
+def _compose_exact(left_name, left_parameters, right_name, right_parameters):
+    """Return the name and parameters of the gate ``left * right``, if they
+    have a closed form, else None.
+    """
+    compose = _EXACT_COMPOSITIONS.get((left_name, right_name))
+    if compose is not None:
+        return compose(left_parameters, right_parameters)
+    if right_name == "nop":
+        return left_name, left_parameters
+    # Composing u3's or u2's with u3's, using u2(phi, lambda) = u3(pi/2, phi, lambda),
+    # is left to _compose_u3_sequences.
+    return None
+
+
+def _simplify(name, parameters):
+    """Return the name and parameters of the simplest of u1, u2, u3 and nop
+    that is equal to the gate ``name`` with ``parameters``.
+    """
+    # 1. Here down, when we simplify, we add f(theta) to lambda to
+    # correct the global phase when f(theta) is 2*pi. This isn't
+    # necessary but the other steps preserve the global phase, so
+    # we continue in that manner.
+    # 2. The final step will remove Z rotations by 2*pi.
+    # 3. Note that is_zero is true only if the expression is exactly
+    # zero. If the input expressions have already been evaluated
+    # then these final simplifications will not occur.
+    # TODO After we refactor, we should have separate passes for
+    # exact and approximate rewriting.
+
+    # Y rotation is 0 mod 2*pi, so the gate is a u1
+    if np.mod(parameters[0], (2 * np.pi)) == 0 and name != "u1":
+        name = "u1"
+        parameters = (0, 0, parameters[1] + parameters[2] + parameters[0])
+    # Y rotation is pi/2 or -pi/2 mod 2*pi, so the gate is a u2
+    if name == "u3":
+        # theta = pi/2 + 2*k*pi
+        if np.mod((parameters[0] - np.pi / 2), (2 * np.pi)) == 0:
+            name = "u2"
+            parameters = (np.pi / 2, parameters[1],
+                          parameters[2] + (parameters[0] - np.pi / 2))
+        # theta = -pi/2 + 2*k*pi
+        if np.mod((parameters[0] + np.pi / 2), (2 * np.pi)) == 0:
+            name = "u2"
+            parameters = (np.pi / 2, parameters[1] + np.pi,
+                          parameters[2] - np.pi + (parameters[0] + np.pi / 2))
+    # u1 and lambda is 0 mod 2*pi so gate is nop (up to a global phase)
+    if name == "u1" and np.mod(parameters[2], (2 * np.pi)) == 0:
+        name = "nop"
+    return name, parameters
+
+
+def _compose_u3_sequences(sequences):
+    """Return the (theta, phi, lambda) parameters of the products of sequences
+    of u3 gates, each given in circuit order, up to a global phase.
+
+    The gates of all the sequences are converted to unit quaternions at once,
+    and the k-th gates of all the sequences are multiplied together, as arrays.
+    """
+    lengths = np.array([len(sequence) for sequence in sequences])
+    quaternions = _u3_quaternions(np.array([parameters for sequence in sequences
+                                            for parameters in sequence], dtype=float))
+    offsets = np.cumsum(lengths) - lengths
+    products = quaternions[offsets]
+    for step in range(1, lengths.max()):
+        active = np.flatnonzero(lengths > step)
+        products[active] = _quaternion_products(quaternions[offsets[active] + step],
+                                                products[active])
+    # chop the rounding errors first, as angles are ill-defined in degenerate cases
+    products[np.abs(products) < _CHOP_THRESHOLD] = 0
+    angles = _zyz_angles(products)
+    angles[np.abs(angles) < _CHOP_THRESHOLD] = 0
+    # and snap theta to the multiples of pi/2, for the simplifications to u1 and u2
+    quarter_turns = np.round(angles[:, 0] / (np.pi / 2))
+    snap = np.abs(angles[:, 0] - quarter_turns * (np.pi / 2)) < _CHOP_THRESHOLD
+    angles[snap, 0] = quarter_turns[snap] * (np.pi / 2)
+    return [tuple(parameters) for parameters in angles.tolist()]
+
+
+def _u3_quaternions(parameters):
+    """Return the unit quaternions (w, x, y, z) of u3 gates, given an array of
+    their parameters, where u3(theta, phi, lambda) = Rz(phi).Ry(theta).Rz(lambda)
+    up to a global phase, and (w, x, y, z) stands for w - i(xX + yY + zZ).
+    """
+    theta, phi, lam = parameters.T
+    cos = np.cos(theta / 2)
+    sin = np.sin(theta / 2)
+    return np.stack([cos * np.cos((phi + lam) / 2),
+                     -sin * np.sin((phi - lam) / 2),
+                     sin * np.cos((phi - lam) / 2),
+                     cos * np.sin((phi + lam) / 2)], axis=1)
+
+
+def _quaternion_products(left, right):
+    """Return the Hamilton products of two arrays of quaternions."""
+    left_w, left_x, left_y, left_z = left.T
+    right_w, right_x, right_y, right_z = right.T
+    return np.stack([left_w * right_w - left_x * right_x - left_y * right_y - left_z * right_z,
+                     left_w * right_x + left_x * right_w + left_y * right_z - left_z * right_y,
+                     left_w * right_y - left_x * right_z + left_y * right_w + left_z * right_x,
+                     left_w * right_z + left_x * right_y - left_y * right_x + left_z * right_w],
+                    axis=1)
+
+
+def _zyz_angles(quaternions):
+    """Return the (theta, phi, lambda) angles of unit quaternions, with theta
+    in [0, pi], such that they are the rotations Rz(phi).Ry(theta).Rz(lambda).
+    """
+    w, x, y, z = quaternions.T
+    theta = 2 * np.arctan2(np.hypot(x, y), np.hypot(w, z))
+    half_sum = np.arctan2(z, w)
+    half_difference = np.arctan2(-x, y)
+    return np.stack([theta, half_sum + half_difference, half_sum - half_difference], axis=1)
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Pass for peep-hole optimization of the circuit with a worklist.
+
+Local rewrites are applied to the nodes of the DAG, and only the neighbours of
+the rewritten nodes are visited again, until no rewrite applies:
+
+- a u1, u2, u3 or id gate is merged with the next one on its qubit, and is
+  removed if it is the identity. A u1 gate is merged past the gates that
+  commute with it, such as the controls of cx gates. The gates whose params
+  depend on variables are left as they are,
+- a self-inverse gate is cancelled with the next identical gate on the same
+  qubits, if the gates in between commute with it,
+- a barrier is removed if all its qubits are barred by an adjacent barrier.
+
+Whether gates commute is decided by the rule table of the commutation analysis
+only, without computing their matrices.
+
+After a first sweep over the circuit, the work is proportional to the number of
+rewrites, instead of the size of the circuit times the number of rounds of the
+other passes until the depth reaches a fixed point.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from qiskit.extensions.standard.u1 import U1Gate
+from qiskit.extensions.standard.u2 import U2Gate
+from qiskit.extensions.standard.u3 import U3Gate
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes.commutation_analysis import _rule_commute
+from qiskit.transpiler.passes.optimize_1q_gates import (_CHOP_THRESHOLD, _node_parameters,
+                                                        _compose_exact, _compose_u3_sequences,
+                                                        _simplify, _has_variables)
+
+_ONE_QUBIT_NAMES = ("u1", "u2", "u3", "id")
+_SELF_INVERSE_NAMES = ("cx", "cy", "cz", "h", "x", "y", "z")
+
+
+class PeepholeOptimization(TransformationPass):
+    """Merge single qubit gates, cancel self-inverse gates through commuting
+    gates and remove redundant barriers, until none of these applies."""
+
+    def run(self, dag):
+        """Run the peephole optimization on the circuit.
+
+        Args:
+            dag (DAGCircuit): the directed acyclic graph to run on.
+        Returns:
+            DAGCircuit: Transformed DAG.
+        """
+        worklist = deque(dag.topological_op_nodes())
+        queued = set(worklist)
+        while worklist:
+            node = worklist.popleft()
+            queued.remove(node)
+            if not dag.multi_graph.has_node(node):
+                # removed by a rewrite of another node
+                continue
+            if node.name in _SELF_INVERSE_NAMES:
+                revisit = _cancel_inverse(dag, node)
+            elif node.name in _ONE_QUBIT_NAMES:
+                revisit = _merge_one_qubit(dag, node)
+            elif node.name == 'barrier':
+                revisit = _remove_barrier(dag, node)
+            else:
+                continue
+            for other in revisit:
+                if other.type == 'op' and other not in queued:
+                    worklist.append(other)
+                    queued.add(other)
+        return dag
+
+
+def _cancel_inverse(dag, node):
+    """Remove the node and the next identical node on its qubits, if the nodes
+    in between commute with it.
+
+    Returns:
+        list(DAGNode): the nodes to visit again.
+    """
+    if node.condition is not None or node.cargs:
+        return []
+    partner = None
+    for wire in node.qargs:
+        current = _successor(dag, node, wire)
+        while current.type == 'op' and not (current.name == node.name
+                                            and current.qargs == node.qargs
+                                            and current.condition is None):
+            if current.condition is not None or not _commute(node, current):
+                return []
+            current = _successor(dag, current, wire)
+        if current.type != 'op' or partner not in (None, current):
+            return []
+        partner = current
+    revisit = []
+    for removed in [node, partner]:
+        # the nearest self-inverse gates before may now find their partner
+        for wire in removed.qargs:
+            current = _predecessor(dag, removed, wire)
+            while current.type == 'op' and current is not node:
+                revisit.append(current)
+                if current.name in _SELF_INVERSE_NAMES:
+                    break
+                current = _predecessor(dag, current, wire)
+    return _remove(dag, [node, partner]) + revisit
+
+
+def _merge_one_qubit(dag, node):
+    """Merge a u1, u2, u3 or id node into the next one on its qubit, or simplify
+    it alone. A u1 node is merged past the nodes that commute with it.
+
+    Returns:
+        list(DAGNode): the nodes to visit again.
+    """
+    if node.condition is not None or _has_variables(node):
+        return []
+    name, parameters = _node_parameters(node)
+    wire = node.qargs[0]
+    successor = _successor(dag, node, wire)
+    if name == "u1":
+        while successor.type == 'op' and successor.name not in _ONE_QUBIT_NAMES \
+                and successor.condition is None and _commute(node, successor):
+            successor = _successor(dag, successor, wire)
+    if successor.type != 'op' or successor.name not in _ONE_QUBIT_NAMES \
+            or successor.condition is not None or _has_variables(successor):
+        name, parameters = _simplify_chopped(name, parameters)
+        if name == node.name:
+            return []
+        if name == "nop":
+            return _remove(dag, [node])
+        _substitute(dag, node, name, parameters)
+        return [node] + _neighbours(dag, [node])
+    left_name, left_parameters = _node_parameters(successor)
+    composed = _compose_exact(left_name, left_parameters, name, parameters)
+    if composed is None:
+        composed = ("u3", _compose_u3_sequences([[parameters, left_parameters]])[0])
+    name, parameters = _simplify_chopped(*composed)
+    if name == "nop":
+        return _remove(dag, [node, successor])
+    revisit = _remove(dag, [node])
+    _substitute(dag, successor, name, parameters)
+    return revisit + [successor] + _neighbours(dag, [successor])
+
+
+def _simplify_chopped(name, parameters):
+    """Simplify a u1, u2 or u3 gate as Optimize1qGates does, ignoring the
+    rounding errors of its angles, for a gate and its inverse to merge to a nop.
+    """
+    name, parameters = _simplify(name, tuple(0 if abs(angle) < _CHOP_THRESHOLD else angle
+                                             for angle in parameters))
+    if name == "u1" and \
+            abs(np.mod(parameters[2] + np.pi, 2 * np.pi) - np.pi) < _CHOP_THRESHOLD:
+        name = "nop"
+    return name, parameters
+
+
+def _substitute(dag, node, name, parameters):
+    """Replace the operation of a node with a u1, u2 or u3 gate."""
+    if name == "u1":
+        dag.substitute_node(node, U1Gate(parameters[2]))
+    elif name == "u2":
+        dag.substitute_node(node, U2Gate(parameters[1], parameters[2]))
+    else:
+        dag.substitute_node(node, U3Gate(*parameters))
+
+
+def _remove_barrier(dag, node):
+    """Remove a barrier node if all its qubits are barred by the next barrier,
+    or by the previous one.
+
+    Returns:
+        list(DAGNode): the nodes to visit again.
+    """
+    for adjacent in dag.multi_graph.successors(node), dag.multi_graph.predecessors(node):
+        adjacent = set(adjacent)
+        if len(adjacent) == 1 and adjacent.pop().name == 'barrier':
+            return _remove(dag, [node])
+    return []
+
+
+def _commute(node, other):
+    """Return whether two nodes on a common qubit commute, according to the
+    rule table of the commutation analysis, without computing their matrices."""
+    return _rule_commute(node.name, node.qargs, other.name, other.qargs)
+
+
+def _successor(dag, node, wire):
+    """Return the successor of a node on a wire."""
+    for _, successor, data in dag.multi_graph.out_edges(node, data=True):
+        if data['wire'] == wire:
+            return successor
+    return None
+
+
+def _predecessor(dag, node, wire):
+    """Return the predecessor of a node on a wire."""
+    for predecessor, _, data in dag.multi_graph.in_edges(node, data=True):
+        if data['wire'] == wire:
+            return predecessor
+    return None
+
+
+def _neighbours(dag, nodes):
+    """Return the predecessors and successors of nodes, sorted by node id."""
+    neighbours = set()
+    for node in nodes:
+        neighbours.update(dag.multi_graph.predecessors(node))
+        neighbours.update(dag.multi_graph.successors(node))
+    return sorted(neighbours.difference(nodes))
+
+
+def _remove(dag, nodes):
+    """Remove op nodes, and return their neighbours."""
+    neighbours = _neighbours(dag, nodes)
+    for node in nodes:
+        dag.remove_op_node(node)
+    return neighbours
@@ -7,15 +7,25 @@
 
 """Pass for unrolling a circuit to a given basis."""
 
+import copy
+
+from qiskit.circuit.instruction import Instruction
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.exceptions import QiskitError
 
+# TODO: this is legacy behavior
+_BASIC_INSTRUCTIONS = ('measure', 'reset', 'barrier', 'snapshot')
+
 
 class Unroller(TransformationPass):
     """
     Unroll (expand) non-basis, non-opaque instructions recursively
     to a desired basis, using decomposition rules defined for each instruction.
+
+    The unrolled decomposition of each distinct instruction is computed once
+    and cached as a template of basis instructions acting on the instruction's
+    own wires, which is then instantiated for every node by remapping wires.
     """
 
     def __init__(self, basis):
@@ -25,6 +35,8 @@ class Unroller(TransformationPass):
         """
         super().__init__()
         self.basis = basis
+        # (type, name, params, num_qubits, num_clbits) -> template, see _template()
+        self._templates = {}
 
     def run(self, dag):
         """Expand all op nodes to the given basis.
@@ -40,28 +52,83 @@ class Unroller(TransformationPass):
         Returns:
             DAGCircuit: output unrolled dag
         """
+        if all(self._is_basis(node.op) for node in dag.op_nodes()):
+            return dag
+
+        unrolled_dag = DAGCircuit()
+        unrolled_dag.name = dag.name
+        for qreg in dag.qregs.values():
+            unrolled_dag.add_qreg(qreg)
+        for creg in dag.cregs.values():
+            unrolled_dag.add_creg(creg)
+
         # Walk through the DAG and expand each non-basis node
-        for node in dag.op_nodes():
-            basic_insts = ['measure', 'reset', 'barrier', 'snapshot']
-            if node.name in basic_insts:  # TODO: this is legacy behavior
+        for node in dag.topological_op_nodes():
+            if self._is_basis(node.op):
+                unrolled_dag.apply_operation_back(node.op, node.qargs, node.cargs,
+                                                  node.condition)
                 continue
-            if node.name in self.basis:  # If already a base, ignore.
+
+            for op, qubits, clbits in self._template(node.op):
+                # shared instances of parameterless gates are not copied
+                if node.condition is not None or op.flyweight() is not op:
+                    op = copy.copy(op)
+                    op.control = node.condition
+                unrolled_dag.apply_operation_back(op,
+                                                  [node.qargs[i] for i in qubits],
+                                                  [node.cargs[i] for i in clbits],
+                                                  node.condition)
+        return unrolled_dag
+
+    def _is_basis(self, op):
+        """Return True if ``op`` is left untouched by the unrolling."""
+        return op.name in _BASIC_INSTRUCTIONS or op.name in self.basis
+
+    def _template(self, op):
+        """Return the unrolled decomposition of ``op``.
+
+        The decomposition is a list of ``(op, qubits, clbits)`` tuples of basis
+        instructions, where ``qubits`` and ``clbits`` are the indices of the
+        wires of ``op`` they act on. It is cached when the definition of ``op``
+        only depends on its type, name and params.
+
+        Returns:
+            list(tuple): the ``(op, qubits, clbits)`` tuples of the decomposition.
+
+        Raises:
+            QiskitError: if ``op`` has no decomposition rule.
+        """
+        key = None
+        if type(op)._define is not Instruction._define:
+            key = (type(op), op.name, tuple(op.params), op.num_qubits, op.num_clbits)
+            try:
+                return self._templates[key]
+            except KeyError:
+                pass
+            except TypeError:  # unhashable params, such as arrays
+                key = None
+
+        # TODO: allow choosing other possible decompositions
+        rule = op.definition
+        if not rule:
+            raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
+                              "No rule to expand instruction %s." %
+                              (str(self.basis), op.name))
+
+        template = []
+        for inst, qargs, cargs in rule:
+            # the rule is defined on registers of the same width as op
+            qubits = [qubit[1] for qubit in qargs]
+            clbits = [clbit[1] for clbit in cargs]
+            if self._is_basis(inst):
+                template.append((inst.flyweight() or inst, qubits, clbits))
                 continue
+            # recursively unroll ops
+            for sub_inst, sub_qubits, sub_clbits in self._template(inst):
+                template.append((sub_inst,
+                                 [qubits[i] for i in sub_qubits],
+                                 [clbits[i] for i in sub_clbits]))
 
-            # TODO: allow choosing other possible decompositions
-            rule = node.op.definition
-            if not rule:
-                raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
-                                  "No rule to expand instruction %s." %
-                                  (str(self.basis), node.op.name))
-
-            # hacky way to build a dag on the same register as the rule is defined
-            # TODO: need anonymous rules to address wires by index
-            decomposition = DAGCircuit()
-            decomposition.add_qreg(rule[0][1][0][0])
-            for inst in rule:
-                decomposition.apply_operation_back(*inst)
-
-            unrolled_dag = self.run(decomposition)  # recursively unroll ops
-            dag.substitute_node_with_dag(node, unrolled_dag)
-        return dag
+        if key is not None:
+            self._templates[key] = template
+        return template
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Preset pass managers for the optimization levels of the transpiler.
+
+Each level unrolls the circuit to the basis and, if a coupling map is given,
+maps it to the coupling map with LegacySwap, then simplifies the mapped circuit
+more and more:
+
+- level 0 maps with a single trial of the swap mapper, and does not simplify
+  the circuit,
+- level 1 maps with 5 trials, then merges the adjacent single qubit gates and
+  cancels the adjacent CNOTs, in one sweep,
+- level 2 maps with 20 trials, then runs PeepholeOptimization, which also
+  cancels the gates through the gates that commute with them, until no
+  simplification applies,
+- level 3 also re-synthesizes the blocks of two-qubit gates with fewer CNOTs,
+  before fixing the direction of the CNOTs.
+"""
+
+from qiskit.extensions.standard import SwapGate
+from qiskit.mapper import CouplingMap
+from qiskit.transpiler.passmanager import PassManager
+from qiskit.transpiler.exceptions import TranspilerError
+
+from .passes.unroller import Unroller
+from .passes.decompose import Decompose
+from .passes.cx_cancellation import CXCancellation
+from .passes.optimize_1q_gates import Optimize1qGates
+from .passes.peephole_optimization import PeepholeOptimization
+from .passes.consolidate_blocks import ConsolidateBlocks
+from .passes.mapping.cx_direction import CXDirection
+from .passes.mapping.legacy_swap import LegacySwap
+from .passes.mapping.enlarge_with_ancilla import EnlargeWithAncilla
+from .passes.mapping.extend_layout import ExtendLayout
+
+# the basis of the mapped circuit, for the simplification passes
+_MAPPED_BASIS = ['u1', 'u2', 'u3', 'id', 'cx']
+
+
+def level_0_pass_manager(basis_gates, coupling_map=None, initial_layout=None,
+                         seed_mapper=None):
+    """Return the pass manager of level 0: unroll and map the circuit only.
+
+    Args:
+        basis_gates (list[str]): list of basis gate names supported by the target.
+        coupling_map (list): coupling map to target in mapping, if any.
+        initial_layout (Layout): initial layout of qubits in mapping.
+        seed_mapper (int): random seed for the swap mapper.
+
+    Returns:
+        PassManager: the pass manager of the level.
+    """
+    pass_manager = _mapping_pass_manager(basis_gates, coupling_map, initial_layout,
+                                         seed_mapper, trials=1)
+    if coupling_map:
+        pass_manager.append(CXDirection(CouplingMap(coupling_map)))
+        pass_manager.append(Unroller(_MAPPED_BASIS))
+    return pass_manager
+
+
+def level_1_pass_manager(basis_gates, coupling_map=None, initial_layout=None,
+                         seed_mapper=None):
+    """Return the pass manager of level 1: also merge the adjacent single qubit
+    gates and cancel the adjacent CNOTs, in one sweep.
+
+    Args:
+        basis_gates (list[str]): list of basis gate names supported by the target.
+        coupling_map (list): coupling map to target in mapping, if any.
+        initial_layout (Layout): initial layout of qubits in mapping.
+        seed_mapper (int): random seed for the swap mapper.
+
+    Returns:
+        PassManager: the pass manager of the level.
+    """
+    pass_manager = _mapping_pass_manager(basis_gates, coupling_map, initial_layout,
+                                         seed_mapper, trials=5)
+    if coupling_map:
+        pass_manager.append(CXDirection(CouplingMap(coupling_map)))
+        pass_manager.append(Unroller(_MAPPED_BASIS))
+        pass_manager.append([Optimize1qGates(), CXCancellation()])
+    return pass_manager
+
+
+def level_2_pass_manager(basis_gates, coupling_map=None, initial_layout=None,
+                         seed_mapper=None):
+    """Return the pass manager of level 2: also cancel the gates through the
+    gates that commute with them, until no simplification applies.
+
+    Args:
+        basis_gates (list[str]): list of basis gate names supported by the target.
+        coupling_map (list): coupling map to target in mapping, if any.
+        initial_layout (Layout): initial layout of qubits in mapping.
+        seed_mapper (int): random seed for the swap mapper.
+
+    Returns:
+        PassManager: the pass manager of the level.
+    """
+    pass_manager = _mapping_pass_manager(basis_gates, coupling_map, initial_layout,
+                                         seed_mapper, trials=20)
+    if coupling_map:
+        pass_manager.append(CXDirection(CouplingMap(coupling_map)))
+        pass_manager.append(Unroller(_MAPPED_BASIS))
+        pass_manager.append(PeepholeOptimization())
+    return pass_manager
+
+
+def level_3_pass_manager(basis_gates, coupling_map=None, initial_layout=None,
+                         seed_mapper=None):
+    """Return the pass manager of level 3: also re-synthesize the blocks of
+    two-qubit gates with fewer CNOTs.
+
+    Args:
+        basis_gates (list[str]): list of basis gate names supported by the target.
+        coupling_map (list): coupling map to target in mapping, if any.
+        initial_layout (Layout): initial layout of qubits in mapping.
+        seed_mapper (int): random seed for the swap mapper.
+
+    Returns:
+        PassManager: the pass manager of the level.
+    """
+    pass_manager = _mapping_pass_manager(basis_gates, coupling_map, initial_layout,
+                                         seed_mapper, trials=20)
+    if coupling_map:
+        # the blocks keep their pair of qubits, but not the direction of their CNOTs
+        pass_manager.append(Unroller(_MAPPED_BASIS))
+        pass_manager.append(ConsolidateBlocks())
+        pass_manager.append(CXDirection(CouplingMap(coupling_map)))
+        pass_manager.append(Unroller(_MAPPED_BASIS))
+        pass_manager.append(PeepholeOptimization())
+    return pass_manager
+
+
+_PRESET_PASS_MANAGERS = [level_0_pass_manager, level_1_pass_manager,
+                         level_2_pass_manager, level_3_pass_manager]
+
+
+def preset_pass_manager(optimization_level, basis_gates, coupling_map=None,
+                        initial_layout=None, seed_mapper=None):
+    """Return the pass manager of an optimization level.
+
+    Args:
+        optimization_level (int): 0 to 3, from the fastest transpilation to the
+            most simplified circuits.
+        basis_gates (list[str]): list of basis gate names supported by the target.
+        coupling_map (list): coupling map to target in mapping, if any.
+        initial_layout (Layout): initial layout of qubits in mapping.
+        seed_mapper (int): random seed for the swap mapper.
+
+    Returns:
+        PassManager: the pass manager of the level.
+
+    Raises:
+        TranspilerError: if the optimization level does not exist.
+    """
+    if optimization_level not in range(len(_PRESET_PASS_MANAGERS)):
+        raise TranspilerError('Invalid optimization level %s, expected one of %s'
+                              % (optimization_level, list(range(len(_PRESET_PASS_MANAGERS)))))
+    return _PRESET_PASS_MANAGERS[optimization_level](basis_gates, coupling_map,
+                                                     initial_layout, seed_mapper)
+
+
+def _mapping_pass_manager(basis_gates, coupling_map, initial_layout, seed_mapper, trials):
+    """Return a pass manager that unrolls the circuit to the basis and, if a
+    coupling map is given, extends the layout to the coupling map, maps the
+    circuit with the trials of the swap mapper and decomposes the swaps."""
+    pass_manager = PassManager()
+    pass_manager.append(Unroller(basis_gates))
+    if coupling_map:
+        coupling = CouplingMap(coupling_map)
+
+        # Extend and enlarge the the dag/layout with ancillas using the full coupling map
+        pass_manager.property_set['layout'] = initial_layout
+        pass_manager.append(ExtendLayout(coupling))
+        pass_manager.append(EnlargeWithAncilla(initial_layout))
+
+        pass_manager.append(LegacySwap(coupling, initial_layout, trials=trials,
+                                       seed=seed_mapper))
+        pass_manager.append(Decompose(SwapGate))
+    return pass_manager
@@ -9,37 +9,36 @@
 import logging
 import warnings
 
+import numpy as np
+
 from qiskit.circuit import QuantumCircuit
 from qiskit.mapper import CouplingMap
 from qiskit.tools.parallel import parallel_map
 from qiskit.converters import circuit_to_dag
 from qiskit.converters import dag_to_circuit
-from qiskit.extensions.standard import SwapGate
 from qiskit.mapper.layout import Layout
-from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.exceptions import TranspilerError
 
-from .passes.unroller import Unroller
-from .passes.cx_cancellation import CXCancellation
-from .passes.decompose import Decompose
-from .passes.optimize_1q_gates import Optimize1qGates
-from .passes.fixed_point import FixedPoint
-from .passes.depth import Depth
+from .preset_passmanagers import preset_pass_manager
 from .passes.mapping.check_map import CheckMap
-from .passes.mapping.cx_direction import CXDirection
 from .passes.mapping.dense_layout import DenseLayout
 from .passes.mapping.trivial_layout import TrivialLayout
-from .passes.mapping.legacy_swap import LegacySwap
-from .passes.mapping.enlarge_with_ancilla import EnlargeWithAncilla
-from .passes.mapping.extend_layout import ExtendLayout
 
 logger = logging.getLogger(__name__)
 
 
 def transpile(circuits, backend=None, basis_gates=None, coupling_map=None,
-              initial_layout=None, seed_mapper=None, pass_manager=None):
+              initial_layout=None, seed_mapper=None, pass_manager=None,
+              num_seeds=None, cost_function=None, optimization_level=None):
     """transpile one or more circuits.
 
+    If num_seeds is given, each circuit is mapped with num_seeds seeds in
+    parallel, starting from seed_mapper, and the circuit with the lowest cost is
+    kept. Its seed is stored in the ``seed_mapper`` attribute of the circuit, to
+    transpile it again with the same result. The kept circuit costs no more
+    than the circuit mapped with seed_mapper alone; if seed_mapper is None,
+    the first seed is random, and the seeds differ from a run to the next.
+
     Args:
         circuits (QuantumCircuit or list[QuantumCircuit]): circuits to compile
         backend (BaseBackend): a backend to compile for
@@ -49,6 +48,14 @@ def transpile(circuits, backend=None, basis_gates=None, coupling_map=None,
         initial_layout (list): initial layout of qubits in mapping
         seed_mapper (int): random seed for the swap_mapper
         pass_manager (PassManager): a pass_manager for the transpiler stages
+        num_seeds (int): number of seeds of the swap mapper to try for each
+            circuit, if it is mapped to a coupling map by the default passes
+        cost_function (callable): function of a transpiled QuantumCircuit, whose
+            lowest value selects the circuit among the seeds. Default: the
+            number of cx gates, then the depth
+        optimization_level (int): how much to simplify the circuits, from 0,
+            the fastest transpilation, to 3, the most simplified circuits, if
+            no pass_manager is given. Default: 2
 
     Returns:
         QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
@@ -77,20 +84,81 @@ def transpile(circuits, backend=None, basis_gates=None, coupling_map=None,
     if initial_layout is not None and not isinstance(initial_layout, Layout):
         initial_layout = Layout(initial_layout)
 
-    circuits = parallel_map(_transpilation, circuits,
-                            task_kwargs={'basis_gates': basis_gates,
-                                         'coupling_map': coupling_map,
-                                         'initial_layout': initial_layout,
-                                         'seed_mapper': seed_mapper,
-                                         'pass_manager': pass_manager})
+    if num_seeds and num_seeds > 1 and coupling_map and not pass_manager:
+        circuits = _transpile_best_seed(circuits, num_seeds, cost_function,
+                                        basis_gates=basis_gates,
+                                        coupling_map=coupling_map,
+                                        initial_layout=initial_layout,
+                                        seed_mapper=seed_mapper,
+                                        optimization_level=optimization_level)
+    else:
+        circuits = parallel_map(_transpilation, circuits,
+                                task_kwargs={'basis_gates': basis_gates,
+                                             'coupling_map': coupling_map,
+                                             'initial_layout': initial_layout,
+                                             'seed_mapper': seed_mapper,
+                                             'pass_manager': pass_manager,
+                                             'optimization_level': optimization_level})
     if return_form_is_single:
         return circuits[0]
     return circuits
 
 
+def _transpile_best_seed(circuits, num_seeds, cost_function=None, seed_mapper=None,
+                         **transpile_options):
+    """Transpile each circuit with several seeds of the swap mapper in parallel,
+    and keep the circuit of the lowest cost for each.
+
+    Args:
+        circuits (list[QuantumCircuit]): circuits to transpile
+        num_seeds (int): number of seeds to try for each circuit
+        cost_function (callable): function of a transpiled circuit to minimize.
+            Default: the number of cx gates, then the depth
+        seed_mapper (int): first seed, the others following it. Default: random
+        transpile_options (dict): the other options of _transpilation
+
+    Returns:
+        list[QuantumCircuit]: the best transpiled circuits, with their seed in
+            their ``seed_mapper`` attribute.
+    """
+    if cost_function is None:
+        cost_function = _cx_count_and_depth
+    if seed_mapper is None:
+        seed_mapper = np.random.randint(0, np.iinfo(np.int32).max - num_seeds)
+    seeds = range(seed_mapper, seed_mapper + num_seeds)
+
+    trials = parallel_map(_seeded_transpilation,
+                          [(circuit, seed) for circuit in circuits for seed in seeds],
+                          task_kwargs=transpile_options)
+
+    best_circuits = []
+    for index in range(len(circuits)):
+        circuit_trials = trials[index * num_seeds:(index + 1) * num_seeds]
+        costs = [cost_function(circuit) for circuit in circuit_trials]
+        best = min(range(num_seeds), key=costs.__getitem__)
+        best_circuit = circuit_trials[best]
+        best_circuit.seed_mapper = seeds[best]
+        logger.info("transpile: chose seed_mapper %s for circuit %s",
+                    seeds[best], best_circuit.name)
+        best_circuits.append(best_circuit)
+    return best_circuits
+
+
+def _seeded_transpilation(circuit_and_seed, **transpile_options):
+    """Perform the transpilation of a circuit with a seed for the swap mapper,
+    given as a pair."""
+    circuit, seed = circuit_and_seed
+    return _transpilation(circuit, seed_mapper=seed, **transpile_options)
+
+
+def _cx_count_and_depth(circuit):
+    """Return the number of cx gates and the depth of a circuit."""
+    return circuit.count_ops().get('cx', 0), circuit.depth()
+
+
 def _transpilation(circuit, basis_gates=None, coupling_map=None,
                    initial_layout=None, seed_mapper=None,
-                   pass_manager=None):
+                   pass_manager=None, optimization_level=None):
     """Perform transpilation of a single circuit.
 
     Args:
@@ -101,6 +169,7 @@ def _transpilation(circuit, basis_gates=None, coupling_map=None,
         initial_layout (Layout): initial layout of qubits in mapping
         seed_mapper (int): random seed for the swap_mapper
         pass_manager (PassManager): a pass_manager for the transpiler stage
+        optimization_level (int): optimization level of the preset pass manager
 
     Returns:
         QuantumCircuit: A transpiled circuit.
@@ -140,7 +209,8 @@ def _transpilation(circuit, basis_gates=None, coupling_map=None,
                               coupling_map=coupling_map,
                               initial_layout=initial_layout,
                               seed_mapper=seed_mapper,
-                              pass_manager=pass_manager)
+                              pass_manager=pass_manager,
+                              optimization_level=optimization_level)
 
     out_circuit = dag_to_circuit(final_dag)
 
@@ -149,7 +219,8 @@ def _transpilation(circuit, basis_gates=None, coupling_map=None,
 
 # pylint: disable=redefined-builtin
 def transpile_dag(dag, basis_gates=None, coupling_map=None,
-                  initial_layout=None, seed_mapper=None, pass_manager=None):
+                  initial_layout=None, seed_mapper=None, pass_manager=None,
+                  optimization_level=None):
     """Transform a dag circuit into another dag circuit (transpile), through
     consecutive passes on the dag.
 
@@ -169,9 +240,12 @@ def transpile_dag(dag, basis_gates=None, coupling_map=None,
         initial_layout (Layout or None): A layout object
         seed_mapper (int): random seed_mapper for the swap mapper
         pass_manager (PassManager): pass manager instance for the transpilation process
-            If None, a default set of passes are run.
+            If None, the preset passes of the optimization level are run.
             Otherwise, the passes defined in it will run.
             If contains no passes in it, no dag transformations occur.
+        optimization_level (int): how much to simplify the circuit if no
+            pass_manager is given, from 0, the fastest transpilation, to 3, the
+            most simplified circuit. Default: 2
 
     Returns:
         DAGCircuit: transformed dag
@@ -198,35 +272,10 @@ def transpile_dag(dag, basis_gates=None, coupling_map=None,
         initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
     if pass_manager is None:
-        # default set of passes
-
-        pass_manager = PassManager()
-        pass_manager.append(Unroller(basis_gates))
-
-        # if a coupling map is given compile to the map
-        if coupling_map:
-            coupling = CouplingMap(coupling_map)
-
-            # Extend and enlarge the the dag/layout with ancillas using the full coupling map
-            pass_manager.property_set['layout'] = initial_layout
-            pass_manager.append(ExtendLayout(coupling))
-            pass_manager.append(EnlargeWithAncilla(initial_layout))
-
-            # Swap mapper
-            pass_manager.append(LegacySwap(coupling, initial_layout, trials=20, seed=seed_mapper))
-
-            # Expand swaps
-            pass_manager.append(Decompose(SwapGate))
-
-            # Change CX directions
-            pass_manager.append(CXDirection(coupling))
-
-            # Unroll to the basis
-            pass_manager.append(Unroller(['u1', 'u2', 'u3', 'id', 'cx']))
-
-            # Simplify single qubit gates and CXs
-            pass_manager.append([Optimize1qGates(), CXCancellation(), Depth(), FixedPoint('depth')],
-                                do_while=lambda property_set: not property_set['depth_fixed_point'])
+        if optimization_level is None:
+            optimization_level = 2
+        pass_manager = preset_pass_manager(optimization_level, basis_gates, coupling_map,
+                                           initial_layout, seed_mapper)
 
     # run the passes specified by the pass manager
     # TODO return the property set too. See #1086
@@ -32,6 +32,7 @@ from marshmallow import fields as _fields
 from marshmallow.utils import is_collection
 
 from .exceptions import ModelValidationError
+from . import binary
 
 
 class ModelTypeValidator(_fields.Field):
@@ -350,6 +351,33 @@ class BaseModel(SimpleNamespace):
         """Serialize the model into a Python dict of simple types."""
         return self.to_dict()
 
+    def to_binary(self, compress=False):
+        """Serialize the model into the compact binary format.
+
+        The numeric payloads of the model (for example, memory, statevectors
+        or pulse samples) are stored as packed numpy buffers instead of
+        nested lists. See ``qiskit.validation.binary`` for details.
+
+        Args:
+            compress (bool): if True, compress the serialized data.
+
+        Returns:
+            bytes: the serialized model.
+        """
+        return binary.dumps(self.to_dict(), compress=compress)
+
+    @classmethod
+    def from_binary(cls, data):
+        """Deserialize the compact binary format into an instance of this class.
+
+        Args:
+            data (bytes): data returned by ``to_binary()``.
+
+        Returns:
+            BaseModel: an instance of this class.
+        """
+        return cls.from_dict(binary.loads(data))
+
 
 class ObjSchema(BaseSchema):
     """Generic object schema."""
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Compact binary serialization of dicts of simple types.
+
+The binary format is a numpy ``.npz`` archive. The skeleton of the dict is
+stored as JSON, while the bulky parts are moved to raw numpy buffers:
+
+* rectangular nested lists of ints or floats (statevectors, unitaries, level
+  0 and 1 memory, pulse samples) become a single ``ndarray``. Ints are stored
+  with the smallest dtype that holds them.
+* lists of strings (level 2 memory, instruction names) are dictionary encoded:
+  the distinct strings are stored as one UTF-8 buffer, and the list as an
+  ``ndarray`` of indices into them.
+* ragged lists of lists of ints (instruction qubits and memory slots) become a
+  flat ``ndarray`` plus an ``ndarray`` of lengths.
+* lists of dicts (instruction streams) are stored by columns, so that each of
+  the columns can be packed by the rules above.
+
+Decoding returns a dict equal to the one that was encoded, including the
+Python types of the numbers, so that ``Model.from_dict()`` can be used on it.
+"""
+
+import io
+import json
+import numbers
+
+import numpy as np
+
+# Lists shorter than this are kept in the JSON skeleton, as the overhead of an
+# extra entry in the archive is larger than the savings.
+_MIN_PACK_LENGTH = 8
+
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+_SKELETON_KEY = '__skeleton__'
+_ARRAY_TAG = '__ndarray__'
+_RAGGED_TAG = '__ragged__'
+_STRINGS_TAG = '__strings__'
+_RECORDS_TAG = '__records__'
+
+
+def dumps(data, compress=False):
+    """Serialize a dict of simple types into the compact binary format.
+
+    Args:
+        data (dict): dict of simple types, as returned by ``Model.to_dict()``.
+        compress (bool): if True, deflate the archive members.
+
+    Returns:
+        bytes: the serialized data.
+    """
+    arrays = []
+    skeleton = _encode(data, arrays)
+    members = {'a{}'.format(index): array for index, array in enumerate(arrays)}
+    members[_SKELETON_KEY] = np.frombuffer(
+        json.dumps(skeleton, separators=(',', ':')).encode('utf-8'), dtype=np.uint8)
+
+    buffer = io.BytesIO()
+    if compress:
+        np.savez_compressed(buffer, **members)
+    else:
+        np.savez(buffer, **members)
+    return buffer.getvalue()
+
+
+def loads(data):
+    """Deserialize the compact binary format into a dict of simple types.
+
+    Args:
+        data (bytes): data serialized by ``dumps()``.
+
+    Returns:
+        dict: the deserialized dict.
+    """
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        skeleton = json.loads(archive[_SKELETON_KEY].tobytes().decode('utf-8'))
+        arrays = [archive['a{}'.format(index)]
+                  for index in range(len(archive.files) - 1)]
+    return _decode(skeleton, arrays)
+
+
+def _encode(value, arrays):
+    """Return the JSON skeleton of ``value``, appending packed data to ``arrays``."""
+    if isinstance(value, dict):
+        return {key: _encode(item, arrays) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        if len(value) >= _MIN_PACK_LENGTH:
+            packed = _pack_list(value, arrays)
+            if packed is not None:
+                return packed
+        return [_encode(item, arrays) for item in value]
+
+    return value
+
+
+def _pack_list(value, arrays):
+    """Try to move ``value`` to packed arrays, returning its placeholder or None."""
+    if all(isinstance(item, dict) for item in value):
+        return _pack_records(value, arrays)
+
+    if all(isinstance(item, str) for item in value):
+        return _pack_strings(value, arrays)
+
+    array = _as_array(value)
+    if array is not None:
+        return {_ARRAY_TAG: _append(arrays, array)}
+
+    if all(isinstance(item, (list, tuple)) for item in value):
+        array = _as_array([element for item in value for element in item])
+        if array is not None and array.ndim == 1 and array.dtype.kind == 'i':
+            lengths = _compact_ints([len(item) for item in value])
+            return {_RAGGED_TAG: [_append(arrays, array), _append(arrays, lengths)]}
+
+    return None
+
+
+def _pack_strings(value, arrays):
+    """Dictionary encode a list of strings."""
+    distinct = {}
+    indices = [distinct.setdefault(item, len(distinct)) for item in value]
+    encoded = [item.encode('utf-8') for item in distinct]
+    buffer = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    lengths = _compact_ints([len(item) for item in encoded])
+    return {_STRINGS_TAG: [_append(arrays, buffer),
+                           _append(arrays, lengths),
+                           _append(arrays, _compact_ints(indices))]}
+
+
+def _pack_records(value, arrays):
+    """Store a list of dicts by columns."""
+    layouts = []
+    layout_index = {}
+    rows = []
+    columns = {}
+    for record in value:
+        keys = tuple(record)
+        if keys not in layout_index:
+            layout_index[keys] = len(layouts)
+            layouts.append(list(keys))
+        rows.append(layout_index[keys])
+        for key in keys:
+            columns.setdefault(key, []).append(record[key])
+
+    return {_RECORDS_TAG: {
+        'layouts': layouts,
+        'rows': _encode(rows, arrays),
+        'columns': {key: _encode(column, arrays) for key, column in columns.items()}
+    }}
+
+
+def _as_array(value):
+    """Return ``value`` as a homogeneous ndarray, or None if it would not round-trip.
+
+    Only lists whose leaves are all ``int`` (that fit in 64 bits) or all
+    ``float`` and that are rectangular are converted.
+    """
+    leaf_type = _common_leaf_type(value)
+    if leaf_type is None:
+        return None
+
+    try:
+        array = np.array(value, dtype=np.int64 if leaf_type is int else np.float64)
+    except ValueError:  # ragged
+        return None
+    if array.size == 0:
+        return None
+    if leaf_type is int:
+        array = array.astype(_int_dtype(array), copy=False)
+    return array
+
+
+def _common_leaf_type(value):
+    """Return the type, ``int`` or ``float``, of all the leaves of nested lists,
+    or None if the leaves are of several or other types, or if there are none."""
+    leaf_type = None
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        for item in current:
+            if isinstance(item, (list, tuple)):
+                stack.append(item)
+                continue
+            item_type = _leaf_type(item)
+            if item_type is None or leaf_type not in (None, item_type):
+                return None
+            leaf_type = item_type
+    return leaf_type
+
+
+def _leaf_type(item):
+    """Return ``int`` or ``float`` if ``item`` can be stored in an ndarray of
+    int64 or float64, else None."""
+    if isinstance(item, bool):
+        return None
+    if isinstance(item, numbers.Integral):
+        return int if _INT64_MIN <= item <= _INT64_MAX else None
+    if isinstance(item, float):
+        return float
+    return None
+
+
+def _append(arrays, array):
+    """Append ``array`` to ``arrays``, returning its index."""
+    arrays.append(array)
+    return len(arrays) - 1
+
+
+def _int_dtype(array):
+    """Return the smallest integer dtype that holds the values of ``array``."""
+    if array.size == 0:
+        return np.int8
+    low, high = array.min(), array.max()
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return np.int64
+
+
+def _compact_ints(values):
+    """Return a list of ints as an ndarray of the smallest integer dtype."""
+    array = np.array(values, dtype=np.int64)
+    return array.astype(_int_dtype(array), copy=False)
+
+
+def _decode(value, arrays):
+    """Rebuild the original data from its skeleton and packed arrays."""
+    if isinstance(value, list):
+        return [_decode(item, arrays) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if len(value) == 1:
+        tag, packed = next(iter(value.items()))
+        if tag in _UNPACKERS:
+            return _UNPACKERS[tag](packed, arrays)
+
+    return {key: _decode(item, arrays) for key, item in value.items()}
+
+
+def _unpack_array(value, arrays):
+    """Rebuild a rectangular nested list stored as an ndarray."""
+    return arrays[value].tolist()
+
+
+def _unpack_ragged(value, arrays):
+    """Rebuild a list of lists of ints stored as a flat ndarray and lengths."""
+    flat_index, lengths_index = value
+    flat = arrays[flat_index].tolist()
+    offsets = np.concatenate(([0], np.cumsum(arrays[lengths_index]))).tolist()
+    return [flat[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _unpack_strings(value, arrays):
+    """Rebuild a dictionary encoded list of strings."""
+    buffer_index, lengths_index, indices_index = value
+    buffer = arrays[buffer_index].tobytes()
+    offsets = np.concatenate(([0], np.cumsum(arrays[lengths_index]))).tolist()
+    distinct = [buffer[start:end].decode('utf-8')
+                for start, end in zip(offsets[:-1], offsets[1:])]
+    return [distinct[index] for index in arrays[indices_index].tolist()]
+
+
+def _unpack_records(value, arrays):
+    """Rebuild a list of dicts stored by columns."""
+    layouts = value['layouts']
+    columns = {key: iter(_decode(column, arrays))
+               for key, column in value['columns'].items()}
+    return [{key: next(columns[key]) for key in layouts[row]}
+            for row in _decode(value['rows'], arrays)]
+
+
+# functions rebuilding the packed data, by the tag of its placeholder
+_UNPACKERS = {
+    _ARRAY_TAG: _unpack_array,
+    _RAGGED_TAG: _unpack_ragged,
+    _STRINGS_TAG: _unpack_strings,
+    _RECORDS_TAG: _unpack_records,
+}
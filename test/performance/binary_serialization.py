@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Binary serialization.
+Compares size and (de)serialization time of the JSON and binary formats
+for a large QasmQobj and for Results with large memory and statevector.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble_circuits, RunConfig
+from qiskit.qobj import QasmQobj
+from qiskit.result import Result
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a random circuit of u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    cr = ClassicalRegister(n_qubits)
+    circuit = QuantumCircuit(qr, cr)
+    for _ in range(n_gates):
+        if rng.rand() < 0.5:
+            circuit.u3(*rng.rand(3), qr[rng.randint(n_qubits)])
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def result_dict(shots, n_qubits):
+    """Build a Result dict with level 2 memory and a statevector."""
+    rng = np.random.RandomState(42)
+    memory = [hex(value) for value in rng.randint(2 ** n_qubits, size=shots)]
+    statevector = rng.rand(2 ** n_qubits, 2).tolist()
+    return {'backend_name': 'bench', 'backend_version': '1.0.0',
+            'qobj_id': 'id', 'job_id': 'id', 'success': True,
+            'results': [
+                {'shots': shots, 'success': True, 'meas_level': 2,
+                 'header': {'memory_slots': n_qubits, 'creg_sizes': [['c', n_qubits]]},
+                 'data': {'memory': memory}},
+                {'shots': 1, 'success': True, 'meas_level': 2,
+                 'data': {'statevector': statevector}}]}
+
+
+def compare(name, model, model_cls):
+    """Print size and time of the JSON and binary round-trips."""
+    tstart = time.time()
+    json_data = json.dumps(model.to_dict())
+    json_dump = time.time() - tstart
+    tstart = time.time()
+    model_cls.from_dict(json.loads(json_data))
+    json_load = time.time() - tstart
+
+    tstart = time.time()
+    binary_data = model.to_binary()
+    binary_dump = time.time() - tstart
+    tstart = time.time()
+    model_cls.from_binary(binary_data)
+    binary_load = time.time() - tstart
+
+    print("---- {}".format(name))
+    print("json:   {} bytes, dump {:.3f}s, load {:.3f}s".format(
+        len(json_data), json_dump, json_load))
+    print("binary: {} bytes, dump {:.3f}s, load {:.3f}s".format(
+        len(binary_data), binary_dump, binary_load))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for binary serialization of Qobj and Result.")
+    parser.add_argument('--n_qubits', type=int, default=16, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=20000, help='gates per circuit')
+    parser.add_argument('--shots', type=int, default=100000, help='shots of memory')
+    args = parser.parse_args()
+
+    qobj = assemble_circuits([random_circuit(args.n_qubits, args.n_gates, 1)],
+                             RunConfig(shots=1024))
+    compare('QasmQobj', qobj, QasmQobj)
+    compare('Result', Result.from_dict(result_dict(args.shots, args.n_qubits)), Result)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Circuit construction.
+Times building a large circuit of parametrized gates and assembling it into
+a Qobj, with numeric and with symbolic parameters.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import sympy
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble_circuits, RunConfig
+
+
+def build_circuit(n_qubits, n_gates, angles):
+    """Build a circuit of u3, u1 and cx gates using the given angles."""
+    qr = QuantumRegister(n_qubits)
+    cr = ClassicalRegister(n_qubits)
+    circuit = QuantumCircuit(qr, cr)
+    for index in range(n_gates // 3):
+        qubit = index % n_qubits
+        circuit.u3(angles[index % len(angles)], 0.5, -0.5, qr[qubit])
+        circuit.u1(angles[(index + 1) % len(angles)], qr[qubit])
+        circuit.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def run(name, n_qubits, n_gates, angles):
+    """Print the time it takes to build and assemble the circuit."""
+    tstart = time.time()
+    circuit = build_circuit(n_qubits, n_gates, angles)
+    build = time.time() - tstart
+
+    tstart = time.time()
+    assemble_circuits([circuit], RunConfig(shots=1024))
+    assemble = time.time() - tstart
+
+    print("---- {}".format(name))
+    print("build {:.3f}s, assemble {:.3f}s".format(build, assemble))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for building and assembling circuits.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=1000000, help='num gates')
+    args = parser.parse_args()
+
+    random_angles = np.random.RandomState(42).rand(1000) * 2 * np.pi
+    run('float params', args.n_qubits, args.n_gates, random_angles.tolist())
+    run('numpy params', args.n_qubits, args.n_gates, list(random_angles))
+    run('symbolic params', args.n_qubits, args.n_gates,
+        [sympy.pi / denominator for denominator in range(1, 1001)])
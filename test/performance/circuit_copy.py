@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Circuit copies.
+Compares deep and shallow copies of a random circuit with some variable
+parameters, and combining and extending circuits with appending their
+instructions one by one.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import sympy
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+
+
+def random_circuit(n_qubits, n_gates, seed, columnar):
+    """Build a random circuit of h, cx and rz gates, a tenth of which are variable."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    cr = ClassicalRegister(n_qubits)
+    circuit = QuantumCircuit(qr, cr, columnar=columnar)
+    theta = sympy.Symbol('theta')
+    for _ in range(n_gates):
+        choice = rng.randint(10)
+        if choice < 4:
+            circuit.h(qr[int(rng.randint(n_qubits))])
+        elif choice < 8:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+        elif choice == 8:
+            circuit.rz(rng.rand(), qr[int(rng.randint(n_qubits))])
+        else:
+            circuit.rz(theta, qr[int(rng.randint(n_qubits))])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def append_all(circuit, rhs):
+    """Append the instructions of rhs to circuit one by one."""
+    for instruction_context in rhs.data:
+        circuit.append(*instruction_context)
+
+
+def timed(function):
+    """Return the time it takes to call ``function``."""
+    tstart = time.time()
+    function()
+    return time.time() - tstart
+
+
+def run(name, args, columnar):
+    """Print the time it takes to copy, combine and extend the circuit."""
+    circuit = random_circuit(args.n_qubits, args.n_gates, args.seed, columnar)
+    times = [timed(circuit.copy),
+             timed(lambda: circuit.copy(shallow=True)),
+             timed(lambda: append_all(QuantumCircuit(*circuit.qregs, *circuit.cregs,
+                                                     columnar=columnar), circuit)),
+             timed(lambda: circuit.copy(shallow=True).extend(circuit)),
+             timed(lambda: circuit + circuit)]
+    print("{:<8} copy {:.3f}s, shallow copy {:.3f}s, append all {:.3f}s, "
+          "shallow copy + extend {:.3f}s, combine {:.3f}s".format(name, *times))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for copying and combining circuits.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=20000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    run('list', args, columnar=False)
+    run('columnar', args, columnar=True)
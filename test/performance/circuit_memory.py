@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Circuit memory.
+Measures the memory held by a large random circuit of standard gates, as
+built with the QuantumCircuit methods, after a round trip through a DAG and
+when loaded from OpenQASM.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a random circuit of mostly parameterless standard gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    cr = ClassicalRegister(n_qubits)
+    circuit = QuantumCircuit(qr, cr)
+    one_qubit_gates = [circuit.h, circuit.x, circuit.y, circuit.z,
+                       circuit.s, circuit.t, circuit.sdg, circuit.tdg]
+    for _ in range(n_gates):
+        choice = rng.randint(10)
+        if choice < len(one_qubit_gates):
+            one_qubit_gates[choice](qr[int(rng.randint(n_qubits))])
+        elif choice == len(one_qubit_gates):
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+        else:
+            circuit.u1(rng.rand(), qr[int(rng.randint(n_qubits))])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def measure(name, build):
+    """Print the time and the memory it takes to build a circuit."""
+    gc.collect()
+    tracemalloc.start()
+    tstart = time.time()
+    circuit = build()
+    elapsed = time.time() - tstart
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("{:<20} {:8.1f}MB {:8.1f} bytes/gate {:8.2f}s".format(
+        name, size / 2**20, size / len(circuit.data), elapsed))
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the memory used by large circuits.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=200000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    original = measure('built', lambda: random_circuit(args.n_qubits, args.n_gates, args.seed))
+    dag = circuit_to_dag(original)
+    measure('from dag', lambda: dag_to_circuit(dag))
+    del dag
+    qasm = original.qasm()
+    del original
+    measure('from qasm', lambda: QuantumCircuit.from_qasm_str(qasm))
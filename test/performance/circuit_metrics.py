@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Circuit metrics.
+Measures the time it takes to compute the size, depth, width, operation
+counts and tensor factors of many random circuits, one metric at a time,
+all together with ``properties()``, and again once they are cached.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+
+
+def random_circuit(n_qubits, n_gates, rng):
+    """Build a random circuit of h, cx and conditional x gates."""
+    qr = QuantumRegister(n_qubits)
+    cr = ClassicalRegister(n_qubits)
+    circuit = QuantumCircuit(qr, cr)
+    for _ in range(n_gates):
+        choice = rng.randint(10)
+        if choice < 4:
+            circuit.h(qr[int(rng.randint(n_qubits))])
+        elif choice < 9:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+        else:
+            circuit.x(qr[int(rng.randint(n_qubits))]).c_if(cr, 1)
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def all_metrics(circuit):
+    """Compute the metrics of the circuit one at a time."""
+    return (circuit.size(), circuit.depth(), circuit.width(), circuit.count_ops(),
+            circuit.num_unitary_factors(), circuit.num_connected_components())
+
+
+def timed(function, circuits):
+    """Return the time it takes to call ``function`` on all the circuits."""
+    tstart = time.time()
+    for circuit in circuits:
+        function(circuit)
+    return time.time() - tstart
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the metrics of circuits.")
+    parser.add_argument('--n_circuits', type=int, default=1000, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=16, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=500, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(args.seed)
+    circuits = [random_circuit(args.n_qubits, args.n_gates, rng)
+                for _ in range(args.n_circuits)]
+    uncached = [circuit.copy() for circuit in circuits]
+    print("metrics    {:.3f}s".format(timed(all_metrics, circuits)))
+    print("cached     {:.3f}s".format(timed(all_metrics, circuits)))
+    print("properties {:.3f}s".format(timed(QuantumCircuit.properties, uncached)))
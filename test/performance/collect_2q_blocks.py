@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Two-qubit blocks.
+Measures the time it takes to collect the blocks of gates on pairs of qubits
+of a QFT circuit and of a random circuit, unrolled to u1, u2, u3 and cx.
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager, transpile_dag
+from qiskit.transpiler.passes import Collect2qBlocks
+
+
+def qft_circuit(n_qubits):
+    """Build a QFT circuit."""
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for target in range(n_qubits):
+        circuit.h(qr[target])
+        for control in range(target + 1, n_qubits):
+            circuit.cu1(math.pi / 2 ** (control - target), qr[control], qr[target])
+    return circuit
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a random circuit of h, u1, u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        choice = rng.randint(4)
+        qubit = qr[int(rng.randint(n_qubits))]
+        if choice == 0:
+            circuit.h(qubit)
+        elif choice == 1:
+            circuit.u1(rng.rand(), qubit)
+        elif choice == 2:
+            circuit.u3(rng.rand(), rng.rand(), rng.rand(), qubit)
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+    return circuit
+
+
+def run(name, circuit):
+    """Print the time it takes to collect the blocks of the circuit."""
+    dag = transpile_dag(circuit_to_dag(circuit))
+    pass_manager = PassManager()
+    pass_manager.append(Collect2qBlocks())
+    tstart = time.time()
+    pass_manager.run_passes(dag)
+    print("{:<8} {} gates, {} blocks in {:.3f}s".format(
+        name, dag.size(), len(pass_manager.property_set['block_list']), time.time() - tstart))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the collection of two-qubit blocks.")
+    parser.add_argument('--n_qubits', type=int, default=100, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=50000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    run('qft', qft_circuit(args.n_qubits))
+    run('random', random_circuit(args.n_qubits, args.n_gates, args.seed))
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Columnar circuits.
+Compares building a large random circuit, computing its metrics and
+assembling it, with the instructions stored in a list and in a ColumnarData.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble_circuits, RunConfig
+
+
+def random_circuit(n_qubits, n_gates, seed, columnar):
+    """Build a random circuit of h, cx and u1 gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    cr = ClassicalRegister(n_qubits)
+    circuit = QuantumCircuit(qr, cr, columnar=columnar)
+    for _ in range(n_gates):
+        choice = rng.randint(3)
+        if choice == 0:
+            circuit.h(qr[int(rng.randint(n_qubits))])
+        elif choice == 1:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+        else:
+            circuit.u1(rng.rand(), qr[int(rng.randint(n_qubits))])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def timed(function):
+    """Return the time it takes to call ``function``."""
+    tstart = time.time()
+    function()
+    return time.time() - tstart
+
+
+def run(name, args, columnar):
+    """Print the time it takes to build, measure and assemble the circuit."""
+    circuits = []
+    times = [timed(lambda: circuits.append(
+        random_circuit(args.n_qubits, args.n_gates, args.seed, columnar)))]
+    circuit = circuits[0]
+    times.append(timed(circuit.size))
+    times.append(timed(circuit.depth))
+    times.append(timed(circuit.count_ops))
+    times.append(timed(circuit.num_connected_components))
+    times.append(timed(lambda: assemble_circuits(circuit, RunConfig(shots=1024))))
+    print("{:<8} build {:.3f}s, size {:.3f}s, depth {:.3f}s, count_ops {:.3f}s, "
+          "components {:.3f}s, assemble {:.3f}s".format(name, *times))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for columnar circuits.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=100000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    run('list', args, columnar=False)
+    run('columnar', args, columnar=True)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Commutation analysis.
+Measures the time it takes to find the commutation relations of a random
+circuit of standard one and two-qubit gates, and to cancel gates with them.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PropertySet
+from qiskit.transpiler.passes import CommutationAnalysis, CommutativeCancellation
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a random circuit of h, z, t, rz, cx and cz gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        choice = rng.randint(6)
+        qubit = qr[int(rng.randint(n_qubits))]
+        if choice == 0:
+            circuit.h(qubit)
+        elif choice == 1:
+            circuit.z(qubit)
+        elif choice == 2:
+            circuit.t(qubit)
+        elif choice == 3:
+            circuit.rz(rng.rand(), qubit)
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            getattr(circuit, 'cx' if choice == 4 else 'cz')(qr[int(control)], qr[int(target)])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the commutation analysis.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=20000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    dag = circuit_to_dag(random_circuit(args.n_qubits, args.n_gates, args.seed))
+    analysis = CommutationAnalysis()
+    analysis.property_set = PropertySet()
+    tstart = time.time()
+    analysis.run(dag)
+    print("analysis     {:.3f}s".format(time.time() - tstart))
+
+    cancellation = CommutativeCancellation()
+    cancellation.property_set = analysis.property_set
+    tstart = time.time()
+    optimized = cancellation.run(dag)
+    print("cancellation {:.3f}s, {} -> {} gates".format(
+        time.time() - tstart, args.n_gates, optimized.size()))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Block consolidation.
+Measures the time it takes to re-synthesize the two-qubit blocks of a deep
+variational circuit, and the number of CNOTs before and after.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager, transpile_dag
+from qiskit.transpiler.passes import ConsolidateBlocks
+
+
+def variational_circuit(n_qubits, n_layers, seed):
+    """Build layers of ry and rz rotations, entangled by repeated cx ladders
+    between neighbouring qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_layers):
+        for qubit in qr:
+            circuit.ry(rng.rand(), qubit)
+            circuit.rz(rng.rand(), qubit)
+        for start in (0, 1):
+            for control in range(start, n_qubits - 1, 2):
+                for _ in range(2):
+                    circuit.cx(qr[control], qr[control + 1])
+                    circuit.rz(rng.rand(), qr[control + 1])
+                    circuit.cx(qr[control + 1], qr[control])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the consolidation of two-qubit blocks.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_layers', type=int, default=20, help='num layers')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    dag = transpile_dag(circuit_to_dag(variational_circuit(args.n_qubits, args.n_layers,
+                                                           args.seed)))
+    num_cx = dag.count_ops().get('cx', 0)
+    pass_manager = PassManager()
+    pass_manager.append(ConsolidateBlocks())
+    tstart = time.time()
+    dag = pass_manager.run_passes(dag)
+    print("consolidate {:.3f}s, {} -> {} cx".format(
+        time.time() - tstart, num_cx, dag.count_ops().get('cx', 0)))
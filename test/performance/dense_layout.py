@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Dense layout.
+Measures the time it takes to choose the densest subset of qubits of a large
+grid coupling map, the first time and from the cache.
+"""
+
+import argparse
+import time
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.mapper import CouplingMap
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import DenseLayout
+
+
+def grid_coupling_map(n_rows, n_columns):
+    """Build the coupling map of a grid of qubits, coupled in both directions."""
+    couplings = []
+    for row in range(n_rows):
+        for column in range(n_columns):
+            qubit = row * n_columns + column
+            if column + 1 < n_columns:
+                couplings += [[qubit, qubit + 1], [qubit + 1, qubit]]
+            if row + 1 < n_rows:
+                couplings += [[qubit, qubit + n_columns], [qubit + n_columns, qubit]]
+    return CouplingMap(couplings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the dense layout.")
+    parser.add_argument('--n_rows', type=int, default=32, help='num rows of the grid')
+    parser.add_argument('--n_columns', type=int, default=32, help='num columns of the grid')
+    parser.add_argument('--n_qubits', type=int, default=100, help='num qubits of the circuit')
+    args = parser.parse_args()
+
+    coupling_map = grid_coupling_map(args.n_rows, args.n_columns)
+    dag = circuit_to_dag(QuantumCircuit(QuantumRegister(args.n_qubits)))
+    for label in ['dense', 'cached']:
+        pass_manager = PassManager()
+        pass_manager.append(DenseLayout(coupling_map))
+        tstart = time.time()
+        pass_manager.run_passes(dag)
+        print("{:<8} {} of {} qubits in {:.3f}s".format(
+            label, args.n_qubits, coupling_map.size(), time.time() - tstart))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Gate definitions.
+Measures the time it takes to decompose many standard gates, whose
+definitions are cached, and to compute the definition of the initialization
+of a random state.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit.extensions.standard import ToffoliGate, Cu3Gate
+from qiskit.extensions.quantum_initializer.initializer import InitializeGate
+
+
+def random_state(n_qubits, seed):
+    """Return a random state vector."""
+    rng = np.random.RandomState(seed)
+    state = rng.rand(2 ** n_qubits) * np.exp(2j * np.pi * rng.rand(2 ** n_qubits))
+    return state / np.linalg.norm(state)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the definitions of gates.")
+    parser.add_argument('--n_gates', type=int, default=10000, help='num gates')
+    parser.add_argument('--n_qubits', type=int, default=14,
+                        help='num qubits of the initialized state')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    angles = np.random.RandomState(args.seed).rand(10, 3).tolist()
+    for name, make_gate in [('ccx', lambda index: ToffoliGate()),
+                            ('cu3', lambda index: Cu3Gate(*angles[index % 10]))]:
+        tstart = time.time()
+        for index in range(args.n_gates):
+            _ = make_gate(index).definition
+        print("{:<12} {:.3f}ms per definition".format(
+            name, 1000 * (time.time() - tstart) / args.n_gates))
+
+    state = random_state(args.n_qubits, args.seed)
+    for label in ['initialize', 'cached']:
+        tstart = time.time()
+        _ = InitializeGate(state).definition
+        print("{:<12} {:.3f}s for {} qubits".format(label, time.time() - tstart,
+                                                    args.n_qubits))
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Noise adaptive layout.
+Measures the time it takes to choose a noise adaptive layout on a grid of
+qubits with random errors, the first time and with the error distances of the
+calibration cached.
+"""
+
+import argparse
+from datetime import datetime
+import random
+import time
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Nduv, Gate
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import NoiseAdaptiveLayout
+
+
+def grid_properties(n_rows, n_columns, seed):
+    """Build the properties of a grid of qubits with random cx and readout errors."""
+    rng = random.Random(seed)
+    calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+    qubits = [[Nduv(date=calib_time, name='readout_error', unit='', value=rng.uniform(0, 0.1))]
+              for _ in range(n_rows * n_columns)]
+    gates = []
+    for row in range(n_rows):
+        for column in range(n_columns):
+            qubit = row * n_columns + column
+            neighbours = []
+            if column + 1 < n_columns:
+                neighbours.append(qubit + 1)
+            if row + 1 < n_rows:
+                neighbours.append(qubit + n_columns)
+            for neighbour in neighbours:
+                error = Nduv(date=calib_time, name='gate_error', unit='',
+                             value=rng.uniform(0, 0.1))
+                gates.append(Gate(name="CX%s_%s" % (qubit, neighbour), gate="cx",
+                                  qubits=[qubit, neighbour], parameters=[error]))
+    return BackendProperties(last_update_date=calib_time, backend_name="grid",
+                             backend_version="1.0.0", qubits=qubits, gates=gates,
+                             general=[])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the noise adaptive layout.")
+    parser.add_argument('--n_rows', type=int, default=10, help='num rows of the grid')
+    parser.add_argument('--n_columns', type=int, default=10, help='num columns of the grid')
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits of the circuit')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    backend_prop = grid_properties(args.n_rows, args.n_columns, args.seed)
+    qr = QuantumRegister(args.n_qubits)
+    circuit = QuantumCircuit(qr)
+    for qubit in range(args.n_qubits - 1):
+        circuit.cx(qr[qubit], qr[qubit + 1])
+    dag = circuit_to_dag(circuit)
+    for label in ['noise', 'cached']:
+        pass_manager = PassManager()
+        pass_manager.append(NoiseAdaptiveLayout(backend_prop))
+        tstart = time.time()
+        pass_manager.run_passes(dag)
+        print("{:<8} {} of {} qubits in {:.3f}s".format(
+            label, args.n_qubits, args.n_rows * args.n_columns, time.time() - tstart))
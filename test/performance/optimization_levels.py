@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Optimization levels.
+Measures the time it takes to transpile random circuits to a backend at each
+optimization level, and the number of cx gates and the depth of the results.
+"""
+
+import argparse
+import random
+import time
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.test.mock import FakeMelbourne
+from qiskit.transpiler import transpile
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a circuit of random cx, cz, h and u3 gates."""
+    rng = random.Random(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        control, target = rng.sample(range(n_qubits), 2)
+        circuit.cx(qr[control], qr[target])
+        circuit.u3(rng.random(), rng.random(), rng.random(), qr[target])
+        circuit.cz(qr[control], qr[target])
+        circuit.h(qr[control])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the optimization levels of the transpiler.")
+    parser.add_argument('--n_circuits', type=int, default=4, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=6, help='num qubits of the circuits')
+    parser.add_argument('--n_gates', type=int, default=40, help='num cx gates of the circuits')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    coupling_map = FakeMelbourne().configuration().coupling_map
+    circuits = [random_circuit(args.n_qubits, args.n_gates, args.seed + index)
+                for index in range(args.n_circuits)]
+    for level in range(4):
+        tstart = time.time()
+        new_circuits = transpile(circuits, coupling_map=coupling_map,
+                                 seed_mapper=args.seed, optimization_level=level)
+        print("level {}: {:.3f}s, cx {}, depth {}".format(
+            level, time.time() - tstart,
+            sum(new_circuit.count_ops().get('cx', 0) for new_circuit in new_circuits),
+            sum(new_circuit.depth() for new_circuit in new_circuits)))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Single qubit gate optimization.
+Measures the time it takes to simplify the runs of single qubit gates of a
+random circuit of u1, u2, u3 and cx gates.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import Optimize1qGates
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a random circuit of u1, u2, u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        choice = rng.randint(4)
+        qubit = qr[int(rng.randint(n_qubits))]
+        if choice == 0:
+            circuit.u1(rng.rand(), qubit)
+        elif choice == 1:
+            circuit.u2(rng.rand(), rng.rand(), qubit)
+        elif choice == 2:
+            circuit.u3(rng.rand(), rng.rand(), rng.rand(), qubit)
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the optimization of single qubit gates.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=20000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    dag = circuit_to_dag(random_circuit(args.n_qubits, args.n_gates, args.seed))
+    pass_manager = PassManager()
+    pass_manager.append(Optimize1qGates())
+    tstart = time.time()
+    result = pass_manager.run_passes(dag)
+    print("{} gates to {} gates in {:.3f}s".format(args.n_gates, result.size(),
+                                                   time.time() - tstart))
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Peephole optimization.
+Measures the time it takes to simplify a random circuit of u1, u2, u3 and cx
+gates followed by its inverse, whose cancellations cascade from the middle,
+with the peephole optimization and with the passes repeated until the depth
+reaches a fixed point.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import (Optimize1qGates, CXCancellation, Depth, FixedPoint,
+                                      PeepholeOptimization)
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Build a random circuit of u1, u2, u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        choice = rng.randint(4)
+        qubit = qr[int(rng.randint(n_qubits))]
+        if choice == 0:
+            circuit.u1(rng.rand(), qubit)
+        elif choice == 1:
+            circuit.u2(rng.rand(), rng.rand(), qubit)
+        elif choice == 2:
+            circuit.u3(rng.rand(), rng.rand(), rng.rand(), qubit)
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circuit.cx(qr[int(control)], qr[int(target)])
+    return circuit
+
+
+def run(name, circuit, passes, **kwargs):
+    """Print the time it takes to simplify the circuit with the passes."""
+    dag = circuit_to_dag(circuit)
+    pass_manager = PassManager()
+    pass_manager.append(passes, **kwargs)
+    tstart = time.time()
+    result = pass_manager.run_passes(dag)
+    print("{:<12} {} gates to {} gates in {:.3f}s".format(
+        name, circuit.size(), result.size(), time.time() - tstart))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the peephole optimization.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=1000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    forward = random_circuit(args.n_qubits, args.n_gates, args.seed)
+    mirrored = forward + forward.inverse()
+    run('peephole', mirrored, [PeepholeOptimization()])
+    run('fixed point', mirrored,
+        [Optimize1qGates(), CXCancellation(), Depth(), FixedPoint('depth')],
+        do_while=lambda property_set: not property_set['depth_fixed_point'])
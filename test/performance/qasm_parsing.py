@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+OpenQASM parsing.
+Times loading the libraries in qiskit/qasm/libs and large synthetic programs
+into a QuantumCircuit, comparing the direct path of ``from_qasm_str`` with
+converting the full AST through a DAG.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.converters import ast_to_dag, dag_to_circuit
+from qiskit.qasm import Qasm
+
+LIBS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'qiskit', 'qasm', 'libs')
+
+
+def synthetic_program(n_qubits, n_lines, seed):
+    """Build a random OpenQASM program using the standard gates."""
+    rng = np.random.RandomState(seed)
+    lines = ['OPENQASM 2.0;', 'include "qelib1.inc";',
+             'qreg q[{}];'.format(n_qubits), 'creg c[{}];'.format(n_qubits)]
+    for _ in range(n_lines):
+        choice = rng.randint(4)
+        qubit = rng.randint(n_qubits)
+        if choice == 0:
+            lines.append('h q[{}];'.format(qubit))
+        elif choice == 1:
+            lines.append('u3({:.6f},{:.6f},pi/2) q[{}];'.format(*rng.rand(2), qubit))
+        elif choice == 2:
+            lines.append('cx q[{}],q[{}];'.format(qubit, (qubit + 1) % n_qubits))
+        else:
+            lines.append('rz(pi/{}) q[{}];'.format(rng.randint(1, 8), qubit))
+    lines.append('measure q -> c;')
+    return '\n'.join(lines)
+
+
+def through_dag(qasm_str):
+    """Load a program by converting its full AST through a DAG."""
+    return dag_to_circuit(ast_to_dag(Qasm(data=qasm_str).parse()))
+
+
+def compare(name, qasm_str, repeat):
+    """Print the time taken by both paths."""
+    for label, function in (('from_qasm_str', QuantumCircuit.from_qasm_str),
+                            ('ast_to_dag', through_dag)):
+        tstart = time.time()
+        for _ in range(repeat):
+            function(qasm_str)
+        print("---- {} ({}): {:.4f}s".format(name, label, (time.time() - tstart) / repeat))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Performance testing for OpenQASM parsing.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_lines', type=int, default=100000,
+                        help='num lines of the largest synthetic program')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='repetitions for the libraries')
+    args = parser.parse_args()
+
+    for lib in sorted(os.listdir(LIBS_PATH)):
+        compare(lib, 'OPENQASM 2.0;\ninclude "{}";\n'.format(lib), args.repeat)
+
+    n_lines = 100
+    while n_lines <= args.n_lines:
+        compare('synthetic {} lines'.format(n_lines),
+                synthetic_program(args.n_qubits, n_lines, n_lines), 1)
+        n_lines *= 10
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Result post-processing.
+Times the loading of a Result with many shots and a large statevector, and
+the formatting of its counts, memory and statevector.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit.result import Result
+
+
+def build_result_dict(shots, n_qubits):
+    """Build a Result dict with level 2 memory, counts and a statevector."""
+    rng = np.random.RandomState(42)
+    values = rng.randint(2 ** n_qubits, size=shots)
+    memory = [hex(value) for value in values]
+    counts = {hex(value): int(count) for value, count in
+              zip(*np.unique(values, return_counts=True))}
+    statevector = rng.rand(2 ** n_qubits, 2).tolist()
+    return {
+        'backend_name': 'bench', 'backend_version': '1.0.0',
+        'qobj_id': 'id', 'job_id': 'id', 'success': True,
+        'results': [{'shots': shots, 'success': True, 'meas_level': 2,
+                     'header': {'memory_slots': n_qubits,
+                                'creg_sizes': [['c0', n_qubits // 2],
+                                               ['c1', n_qubits - n_qubits // 2]]},
+                     'data': {'memory': memory, 'counts': counts}},
+                    {'shots': 1, 'success': True, 'meas_level': 2,
+                     'data': {'statevector': statevector}}]}
+
+
+def timed(name, function):
+    """Print the time taken by ``function``, returning its output."""
+    tstart = time.time()
+    output = function()
+    print("---- {}: {:.3f}s".format(name, time.time() - tstart))
+    return output
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for Result post-processing.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--shots', type=int, default=1000000, help='num shots')
+    args = parser.parse_args()
+
+    result_dict = build_result_dict(args.shots, args.n_qubits)
+    result = timed('Result.from_dict', lambda: Result.from_dict(result_dict))
+    timed('get_counts', lambda: result.get_counts(0))
+    timed('get_counts (cached)', lambda: result.get_counts(0))
+    timed('get_memory', lambda: result.get_memory(0))
+    timed('get_memory (cached)', lambda: result.get_memory(0))
+    timed('get_memory(as_array=True)', lambda: result.get_memory(0, as_array=True))
+    timed('get_statevector', lambda: result.get_statevector(1))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Transpile with several seeds.
+Measures the time and the number of cx gates of random circuits mapped to a
+backend with one seed of the swap mapper, and with the best of several seeds
+run in parallel.
+"""
+
+import argparse
+import random
+import time
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.test.mock import FakeTokyo
+from qiskit.transpiler import transpile
+
+
+def random_cx_circuit(n_qubits, n_gates, seed):
+    """Build a circuit of random cx and h gates."""
+    rng = random.Random(seed)
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        control, target = rng.sample(range(n_qubits), 2)
+        circuit.cx(qr[control], qr[target])
+        circuit.h(qr[control])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for transpiling with several seeds.")
+    parser.add_argument('--n_circuits', type=int, default=2, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=8, help='num qubits of the circuits')
+    parser.add_argument('--n_gates', type=int, default=30, help='num cx gates of the circuits')
+    parser.add_argument('--num_seeds', type=int, default=4, help='num seeds of the mapper')
+    parser.add_argument('--seed', type=int, default=0, help='first seed')
+    args = parser.parse_args()
+
+    coupling_map = FakeTokyo().configuration().coupling_map
+    circuits = [random_cx_circuit(args.n_qubits, args.n_gates, args.seed + index)
+                for index in range(args.n_circuits)]
+    for num_seeds in [None, args.num_seeds]:
+        tstart = time.time()
+        new_circuits = transpile(circuits, coupling_map=coupling_map,
+                                 seed_mapper=args.seed, num_seeds=num_seeds)
+        print("{} seeds: cx counts {} in {:.3f}s".format(
+            num_seeds or 1, [new_circuit.count_ops().get('cx', 0) for new_circuit in new_circuits],
+            time.time() - tstart))
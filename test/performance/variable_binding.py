@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Variable binding.
+Compares binding many sets of values to a variational circuit with
+QuantumCircuit.assign_variables() and with a VariableBinder, and assembling
+the bound circuits with assemble_circuits() and assemble_circuit_sweep().
+"""
+
+import argparse
+import time
+
+import numpy as np
+import sympy
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit import VariableBinder
+from qiskit.compiler import assemble_circuits, assemble_circuit_sweep
+
+
+def variational_circuit(n_qubits, depth):
+    """Build a hardware-efficient ansatz with a variable per rotation."""
+    qr = QuantumRegister(n_qubits)
+    circuit = QuantumCircuit(qr)
+    variables = []
+    for layer in range(depth):
+        for qubit in range(n_qubits):
+            theta = sympy.Symbol('t_{}_{}'.format(layer, qubit))
+            variables.append(theta)
+            circuit.ry(theta, qr[qubit])
+        for qubit in range(n_qubits - 1):
+            circuit.cx(qr[qubit], qr[qubit + 1])
+    return circuit, variables
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for binding variables of circuits.")
+    parser.add_argument('--n_qubits', type=int, default=8, help='num qubits')
+    parser.add_argument('--depth', type=int, default=4, help='num layers')
+    parser.add_argument('--n_sets', type=int, default=10000, help='num sets of values')
+    parser.add_argument('--n_assign', type=int, default=100,
+                        help='num sets of values bound with assign_variables')
+    args = parser.parse_args()
+
+    template, template_variables = variational_circuit(args.n_qubits, args.depth)
+    values = np.random.RandomState(42).rand(args.n_sets, len(template_variables))
+
+    tstart = time.time()
+    for row in values[:args.n_assign]:
+        template.assign_variables(dict(zip(template_variables, row)))
+    assign_time = (time.time() - tstart) / args.n_assign
+
+    tstart = time.time()
+    binder = VariableBinder(template, template_variables)
+    compile_time = time.time() - tstart
+    tstart = time.time()
+    circuits = binder.bind_all(values)
+    bind_time = (time.time() - tstart) / args.n_sets
+
+    tstart = time.time()
+    assemble_circuits(circuits[:args.n_assign])
+    assemble_time = (time.time() - tstart) / args.n_assign
+
+    tstart = time.time()
+    assemble_circuit_sweep(template, values, template_variables)
+    sweep_time = (time.time() - tstart) / args.n_sets
+
+    print("assign_variables:       {:.3f}ms per set".format(1000 * assign_time))
+    print("VariableBinder:         {:.3f}ms per set (+{:.3f}s to compile)".format(
+        1000 * bind_time, compile_time))
+    print("assemble_circuits:      {:.3f}ms per set".format(1000 * assemble_time))
+    print("assemble_circuit_sweep: {:.3f}ms per set".format(1000 * sweep_time))
@@ -8,8 +8,12 @@
 
 """Test cases for the circuit qasm_file and qasm_string method."""
 
+import sympy
+
 from qiskit import QiskitError
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.converters import ast_to_dag, dag_to_circuit
+from qiskit.qasm import Qasm
 from qiskit.test import QiskitTestCase, Path
 
 
@@ -161,3 +165,27 @@ class LoadFromQasmTest(QiskitTestCase):
         q_circuit = QuantumCircuit.from_qasm_str(qasm_string)
 
         self.assertEqual(q_circuit.qasm(), expected_qasm)
+
+    def test_qasm_example_file_matches_dag(self):
+        """Test that loading a file matches converting its AST through a DAG."""
+        qasm_filename = self._get_resource_path('example.qasm', Path.QASMS)
+        expected = dag_to_circuit(ast_to_dag(Qasm(qasm_filename).parse()))
+
+        q_circuit = QuantumCircuit.from_qasm_file(qasm_filename)
+
+        self.assertEqual(q_circuit, expected)
+        self.assertEqual(q_circuit.qasm(), expected.qasm())
+
+    def test_qasm_text_universal_unitary(self):
+        """Test the U and CX built-in gates."""
+        qasm_string = """OPENQASM 2.0;
+        qreg q[2];
+        U(pi/2,0,pi) q[0];
+        CX q[0],q[1];"""
+        q_circuit = QuantumCircuit.from_qasm_str(qasm_string)
+
+        qr = QuantumRegister(2, 'q')
+        expected = QuantumCircuit(qr)
+        expected.u_base(sympy.pi / 2, 0, sympy.pi, qr[0])
+        expected.cx_base(qr[0], qr[1])
+        self.assertEqual(q_circuit, expected)
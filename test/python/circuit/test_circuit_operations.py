@@ -8,9 +8,12 @@
 
 """Test Qiskit's QuantumCircuit class."""
 
+import sympy
+
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import execute
+from qiskit.converters import circuit_to_dag
 from qiskit import QiskitError
 from qiskit.test import QiskitTestCase
 
@@ -148,6 +151,98 @@ class TestCircuitOperations(QiskitTestCase):
 
         self.assertEqual(qc, qc.copy())
 
+    def test_shallow_copy_circuit(self):
+        """Test a shallow copy shares the instructions without variables"""
+        qr = QuantumRegister(2)
+        qc = QuantumCircuit(qr)
+        theta = sympy.Symbol('theta')
+        qc.h(qr[0])
+        qc.rz(theta, qr[1])
+        cpy = qc.copy(name='copy', shallow=True)
+        self.assertEqual(cpy.name, 'copy')
+        self.assertEqual(cpy.data, qc.data)
+        self.assertIs(cpy.data[0][0], qc.data[0][0])
+        self.assertIsNot(cpy.data[1][0], qc.data[1][0])
+
+        cpy.h(qr[1])
+        cpy.variable_table[theta] = 0.5
+        self.assertEqual(len(qc.data), 2)
+        self.assertEqual(qc.data[1][0].params, [theta])
+        self.assertEqual(cpy.data[1][0].params, [0.5])
+
+    def test_extend_circuit_self(self):
+        """Test extending a circuit with itself, and the variables of the result.
+        """
+        qr = QuantumRegister(2)
+        qc = QuantumCircuit(qr)
+        theta = sympy.Symbol('theta')
+        qc.h(qr[0])
+        qc.rz(theta, qr[1])
+        expected = qc.data * 2
+        qc += qc
+        self.assertEqual(qc.data, expected)
+        self.assertEqual(len(qc._variable_table[theta]), 2)
+
+    def test_circuit_fingerprint(self):
+        """Test equal circuits have equal fingerprints.
+        """
+        qr = QuantumRegister(3)
+        cr = ClassicalRegister(3)
+        qc1 = QuantumCircuit(qr, cr)
+        qc1.h(qr[0])
+        qc1.x(qr[1])
+        qc1.cx(qr[0], qr[2])
+        qc1.measure(qr, cr)
+        qc2 = QuantumCircuit(qr, cr)
+        qc2.x(qr[1])
+        qc2.h(qr[0])
+        qc2.cx(qr[0], qr[2])
+        qc2.measure(qr, cr)
+        qc3 = QuantumCircuit(qr, cr)
+        qc3.h(qr[0])
+        qc3.x(qr[1])
+        qc3.cx(qr[2], qr[0])
+        qc3.measure(qr, cr)
+
+        self.assertEqual(qc1.fingerprint(), qc2.fingerprint())
+        self.assertEqual(qc1, qc2)
+        self.assertNotEqual(qc1.fingerprint(), qc3.fingerprint())
+        self.assertNotEqual(qc1, qc3)
+
+    def test_circuit_eq_params_tolerance(self):
+        """Test circuits with params equal up to a tolerance are equal.
+        """
+        qr = QuantumRegister(1)
+        qc1 = QuantumCircuit(qr)
+        qc1.u1(0.1, qr[0])
+        qc2 = QuantumCircuit(qr)
+        qc2.u1(0.1 + 1e-12, qr[0])
+
+        self.assertNotEqual(qc1.fingerprint(), qc2.fingerprint())
+        self.assertEqual(qc1.fingerprint(params=False), qc2.fingerprint(params=False))
+        self.assertEqual(qc1, qc2)
+
+    def test_circuit_eq_params_hash_collision(self):
+        """Test circuits with params of equal hashes are not equal.
+        """
+        qr = QuantumRegister(1)
+        qc1 = QuantumCircuit(qr)
+        qc1.u3(-1, 0, 0, qr[0])
+        qc1.rz(-1, qr[0])
+        qc2 = QuantumCircuit(qr)
+        qc2.u3(-2, 0, 0, qr[0])
+        qc2.rz(-2, qr[0])
+
+        self.assertEqual(qc1.fingerprint(), qc2.fingerprint())
+        self.assertNotEqual(qc1, qc2)
+        self.assertNotEqual(circuit_to_dag(qc1), circuit_to_dag(qc2))
+
+    def test_circuits_not_hashable(self):
+        """Test that circuits, which are mutable, are not hashable.
+        """
+        with self.assertRaises(TypeError):
+            hash(QuantumCircuit(QuantumRegister(1)))
+
 
 class TestCircuitBuilding(QiskitTestCase):
     """QuantumCircuit tests."""
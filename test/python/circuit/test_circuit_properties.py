@@ -341,6 +341,28 @@ class TestCircuitProperties(QiskitTestCase):
         qc.measure(q[3], c[3])
         self.assertEqual(qc.num_connected_components(), 1)
 
+    def test_circuit_connected_components_with_cond_register(self):
+        """Test connected components with a conditional on a connected register
+        """
+        q = QuantumRegister(3, 'q')
+        c = ClassicalRegister(2, 'c')
+        qc = QuantumCircuit(q, c)
+        qc.measure(q[0], c[0])
+        qc.measure(q[0], c[1])
+        qc.x(q[1]).c_if(c, 1)
+        self.assertEqual(qc.num_connected_components(), 2)
+
+    def test_circuit_size(self):
+        """Test that directives are not counted in the circuit size
+        """
+        q = QuantumRegister(2, 'q')
+        qc = QuantumCircuit(q)
+        qc.h(q[0])
+        qc.barrier(q)
+        qc.cx(q[0], q[1])
+        qc.barrier(q[1])
+        self.assertEqual(qc.size(), 2)
+
     def test_circuit_unitary_factors1(self):
         """Test unitary factors empty circuit
         """
@@ -400,6 +422,59 @@ class TestCircuitProperties(QiskitTestCase):
         qc.measure(q[3], c[0])
         self.assertEqual(qc.num_unitary_factors(), 5)
 
+    def test_circuit_properties(self):
+        """Test that the properties match the individual metrics."""
+        q = QuantumRegister(3, 'q')
+        c = ClassicalRegister(2, 'c')
+        qc = QuantumCircuit(q, c)
+        qc.h(q[0])
+        qc.cx(q[0], q[1])
+        qc.barrier(q)
+        qc.measure(q[1], c[0])
+        qc.x(q[2]).c_if(c, 1)
+        self.assertEqual(qc.properties(),
+                         {'size': 4, 'depth': 4, 'width': 5, 'bits': 2, 'factors': 2,
+                          'components': 1, 'operations': {'h': 1, 'cx': 1, 'barrier': 1,
+                                                          'measure': 1, 'x': 1}})
+
+    def test_circuit_metrics_cached(self):
+        """Test that the cached metrics follow the changes of the circuit."""
+        q = QuantumRegister(2, 'q')
+        c = ClassicalRegister(2, 'c')
+        qc = QuantumCircuit(q, c)
+        qc.h(q[0])
+        self.assertEqual(qc.depth(), 1)
+        self.assertEqual(qc.num_connected_components(), 4)
+        qc.cx(q[0], q[1])
+        self.assertEqual(qc.depth(), 2)
+        x_gate = qc.x(q[1])
+        self.assertEqual(qc.num_connected_components(), 3)
+        x_gate.c_if(c, 0)
+        self.assertEqual(qc.num_connected_components(), 1)
+        qc.count_ops()['x'] = 0
+        self.assertEqual(qc.count_ops(), {'h': 1, 'cx': 1, 'x': 1})
+        del qc.data[1:]
+        self.assertEqual(qc.size(), 1)
+        qc.add_register(QuantumRegister(1, 'r'))
+        self.assertEqual(qc.width(), 5)
+        qc.data = [qc.data[0]] * 3
+        self.assertEqual(qc.depth(), 3)
+
+    def test_circuit_metrics_cached_shared_condition(self):
+        """Test that the cached metrics of the circuits sharing an instruction
+        follow the changes of its condition."""
+        q = QuantumRegister(1, 'q')
+        c = ClassicalRegister(1, 'c')
+        for columnar in [False, True]:
+            qc = QuantumCircuit(q, c, columnar=columnar)
+            x_gate = qc.x(q[0])
+            shallow_copy = qc.copy(shallow=True)
+            self.assertEqual(qc.num_connected_components(), 2)
+            self.assertEqual(shallow_copy.num_connected_components(), 2)
+            x_gate.c_if(c, 1)
+            self.assertEqual(qc.num_connected_components(), 1)
+            self.assertEqual(shallow_copy.num_connected_components(), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -53,9 +53,9 @@ include "qelib1.inc";
 qreg qr1[1];
 qreg qr2[2];
 creg cr[3];
-u1(0.300000000000000) qr1[0];
-u2(0.200000000000000,0.100000000000000) qr2[0];
-u3(0.300000000000000,0.200000000000000,0.100000000000000) qr2[1];
+u1(0.3) qr1[0];
+u2(0.2,0.1) qr2[0];
+u3(0.3,0.2,0.1) qr2[1];
 s qr2[1];
 sdg qr2[1];
 cx qr1[0],qr2[1];
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Test the columnar storage of circuits."""
+
+import copy
+import pickle
+import unittest
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit.columnardata import ColumnarData
+from qiskit.compiler import assemble_circuits
+from qiskit.exceptions import QiskitError
+from qiskit.test import QiskitTestCase
+
+
+def _build_circuit(columnar):
+    """Build a circuit with two quantum and two classical registers."""
+    qr = QuantumRegister(3, 'q')
+    qr2 = QuantumRegister(2, 'r')
+    cr = ClassicalRegister(2, 'c')
+    cr2 = ClassicalRegister(1, 'd')
+    circuit = QuantumCircuit(qr, qr2, cr, name='circuit', columnar=columnar)
+    circuit.h(qr[0])
+    circuit.cx(qr[0], qr2[1])
+    circuit.barrier(qr)
+    circuit.u1(0.3, qr[2])
+    circuit.measure(qr[0], cr[1])
+    circuit.add_register(cr2)
+    circuit.x(qr2[0]).c_if(cr, 1)
+    circuit.ccx(qr[1], qr[2], qr2[0])
+    circuit.measure(qr2[1], cr2[0])
+    circuit.y(qr[1]).c_if(cr2, 0)
+    return circuit
+
+
+class TestColumnarData(QiskitTestCase):
+    """ColumnarData tests."""
+
+    def setUp(self):
+        self.circuit = _build_circuit(columnar=False)
+        self.columnar = _build_circuit(columnar=True)
+
+    def test_data(self):
+        """Test that the columnar data matches the list data."""
+        self.assertIsInstance(self.columnar.data, ColumnarData)
+        self.assertEqual(list(self.columnar.data), self.circuit.data)
+        self.assertEqual(self.columnar.data, self.circuit.data)
+        self.assertEqual(self.columnar, self.circuit)
+        self.assertEqual(self.columnar.data[-1], self.circuit.data[-1])
+        self.assertEqual(self.columnar.data[1:4], self.circuit.data[1:4])
+
+    def test_columns(self):
+        """Test the op-codes and the bit indices."""
+        data = self.columnar.data
+        self.assertEqual(data.opcodes.tolist(), list(range(9)))
+        self.assertEqual(data.table, [instruction for instruction, _, _ in self.circuit.data])
+        self.assertEqual(data.qubit_offsets.tolist(), [0, 1, 3, 6, 7, 8, 9, 12, 13, 14])
+        self.assertEqual(data.qubit_indices.tolist(),
+                         [0, 0, 4, 0, 1, 2, 2, 0, 3, 1, 2, 3, 4, 1])
+        self.assertEqual(data.clbit_indices.tolist(), [1, 2])
+        self.assertEqual(list(data.indexed())[4][1:], ([0], [1]))
+
+    def test_metrics(self):
+        """Test the circuit metrics of a columnar circuit."""
+        for method in ['size', 'depth', 'width', 'count_ops',
+                       'num_unitary_factors', 'num_connected_components', 'properties']:
+            with self.subTest(method=method):
+                self.assertEqual(getattr(self.columnar, method)(),
+                                 getattr(self.circuit, method)())
+
+    def test_shared_instruction(self):
+        """Test that an instruction appended twice has a single op-code."""
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr, columnar=True)
+        instruction = circuit.h(qr[0])
+        circuit.append(instruction, [qr[1]])
+        self.assertEqual(circuit.data.opcodes.tolist(), [0, 0])
+        self.assertEqual(circuit.count_ops(), {'h': 2})
+        self.assertEqual(circuit.depth(), 1)
+
+    def test_equal_instructions(self):
+        """Test that equal instructions that are distinct objects have their op-codes."""
+        qr = QuantumRegister(1)
+        circuit = QuantumCircuit(qr, columnar=True)
+        circuit.u1(0.1, qr[0])
+        circuit.u1(0.1, qr[0])
+        self.assertEqual(circuit.data.opcodes.tolist(), [0, 1])
+        self.assertEqual(circuit.data[0][0], circuit.data[1][0])
+        self.assertIsNot(circuit.data[0][0], circuit.data[1][0])
+        self.assertEqual(circuit.count_ops(), {'u1': 2})
+
+    def test_release_instructions(self):
+        """Test that the table releases the instructions that are no longer used."""
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr, columnar=True)
+        instruction = circuit.u1(0.1, qr[0])
+        circuit.append(instruction, [qr[1]])
+        circuit.h(qr[0])
+        del circuit.data[0]
+        self.assertEqual(circuit.data.table, [instruction, circuit.data[1][0]])
+        del circuit.data[0]
+        self.assertEqual(circuit.data.table, [None, circuit.data[0][0]])
+        self.assertEqual(circuit.count_ops(), {'h': 1})
+        self.assertEqual(circuit.depth(), 1)
+
+        # the released op-code is reused
+        circuit.data[0] = (instruction, [qr[1]], [])
+        self.assertEqual(circuit.data.table, [None, instruction])
+        circuit.x(qr[0])
+        self.assertEqual(circuit.data.opcodes.tolist(), [1, 0])
+        self.assertEqual(circuit.count_ops(), {'u1': 1, 'x': 1})
+        self.assertEqual(copy.deepcopy(circuit.data), circuit.data)
+
+    def test_insert_delete(self):
+        """Test inserting and deleting instructions."""
+        data = self.columnar.data
+        expected = list(self.circuit.data)
+        for index, item in [(0, expected[3]), (5, expected[1]), (-1, expected[8]),
+                            (100, expected[4])]:
+            data.insert(index, item)
+            expected.insert(index, item)
+            self.assertEqual(list(data), expected)
+        for index in [0, 3, -1, slice(2, 6)]:
+            del data[index]
+            del expected[index]
+            self.assertEqual(list(data), expected)
+        data[1] = expected[0]
+        expected[1] = expected[0]
+        self.assertEqual(list(data), expected)
+        self.assertEqual(self.columnar.depth(), _list_circuit(self.circuit, expected).depth())
+
+    def test_bits_not_in_circuit(self):
+        """Test appending bits that are not in the circuit."""
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr, columnar=True)
+        with self.assertRaises(QiskitError):
+            circuit.h(QuantumRegister(1)[0])
+        self.assertEqual(len(circuit.data), 0)
+
+    def test_copy(self):
+        """Test copying and pickling a columnar circuit."""
+        expected = copy.deepcopy(self.circuit)
+        expected.h(expected.qregs[1][0])
+        for copied in [copy.deepcopy(self.columnar), pickle.loads(pickle.dumps(self.columnar))]:
+            self.assertEqual(copied.data, self.circuit.data)
+            copied.h(copied.qregs[1][0])
+            self.assertEqual(copied.data, expected.data)
+            self.assertEqual(copied.depth(), expected.depth())
+
+    def test_combine(self):
+        """Test combining columnar circuits with list circuits."""
+        qr = QuantumRegister(2, 's')
+        cr = ClassicalRegister(2, 'c')
+        rhs = QuantumCircuit(qr, cr)
+        rhs.cx(qr[1], qr[0])
+        rhs.measure(qr, cr)
+        expected = self.circuit + rhs
+        for lhs in [self.columnar, self.columnar.copy(shallow=True)]:
+            for other in [rhs, QuantumCircuit(qr, cr, columnar=True) + rhs]:
+                combined = lhs + other
+                self.assertIsInstance(combined.data, ColumnarData)
+                self.assertEqual(combined.data, expected.data)
+                self.assertEqual(combined.depth(), expected.depth())
+        self.columnar.extend(self.columnar)
+        self.assertEqual(self.columnar.data, self.circuit.data * 2)
+
+    def test_to_instruction(self):
+        """Test converting a columnar circuit to an instruction."""
+        self.assertEqual(self.columnar.to_instruction().definition,
+                         self.circuit.to_instruction().definition)
+
+    def test_assemble(self):
+        """Test that a columnar circuit assembles as a list circuit."""
+        self.assertEqual(assemble_circuits(self.columnar, qobj_id='columnar').as_dict(),
+                         assemble_circuits(self.circuit, qobj_id='columnar').as_dict())
+
+
+def _list_circuit(circuit, data):
+    """Return a list circuit with the registers of ``circuit`` and ``data``."""
+    new_circuit = QuantumCircuit(*circuit.qregs, *circuit.cregs)
+    new_circuit.data = data
+    return new_circuit
+
+
+if __name__ == '__main__':
+    unittest.main()
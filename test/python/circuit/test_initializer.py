@@ -187,6 +187,23 @@ class TestInitialize(QiskitTestCase):
             fidelity, self._desired_fidelity,
             "Initializer has low fidelity {0:.2g}.".format(fidelity))
 
+    def test_random_8qubit(self):
+        """Initialize to a random 8-qubit state with some zero amplitudes."""
+        rng = np.random.RandomState(42)
+        desired_vector = rng.rand(256) * np.exp(2j * np.pi * rng.rand(256))
+        desired_vector[rng.rand(256) < 0.3] = 0
+        desired_vector /= np.linalg.norm(desired_vector)
+        qr = QuantumRegister(8, "qr")
+        qc = QuantumCircuit(qr)
+        qc.initialize(desired_vector, qr)
+        job = execute(qc, BasicAer.get_backend('statevector_simulator'))
+        result = job.result()
+        statevector = result.get_statevector()
+        fidelity = state_fidelity(statevector, desired_vector)
+        self.assertGreater(
+            fidelity, self._desired_fidelity,
+            "Initializer has low fidelity {0:.2g}.".format(fidelity))
+
     def test_malformed_amplitudes(self):
         """Initializing to a vector with 3 amplitudes fails."""
         desired_vector = [1 / math.sqrt(3), math.sqrt(2) / math.sqrt(3), 0]
@@ -7,6 +7,8 @@
 
 """Test Qiskit's Instruction class."""
 
+import copy
+import pickle
 import unittest
 
 from qiskit.circuit import Gate
@@ -15,6 +17,9 @@ from qiskit.circuit import QuantumCircuit
 from qiskit.circuit import QuantumRegister, ClassicalRegister
 from qiskit.extensions.standard.h import HGate
 from qiskit.extensions.standard.cx import CnotGate
+from qiskit.extensions.standard.u1 import U1Gate
+from qiskit.extensions.standard.u3 import U3Gate
+from qiskit.extensions.standard.ccx import ToffoliGate
 from qiskit.test import QiskitTestCase
 from qiskit.exceptions import QiskitError
 
@@ -207,6 +212,107 @@ class TestInstructions(QiskitTestCase):
         opaque_gate = Gate(name='crz_2', num_qubits=2, params=[0.5])
         self.assertRaises(QiskitError, opaque_gate.inverse)
 
+    def test_flyweight(self):
+        """test parameterless gates have a shared instance"""
+        shared = HGate().flyweight()
+        self.assertIs(shared, HGate().flyweight())
+        self.assertEqual(shared, HGate())
+        self.assertIsNot(shared, CnotGate().flyweight())
+        self.assertIs(copy.deepcopy(shared), shared)
+        self.assertIs(pickle.loads(pickle.dumps(shared)), shared)
+        self.assertIsNot(copy.copy(shared), shared)
+        self.assertIsNone(U1Gate(0.1).flyweight())
+        self.assertIsNone(HGate().c_if(ClassicalRegister(1), 1).flyweight())
+        self.assertIsNone(HGate().copy(name='h2').flyweight())
+
+    def test_flyweight_not_modified(self):
+        """test a shared instance cannot be modified, and its copies can"""
+        cr = ClassicalRegister(1)
+        shared = HGate().flyweight()
+        with self.assertRaises(QiskitError):
+            shared.c_if(cr, 1)
+        with self.assertRaises(QiskitError):
+            shared.control = (cr, 1)
+        with self.assertRaises(QiskitError):
+            shared.name = 'h2'
+        with self.assertRaises(QiskitError):
+            shared.params = [0.1]
+        self.assertIsNone(shared.control)
+        self.assertEqual(shared.name, 'h')
+        self.assertEqual(shared.params, [])
+
+        conditioned = shared.copy().c_if(cr, 1)
+        self.assertIsNot(conditioned, shared)
+        self.assertEqual(conditioned.control, (cr, 1))
+        self.assertEqual(shared.copy(name='h2').name, 'h2')
+
+    def test_flyweight_in_circuit_data(self):
+        """test the shared instances of a converted circuit cannot be modified"""
+        qr = QuantumRegister(1, 'q')
+        cr = ClassicalRegister(1, 'c')
+        circuit = QuantumCircuit.from_qasm_str(
+            'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\ncreg c[1];\nh q[0];\nh q[0];\n')
+        self.assertIs(circuit.data[0][0], circuit.data[1][0])
+        with self.assertRaises(QiskitError):
+            circuit.data[1][0].name = 'zz'
+        with self.assertRaises(QiskitError):
+            circuit.data[0][0].c_if(cr, 1)
+        self.assertEqual(circuit.count_ops(), {'h': 2})
+
+        circuit.data[0] = (circuit.data[0][0].copy().c_if(cr, 1), [qr[0]], [])
+        self.assertEqual(circuit.qasm().count('if(c==1) h q[0];'), 1)
+
+    def test_slots(self):
+        """test standard instructions have no instance dict"""
+        self.assertFalse(hasattr(HGate(), '__dict__'))
+        self.assertFalse(hasattr(U1Gate(0.1), '__dict__'))
+        self.assertFalse(hasattr(QuantumRegister(1), '__dict__'))
+
+    def test_params_not_from_class_definition(self):
+        """test params of a gate are not taken from its decomposition"""
+        gate = HGate()
+        self.assertTrue(gate.definition)
+        self.assertEqual(gate.params, [])
+        self.assertEqual(gate.qasm(), 'h')
+
+    def test_definition_cached(self):
+        """test equal gates share the instructions of their definition"""
+        definition = ToffoliGate().definition
+        other = ToffoliGate().definition
+        self.assertIsNot(other, definition)
+        self.assertEqual(other, definition)
+        for (instruction, _, _), (other_instruction, _, _) in zip(definition, other):
+            self.assertIs(other_instruction, instruction)
+        definition.pop()
+        self.assertEqual(len(ToffoliGate().definition), len(other))
+
+        self.assertEqual(U3Gate(0.1, 0.2, 0.3).definition[0][0].params, [0.1, 0.2, 0.3])
+        self.assertEqual(U3Gate(0.1, 0.2, 0.4).definition[0][0].params, [0.1, 0.2, 0.4])
+
+    def test_definition_after_params(self):
+        """test the definition of a gate follows its params"""
+        gate = U3Gate(0.1, 0.2, 0.3)
+        self.assertEqual(gate.definition[0][0].params, [0.1, 0.2, 0.3])
+        gate.params = [0.4, 0.5, 0.6]
+        self.assertEqual(gate.definition[0][0].params, [0.4, 0.5, 0.6])
+
+    def test_inverse_large_composite(self):
+        """test inverting and mirroring a composite instruction does not copy its
+        definition"""
+        qr = QuantumRegister(2, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.u1(0.1, qr[1])
+        instruction = circuit.to_instruction()
+        inverse = instruction.inverse()
+        mirror = instruction.mirror()
+        self.assertEqual([inst.name for inst, _, _ in inverse.definition], ['u1', 'cx', 'h'])
+        self.assertEqual(inverse.definition[0][0].params, [-0.1])
+        self.assertEqual(inverse.params, [-0.1])
+        self.assertEqual(mirror.definition, circuit.data[::-1])
+        self.assertEqual(instruction.definition, circuit.data)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,10 +12,13 @@ import sympy
 
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
-from qiskit.circuit import Gate
+from qiskit.circuit import Gate, VariableBinder
+from qiskit.converters import circuit_to_dag
+from qiskit.exceptions import QiskitError
 from qiskit.transpiler import transpile
 from qiskit.compiler import assemble_circuits
 from qiskit.test import QiskitTestCase
+from qiskit.transpiler.passes import Unroller
 
 
 class TestVariableParameters(QiskitTestCase):
@@ -130,6 +133,22 @@ class TestVariableParameters(QiskitTestCase):
         qc2.append(gate, qargs=[qr2[1]])
         self.assertEqual(qc2.variables, {theta, phi})
 
+    def test_assign_variables_copies(self):
+        """Test modifying the circuit of assign_variables leaves the circuit unchanged"""
+        theta = sympy.Symbol('θ')
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(1)
+        qc = QuantumCircuit(qr, cr)
+        qc.rx(theta, qr[0])
+        qc.u1(0.5, qr[1])
+        bound = qc.assign_variables({theta: 0.1})
+        bound.data[1][0].c_if(cr, 1)
+        bound.data[1][0].params = [0.7]
+
+        self.assertIsNone(qc.data[1][0].control)
+        self.assertEqual(qc.data[1][0].params, [0.5])
+        self.assertEqual(qc.data[0][0].params, [theta])
+
     def test_parameter_expression(self):
         """Test evaluation with parameter expressions"""
         x = sympy.Symbol('x')
@@ -151,3 +170,102 @@ class TestVariableParameters(QiskitTestCase):
             self.assertEqual(circs[index].data[0][0].params[0], ones)
             self.assertEqual(circs[index].data[1][0].params[0], ones + tens)
             self.assertEqual(circs[index].data[2][0].params[0], -ones)
+
+    def test_binder_bind_all(self):
+        """Test binding an array of values with a VariableBinder"""
+        theta = sympy.Symbol('θ')
+        x = sympy.Symbol('x')
+        qr = QuantumRegister(2)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.u3(0, theta + x, 2 * x, qr[1])
+        binder = VariableBinder(qc)
+        self.assertEqual(binder.variables, [x, theta])
+        self.assertEqual(binder.slots, [(0, 0), (2, 1), (2, 2)])
+
+        values = numpy.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+        circuits = binder.bind_all(values)
+        self.assertEqual(len(circuits), 3)
+        for circuit, (x_value, theta_value) in zip(circuits, values):
+            self.assertEqual(circuit.variables, set())
+            self.assertEqual(circuit.data[0][0].params, [theta_value])
+            self.assertEqual(circuit.data[2][0].params,
+                             [0, theta_value + x_value, 2 * x_value])
+            for param in circuit.data[2][0].params[1:]:
+                self.assertIsInstance(param, float)
+            # instructions without variables are shared with the template
+            self.assertIs(circuit.data[1][0], qc.data[1][0])
+            self.assertEqual(circuit, qc.assign_variables({x: x_value, theta: theta_value}))
+
+        # the template is left unchanged
+        self.assertEqual(qc.variables, {theta, x})
+        self.assertEqual(qc.data[0][0].params, [theta])
+
+    def test_binder_bind_dict(self):
+        """Test binding values given by variable with a VariableBinder"""
+        theta = sympy.Symbol('θ')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr[0])
+        qc.rz(sympy.pi / 2, qr[0])
+        binder = VariableBinder(qc)
+
+        theta_list = numpy.linspace(0, numpy.pi, 5)
+        circuits = binder.bind_all({theta: theta_list})
+        self.assertEqual([circuit.data[0][0].params[0] for circuit in circuits],
+                         theta_list.tolist())
+
+        circuit = binder.bind({theta: 0.5})
+        self.assertEqual(circuit.data[0][0].params, [0.5])
+
+    def test_binder_partial(self):
+        """Test binding some of the variables with a VariableBinder"""
+        theta = sympy.Symbol('θ')
+        phi = sympy.Symbol('phi')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr[0])
+        qc.ry(phi, qr[0])
+        qc.rz(theta + phi, qr[0])
+        binder = VariableBinder(qc, [theta])
+
+        circuit = binder.bind({theta: 0.5})
+        self.assertEqual(circuit.variables, {phi})
+        self.assertEqual(circuit.data[0][0].params, [0.5])
+        self.assertEqual(circuit.data[2][0].params, [phi + 0.5])
+
+        # binding the remaining variable does not modify the template
+        circuit.variable_table[phi] = 0.25
+        self.assertEqual(circuit.data[1][0].params, [0.25])
+        self.assertEqual(qc.data[1][0].params, [phi])
+
+    def test_binder_definition(self):
+        """Test that bound instructions are unrolled with their bound values"""
+        theta = sympy.Symbol('θ')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr[0])
+        # cache the symbolic definition in the template
+        Unroller(['u3']).run(circuit_to_dag(qc))
+
+        circuit = VariableBinder(qc).bind({theta: 0.5})
+        unrolled_dag = Unroller(['u3']).run(circuit_to_dag(circuit))
+        self.assertEqual(unrolled_dag.op_nodes()[0].op.params,
+                         [0.5, -sympy.pi / 2, sympy.pi / 2])
+
+    def test_binder_wrong_values(self):
+        """Test binding values that do not match the variables"""
+        theta = sympy.Symbol('θ')
+        x = sympy.Symbol('x')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.u3(theta, x, 0, qr[0])
+        binder = VariableBinder(qc)
+
+        with self.assertRaises(QiskitError):
+            binder.bind({theta: 0.5})
+        with self.assertRaises(QiskitError):
+            binder.bind_all({theta: [0.1, 0.2], x: [0.1, 0.2, 0.3]})
+        with self.assertRaises(QiskitError):
+            binder.bind_all(numpy.zeros((4, 3)))
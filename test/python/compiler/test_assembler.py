@@ -10,11 +10,15 @@
 import unittest
 
 import numpy as np
+import sympy
 
+from qiskit import BasicAer
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Instruction
-from qiskit.compiler import assemble_circuits
+from qiskit.compiler import assemble_circuits, assemble_circuit_sweep
 from qiskit.compiler import RunConfig
+from qiskit.compiler import TranspileConfig
+from qiskit.exceptions import QiskitError
 from qiskit.qobj import QasmQobj
 from qiskit.test import QiskitTestCase
 
@@ -175,6 +179,91 @@ class TestAssembler(QiskitTestCase):
         self.assertTrue(hasattr(h_op, 'conditional'))
         self.assertEqual(bfunc_op.register, h_op.conditional)
 
+    def test_assemble_circuit_sweep(self):
+        """Test assembling a circuit for several values of its variables."""
+        theta = sympy.Symbol('θ')
+        phi = sympy.Symbol('phi')
+        qr = QuantumRegister(2, name='q')
+        cr = ClassicalRegister(2, name='c')
+        circ = QuantumCircuit(qr, cr, name='circ')
+        circ.rx(theta, qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.measure(qr, cr)
+        circ.u1(theta + phi, qr[1]).c_if(cr, 1)
+        circ.h(qr[0])
+
+        values = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+        qobj = assemble_circuit_sweep(circ, values, run_config=RunConfig(shots=100))
+        self.assertIsInstance(qobj, QasmQobj)
+        self.assertEqual(qobj.config.shots, 100)
+        self.assertEqual(len(qobj.experiments), 3)
+
+        for index, (experiment, (phi_value, theta_value)) in enumerate(
+                zip(qobj.experiments, values)):
+            bound = circ.assign_variables({theta: theta_value, phi: phi_value})
+            bound.name = 'circ[%d]' % index
+            expected = assemble_circuits(bound).experiments[0]
+            self.assertEqual(experiment.to_dict(), expected.to_dict())
+        self.assertIs(qobj.experiments[0].instructions[1], qobj.experiments[1].instructions[1])
+
+    def test_assemble_circuit_sweep_transpile(self):
+        """Test transpiling the circuit of a sweep."""
+        theta = sympy.Symbol('θ')
+        qr = QuantumRegister(1, name='q')
+        circ = QuantumCircuit(qr, name='circ')
+        circ.rx(theta, qr[0])
+
+        qobj = assemble_circuit_sweep(circ, {theta: [0.5, 1.5]},
+                                      transpile_config=TranspileConfig(basis_gates=['u3']))
+        self.assertEqual([experiment.instructions[0].name for experiment in qobj.experiments],
+                         ['u3', 'u3'])
+        self.assertEqual([float(experiment.instructions[0].params[0])
+                          for experiment in qobj.experiments], [0.5, 1.5])
+
+    def test_assemble_circuit_sweep_coupling_map(self):
+        """Test transpiling the circuit of a sweep onto a coupling map."""
+        theta = sympy.Symbol('θ')
+        qr = QuantumRegister(2, name='q')
+        cr = ClassicalRegister(2, name='c')
+        circ = QuantumCircuit(qr, cr, name='circ')
+        circ.rx(theta, qr[0])
+        circ.u1(0.3, qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.rz(theta, qr[1])
+        circ.u1(0.2, qr[1])
+        circ.measure(qr, cr)
+
+        for optimization_level in range(4):
+            transpile_config = TranspileConfig(basis_gates=['u1', 'u2', 'u3', 'cx', 'id'],
+                                               coupling_map=[[1, 0], [2, 0], [2, 1]],
+                                               seed_mapper=1,
+                                               optimization_level=optimization_level)
+            qobj = assemble_circuit_sweep(circ, {theta: [0, np.pi]},
+                                          transpile_config=transpile_config,
+                                          run_config=RunConfig(shots=100))
+            result = BasicAer.get_backend('qasm_simulator').run(qobj).result()
+            self.assertEqual(result.get_counts('circ[0]'), {'00': 100})
+            self.assertEqual(result.get_counts('circ[1]'), {'11': 100})
+
+    def test_assemble_circuit_sweep_names(self):
+        """Test the results of a sweep can be told apart by name."""
+        theta = sympy.Symbol('θ')
+        qr = QuantumRegister(1, name='q')
+        cr = ClassicalRegister(1, name='c')
+        circ = QuantumCircuit(qr, cr, name='circ')
+        circ.u3(theta, 0, 0, qr[0])
+        circ.measure(qr, cr)
+
+        qobj = assemble_circuit_sweep(circ, {theta: [0, np.pi]},
+                                      run_config=RunConfig(shots=100))
+        self.assertEqual([experiment.header.name for experiment in qobj.experiments],
+                         ['circ[0]', 'circ[1]'])
+        result = BasicAer.get_backend('qasm_simulator').run(qobj).result()
+        self.assertEqual(result.get_counts('circ[0]'), {'0': 100})
+        self.assertEqual(result.get_counts('circ[1]'), {'1': 100})
+        with self.assertRaises(QiskitError):
+            result.get_counts(circ)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
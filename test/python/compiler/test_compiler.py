@@ -518,6 +518,45 @@ class TestCompiler(QiskitTestCase):
         threshold = 0.04 * shots
         self.assertDictAlmostEqual(counts, target, threshold)
 
+    def test_execute_duplicate_circuits(self):
+        """Identical circuits are transpiled once, and keep their names."""
+        qr = QuantumRegister(2, 'q')
+        cr = ClassicalRegister(2, 'c')
+        bell = QuantumCircuit(qr, cr, name='bell')
+        bell.h(qr[0])
+        bell.cx(qr[0], qr[1])
+        bell.measure(qr, cr)
+        other = bell.copy(name='other')
+        flip = QuantumCircuit(qr, cr, name='flip')
+        flip.x(qr)
+        flip.measure(qr, cr)
+
+        with self.assertLogs('qiskit.execute', level='INFO') as log:
+            job = execute([bell, flip, other, bell], backend=self.backend,
+                          seed=self.seed, shots=1024)
+        self.assertIn('Transpiling 2 unique circuits out of 4.', log.output[0])
+
+        result = job.result()
+        self.assertEqual([experiment.header.name for experiment in result.results],
+                         ['bell', 'flip', 'other', 'bell'])
+        self.assertEqual(result.get_counts(flip), {'11': 1024})
+        self.assertEqual(set(result.get_counts(other)), {'00', '11'})
+
+    def test_execute_circuits_params_hash_collision(self):
+        """Circuits with params of equal hashes are transpiled separately."""
+        qr = QuantumRegister(1, 'q')
+        cr = ClassicalRegister(1, 'c')
+        circuits = []
+        for theta in [-1, -2]:
+            circuit = QuantumCircuit(qr, cr, name='theta%d' % theta)
+            circuit.u3(theta, 0, 0, qr[0])
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+
+        job = execute(circuits, backend=self.backend, seed=self.seed, shots=1024)
+        self.assertEqual([experiment.instructions[0].params[0]
+                          for experiment in job.qobj().experiments], [-1, -2])
+
     def test_random_parameter_circuit(self):
         """Run a circuit with randomly generated parameters."""
         circ = QuantumCircuit.from_qasm_file(
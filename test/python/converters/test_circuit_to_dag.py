@@ -34,6 +34,24 @@ class TestCircuitToDag(QiskitTestCase):
         circuit_out = dag_to_circuit(dag)
         self.assertEqual(circuit_out, circuit_in)
 
+    def test_shared_instructions(self):
+        """Check parameterless gates are shared, and conditional ones are not"""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit_in = QuantumCircuit(qr, cr)
+        circuit_in.h(qr[0])
+        circuit_in.h(qr[1])
+        circuit_in.x(qr[0]).c_if(cr, 0x1)
+        circuit_in.measure(qr, cr)
+        circuit_out = dag_to_circuit(circuit_to_dag(circuit_in))
+        hadamard1, hadamard2, conditional, measure, _ = [inst for inst, _, _ in circuit_out.data]
+        self.assertIs(hadamard1, hadamard2)
+        self.assertIs(hadamard1, hadamard1.flyweight())
+        self.assertIs(measure, measure.flyweight())
+        self.assertIsNone(conditional.flyweight())
+        self.assertEqual(conditional.control, (cr, 0x1))
+        self.assertEqual(circuit_out, circuit_in)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -128,6 +128,23 @@ class TestQASMQobj(QiskitTestCase):
         self.assertTrue(qobj1.experiments[1].config.shots == 1)
         self.assertTrue(qobj1.config.shots == 1024)
 
+    def test_binary_round_trip(self):
+        """Test the binary serialization of a QasmQobj round-trips."""
+        qr = QuantumRegister(4)
+        cr = ClassicalRegister(4)
+        circuit = QuantumCircuit(qr, cr)
+        for i in range(20):
+            circuit.u3(0.1 * i, 0.2, 0.3, qr[i % 4])
+            circuit.cx(qr[i % 4], qr[(i + 1) % 4])
+        circuit.measure(qr, cr)
+        qobj = assemble_circuits([circuit, circuit],
+                                 RunConfig(shots=1024, memory_slots=4, seed=88))
+
+        self.assertEqual(qobj.to_dict(),
+                         QasmQobj.from_binary(qobj.to_binary()).to_dict())
+        self.assertEqual(self.valid_qobj,
+                         QasmQobj.from_binary(self.valid_qobj.to_binary(compress=True)))
+
 
 class TestPulseQobj(QiskitTestCase):
     """Tests for PulseQobj."""
@@ -248,6 +265,15 @@ class TestPulseQobj(QiskitTestCase):
             with self.subTest(msg=str(qobj_class)):
                 self.assertEqual(qobj_item, qobj_class.from_dict(expected_dict))
 
+    def test_binary_round_trip(self):
+        """Test the binary serialization of a PulseQobj round-trips."""
+        qobj_dict = copy.deepcopy(self.valid_dict)
+        qobj_dict['config']['pulse_library'][0]['samples'] = [[0.01 * i, -0.01 * i]
+                                                              for i in range(100)]
+        qobj = PulseQobj.from_dict(qobj_dict)
+
+        self.assertEqual(qobj.to_dict(), PulseQobj.from_binary(qobj.to_binary()).to_dict())
+
 
 def _nop():
     pass
@@ -9,6 +9,8 @@
 
 import unittest
 
+import numpy
+
 from qiskit import execute
 from qiskit.quantum_info.operators.measures import process_fidelity
 from qiskit.quantum_info.synthesis import two_qubit_kak
@@ -44,6 +46,23 @@ class TestSynthesis(QiskitTestCase):
         decomp_unitary = Unitary(result.get_unitary())
         self.assertAlmostEqual(decomp_unitary, unitary)
 
+    def test_two_qubit_kak_clifford(self):
+        """Verify KAK decomposition of Clifford unitaries, with degenerate spectra
+        """
+        cx01 = numpy.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]])
+        cx10 = numpy.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+        hadamard = numpy.array([[1, 1], [1, -1]]) / numpy.sqrt(2)
+        h_cx = cx01.dot(numpy.kron(numpy.identity(2), hadamard))
+        for matrix in [cx01, cx10, cx10.dot(cx01), cx01.dot(cx10).dot(cx01), h_cx]:
+            unitary = Unitary(matrix)
+            with self.subTest(matrix=matrix):
+                decomp_circuit = two_qubit_kak(unitary)
+                result = execute(decomp_circuit, UnitarySimulatorPy()).result()
+                decomp_unitary = Unitary(result.get_unitary())
+                self.assertAlmostEqual(
+                    process_fidelity(unitary.representation, decomp_unitary.representation),
+                    1.0, places=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,11 +8,15 @@
 
 """Test Qiskit's Result class."""
 
+import pickle
+
 import numpy as np
 
 from qiskit.result import models
 from qiskit.validation import base
+from qiskit.validation.exceptions import ModelValidationError
 from qiskit.result import Result
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
@@ -147,3 +151,143 @@ class TestResultOperations(QiskitTestCase):
         self.assertEqual(memory.shape, (2, 2, 3))
         self.assertEqual(memory.dtype, np.complex_)
         np.testing.assert_almost_equal(memory, processed_memory)
+
+    def test_binary_round_trip(self):
+        """Test the binary serialization of a Result round-trips."""
+        raw_memory = ['0x{:x}'.format(i % 16) for i in range(100)]
+        statevector = [0.125 * i - 0.125j * i for i in range(16)]
+        exp_result_header = base.Obj(creg_sizes=[['c0', 4]], memory_slots=4, name='exp')
+        memory_result = models.ExperimentResult(
+            shots=100, success=True, meas_level=2, memory=True, header=exp_result_header,
+            data=models.ExperimentResultData(memory=raw_memory, counts=base.Obj(**{'0x0': 7})))
+        statevector_result = models.ExperimentResult(
+            shots=1, success=True, meas_level=2,
+            data=models.ExperimentResultData(statevector=statevector))
+        result = Result(results=[memory_result, statevector_result], **self.base_result_args)
+
+        new_result = Result.from_binary(result.to_binary())
+
+        self.assertEqual(result.to_dict(), new_result.to_dict())
+        self.assertEqual(new_result.get_memory('exp'), result.get_memory('exp'))
+        np.testing.assert_array_equal(new_result.get_statevector(1),
+                                      result.get_statevector(1))
+
+    def test_memory_as_array(self):
+        """Test that memory is extracted properly as a bit array."""
+        raw_memory = ['0x0', '0x1', '0x2', '0x2', '0x9']
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = base.Obj(creg_sizes=[['c0', 4]], memory_slots=4)
+        exp_result = models.ExperimentResult(shots=5, success=True, meas_level=2,
+                                             memory=True, data=data,
+                                             header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+        memory = result.get_memory(0, as_array=True)
+
+        self.assertEqual(memory.shape, (5, 4))
+        np.testing.assert_array_equal(memory, [[0, 0, 0, 0],
+                                               [1, 0, 0, 0],
+                                               [0, 1, 0, 0],
+                                               [0, 1, 0, 0],
+                                               [1, 0, 0, 1]])
+
+    def test_postprocessed_data_not_shared(self):
+        """Test that modifying returned counts and memory does not affect the Result."""
+        raw_counts = {'0x0': 4, '0x2': 10}
+        raw_memory = ['0x0', '0x2']
+        data = models.ExperimentResultData(counts=base.Obj(**raw_counts), memory=raw_memory)
+        exp_result = models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                             memory=True, data=data)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        result.get_counts(0)['0'] = 100
+        result.get_memory(0).append('11')
+
+        self.assertEqual(result.get_counts(0), {'0': 4, '10': 10})
+        self.assertEqual(result.get_memory(0), ['0', '10'])
+        self.assertEqual(result, Result.from_dict(result.to_dict()))
+
+    def test_get_experiment_by_name(self):
+        """Test that experiments are found by name, also after modifying the results."""
+        exp_results = []
+        for name in ['a', 'b', 'a']:
+            data = models.ExperimentResultData(counts=base.Obj(**{'0x0': len(exp_results)}))
+            exp_results.append(models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                                       data=data, header=base.Obj(name=name)))
+        result = Result(results=list(exp_results), **self.base_result_args)
+
+        self.assertEqual(result.get_counts('a'), {'0': 0})
+        self.assertEqual(result.get_counts('b'), {'0': 1})
+
+        result.results[0] = result.results[1]
+        self.assertEqual(result.get_counts('a'), {'0': 2})
+
+        exp_results[0].header.name = 'c'
+        result.results.append(exp_results[0])
+        self.assertEqual(result.get_counts('c'), {'0': 0})
+
+        with self.assertRaises(QiskitError):
+            result.get_counts('d')
+
+    def test_get_experiment_after_rename(self):
+        """Test that the first experiment with a name is found after renaming experiments."""
+        result = Result.from_dict(dict(self.base_result_args, results=[
+            {'shots': 14, 'success': True, 'meas_level': 2,
+             'data': {'counts': {'0x0': value}}, 'header': {'name': name}}
+            for value, name in enumerate(['a', 'b', 'c'])]))
+        self.assertIsInstance(result.results[0].header, models.ExperimentResultHeader)
+
+        self.assertEqual(result.get_counts('b'), {'0': 1})
+        result.results[0].header.name = 'b'
+        self.assertEqual(result.get_counts('b'), {'0': 0})
+
+        self.assertEqual(result.get_counts('c'), {'0': 2})
+        result.results[1].header = models.ExperimentResultHeader(name='c')
+        self.assertEqual(result.get_counts('c'), {'0': 1})
+
+        del result.results[0].header.name
+        with self.assertRaises(QiskitError):
+            result.get_counts('b')
+
+    def test_get_counts_all(self):
+        """Test that the counts of all experiments are returned."""
+        exp_results = []
+        for value in range(3):
+            data = models.ExperimentResultData(counts=base.Obj(**{hex(value): 10}))
+            exp_results.append(models.ExperimentResult(shots=10, success=True, meas_level=2,
+                                                       data=data))
+        result = Result(results=exp_results, **self.base_result_args)
+
+        self.assertEqual(result.get_counts_all(), [{'0': 10}, {'1': 10}, {'10': 10}])
+
+    def test_from_dict_defers_payloads(self):
+        """Test that bulky data is deserialized on first access."""
+        result_dict = dict(self.base_result_args, results=[
+            {'shots': 1, 'success': True, 'meas_level': 2,
+             'data': {'statevector': [[0.6, 0], [0, 0.8]],
+                      'counts': {'0x0': 1}}}])
+        result = Result.from_dict(result_dict)
+        exp_data = result.results[0].data
+
+        self.assertNotIn('statevector', exp_data.__dict__)
+        self.assertIn('statevector', exp_data)
+        np.testing.assert_array_equal(result.get_statevector(0), [0.6, 0.8j])
+        self.assertNotIn('statevector', exp_data.__dict__)
+        self.assertEqual(result.to_dict(), Result.from_dict(result_dict).to_dict())
+
+        self.assertEqual(exp_data.statevector, [0.6, 0.8j])
+        self.assertIn('statevector', exp_data.__dict__)
+        self.assertEqual(result, Result.from_dict(result_dict))
+        self.assertEqual(result, pickle.loads(pickle.dumps(Result.from_dict(result_dict))))
+
+    def test_from_dict_validates_deferred_payloads(self):
+        """Test that deferred data is validated when accessed."""
+        result = Result.from_dict(dict(self.base_result_args, results=[
+            {'shots': 1, 'success': True, 'meas_level': 2,
+             'data': {'statevector': []}}]))
+
+        with self.assertRaises(ModelValidationError):
+            _ = result.results[0].data.statevector
+        with self.assertRaises(ModelValidationError):
+            _ = result.results[0].data.statevector
+        self.assertIn('statevector', result.results[0].data)
+        self.assertEqual(result.results[0].data.serialized('statevector'), [])
@@ -500,6 +500,37 @@ class TestDagEquivalence(QiskitTestCase):
 
         self.assertNotEqual(self.dag1, dag2)
 
+    def test_dag_fingerprint(self):
+        """DAG fingerprint does not depend on the order of independent ops."""
+        circ2 = QuantumCircuit(self.qr1, self.qr2)
+        circ2.cx(self.qr1[2], self.qr1[3])
+        circ2.u2(0.1, 0.2, self.qr1[3])
+        circ2.h(self.qr1[0])
+        circ2.h(self.qr1[2])
+        circ2.t(self.qr1[2])
+        circ2.ch(self.qr1[2], self.qr1[1])
+        circ2.ccx(self.qr2[0], self.qr2[1], self.qr1[0])
+        dag2 = circuit_to_dag(circ2)
+
+        self.assertEqual(self.dag1.fingerprint(), dag2.fingerprint())
+        self.assertEqual(dag2.fingerprint(), circ2.fingerprint())
+
+    def test_dag_fingerprint_params(self):
+        """DAG fingerprint depends on the params unless left out."""
+        circ2 = QuantumCircuit(self.qr1, self.qr2)
+        circ2.cx(self.qr1[2], self.qr1[3])
+        circ2.u2(0.1, 0.3, self.qr1[3])  # <--- The difference: u2(0.1, 0.2)
+        circ2.h(self.qr1[0])
+        circ2.h(self.qr1[2])
+        circ2.t(self.qr1[2])
+        circ2.ch(self.qr1[2], self.qr1[1])
+        circ2.ccx(self.qr2[0], self.qr2[1], self.qr1[0])
+        dag2 = circuit_to_dag(circ2)
+
+        self.assertNotEqual(self.dag1.fingerprint(), dag2.fingerprint())
+        self.assertEqual(self.dag1.fingerprint(params=False), dag2.fingerprint(params=False))
+        self.assertNotEqual(self.dag1, dag2)
+
 
 class TestDagSubstitute(QiskitTestCase):
     """Test substitutuing a dag node with a sub-dag"""
@@ -547,6 +578,24 @@ class TestDagSubstitute(QiskitTestCase):
         """The method substitute_node_with_dag() replaces a leaf-in-the-back node with a DAG."""
         pass
 
+    def test_substitute_node(self):
+        """The method substitute_node() replaces the operation of a node in place."""
+        x_node = self.dag.op_nodes(op=XGate).pop()
+        successors = list(self.dag.multi_graph.successors(x_node))
+
+        self.dag.substitute_node(x_node, HGate())
+
+        self.assertEqual(x_node.name, 'h')
+        self.assertIsInstance(x_node.op, HGate)
+        self.assertEqual(list(self.dag.multi_graph.successors(x_node)), successors)
+        self.assertEqual(self.dag.count_ops(), {'h': 2, 'cx': 1})
+
+    def test_substitute_node_other_width(self):
+        """The method substitute_node() raises for an operation on other wires."""
+        x_node = self.dag.op_nodes(op=XGate).pop()
+        with self.assertRaises(DAGCircuitError):
+            self.dag.substitute_node(x_node, CnotGate())
+
 
 class TestDagProperties(QiskitTestCase):
     """Test the DAG properties.
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Test the error-weighted distances between physical qubits."""
+
+from datetime import datetime
+import math
+
+from qiskit.mapper import CouplingMap, ErrorDistance
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Nduv, Gate
+from qiskit.test import QiskitTestCase
+
+
+def make_properties(cx_errors, readout_errors):
+    """Create BackendProperties with the given cx and readout errors."""
+    calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+    qubits = [[Nduv(name="readout_error", date=calib_time, unit="", value=error)]
+              for error in readout_errors]
+    gates = [Gate(name="CX%s_%s" % edge, gate="cx", qubits=list(edge),
+                  parameters=[Nduv(date=calib_time, name='gate_error', unit='', value=error)])
+             for edge, error in cx_errors.items()]
+    return BackendProperties(last_update_date=calib_time, backend_name="test_backend",
+                             qubits=qubits, backend_version="1.0.0", gates=gates,
+                             general=[])
+
+
+class ErrorDistanceTest(QiskitTestCase):
+    """Test the ErrorDistance of the backend properties."""
+
+    def test_line(self):
+        """The cx to a distant qubit is done after swapping along the line."""
+        errors = ErrorDistance.from_backend_properties(
+            make_properties({(0, 1): 0.1, (1, 2): 0.2}, [0.01, 0.02, 0.03]))
+
+        self.assertEqual(errors.coupled_qubits, [0, 1, 2])
+        self.assertEqual(errors.cx_reliability, {(0, 1): 0.9, (1, 2): 0.8})
+        self.assertEqual(errors.readout_reliability, {0: 0.99, 1: 0.98, 2: 0.97})
+        self.assertAlmostEqual(errors.reliability[0, 1], 0.9)
+        self.assertAlmostEqual(errors.reliability[1, 0], 0.9)
+        self.assertAlmostEqual(errors.reliability[0, 2], 0.9 ** 3 * 0.8)
+        self.assertAlmostEqual(errors.reliability[2, 0], 0.8 ** 3 * 0.9)
+        self.assertAlmostEqual(errors.distance[0, 2], -math.log(0.9 ** 3 * 0.8))
+        self.assertAlmostEqual(errors.distance[2, 0], errors.distance[0, 2])
+        self.assertEqual(errors.distance[1, 1], 0)
+
+    def test_most_reliable_path(self):
+        """The swaps follow the most reliable path, not the shortest one."""
+        errors = ErrorDistance.from_backend_properties(
+            make_properties({(0, 1): 0.5, (0, 2): 0.01, (2, 3): 0.01, (3, 1): 0.01},
+                            [0.01] * 4))
+
+        self.assertAlmostEqual(errors.reliability[0, 1], 0.5)
+        self.assertAlmostEqual(errors.reliability[0, 3], 0.99 ** 4)
+        self.assertAlmostEqual(errors.reliability[2, 1], 0.99 ** 4)
+
+    def test_disconnected(self):
+        """Qubits without a path of cx gates are infinitely distant."""
+        errors = ErrorDistance.from_backend_properties(
+            make_properties({(0, 1): 0.1, (2, 3): 0.1}, [0.01] * 4))
+
+        self.assertEqual(errors.reliability[0, 3], 0)
+        self.assertEqual(errors.distance[0, 3], math.inf)
+
+    def test_cached_per_calibration(self):
+        """The distances are shared until the errors change."""
+        cx_errors = {(0, 1): 0.1, (1, 2): 0.2}
+        properties = make_properties(cx_errors, [0.01] * 3)
+        errors = ErrorDistance.from_backend_properties(properties)
+
+        self.assertIs(ErrorDistance.from_backend_properties(properties), errors)
+        self.assertIs(ErrorDistance.from_backend_properties(
+            make_properties(cx_errors, [0.01] * 3)), errors)
+
+        properties.gates[0].parameters[0].value = 0.3
+        self.assertIsNot(ErrorDistance.from_backend_properties(properties), errors)
+
+    def test_routing_cost(self):
+        """The routing cost breaks the ties between equally distant qubits."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 0]])
+        errors = ErrorDistance.from_backend_properties(
+            make_properties({(0, 1): 0.01, (1, 2): 0.01, (2, 3): 0.3, (3, 0): 0.3},
+                            [0.01] * 4))
+
+        cost = errors.routing_cost(coupling)
+        self.assertLess(cost[0, 1], cost[0, 3])
+        self.assertLess(cost[0, 3], 2)
+        self.assertLess(cost[1, 3], 3)
+        self.assertLess(cost[1, 0], cost[1, 3])
+        self.assertGreaterEqual(cost[1, 3], 2)
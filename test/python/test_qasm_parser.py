@@ -9,6 +9,7 @@
 
 import unittest
 import ply
+import sympy
 
 from qiskit.qasm import Qasm, QasmError
 from qiskit.qasm.node.node import Node
@@ -69,12 +70,31 @@ class TestParser(QiskitTestCase):
         res_if = qasm_if.parse()
         inspect(res_if)
 
+    def test_statement_callback(self):
+        """Test that statements are passed to the callback instead of kept in the tree."""
+        statements = []
+        res = Qasm(self.qasm_file_path).parse(statement_callback=statements.append)
+
+        self.assertEqual(res.children, [])
+        self.assertEqual([node.qasm(15) for node in statements],
+                         [node.qasm(15) for node in Qasm(self.qasm_file_path).parse().children])
+
     def test_get_tokens(self):
         """Test whether we get only valid tokens."""
         qasm = Qasm(self.qasm_file_path)
         for token in qasm.get_tokens():
             self.assertTrue(isinstance(token, ply.lex.LexToken))
 
+    def test_reals_out_of_float_range(self):
+        """Test that the reals out of the range of floats are kept exact."""
+        qasm = Qasm(data='OPENQASM 2.0;\nqreg q[1];\nU(1.5e400, 2.5e-400, 0.5) q[0];')
+        unitary = qasm.parse().children[-1]
+        reals = [real.value for real in unitary.children[0].children]
+        self.assertEqual(reals, [sympy.Number('1.5e400'), sympy.Number('2.5e-400'),
+                                 sympy.Number('0.5')])
+        self.assertTrue(reals[0].is_finite)
+        self.assertFalse(reals[1].is_zero)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -45,7 +45,33 @@ class TestCollect2qBlocks(QiskitTestCase):
 
         pass_ = Collect2qBlocks()
         pass_.run(dag)
-        self.assertTrue(pass_.property_set['block_list'], [block_1, block_2])
+        self.assertEqual([set(block) for block in pass_.property_set['block_list']],
+                         [set(block_1), set(block_2)])
+
+    def test_block_interrupted_by_other_gate(self):
+        """a gate that is not in the basis of the blocks ends the block on its qubit
+
+         q0:--.--[h]--.--      q0:--.--[h]--.--
+              |       |   =         |       |
+         q1:-(+)-[u1]-(+)-     q1:-(+)-[u1]-(+)-
+                                  block 1  block 2
+        """
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.cx(qr[0], qr[1])
+        qc.h(qr[0])
+        qc.u1(0.5, qr[1])
+        qc.cx(qr[0], qr[1])
+        dag = circuit_to_dag(qc)
+
+        topo_ops = [i for i in dag.topological_op_nodes()]
+        cx_nodes = [node for node in topo_ops if node.name == 'cx']
+        u1_node = [node for node in topo_ops if node.name == 'u1'][0]
+
+        pass_ = Collect2qBlocks()
+        pass_.run(dag)
+        self.assertEqual(pass_.property_set['block_list'],
+                         [(cx_nodes[0], u1_node), (cx_nodes[1],)])
 
 
 if __name__ == '__main__':
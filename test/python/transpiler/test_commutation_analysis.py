@@ -10,7 +10,9 @@
 
 import unittest
 
-from qiskit import QuantumRegister, QuantumCircuit
+import sympy
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.transpiler import PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis
 from qiskit.converters import circuit_to_dag
@@ -29,9 +31,8 @@ class TestCommutationAnalysis(QiskitTestCase):
         {'q[0]': [ [node_id, ...], [node_id, ...] ]}
         """
         result_to_compare = {}
-        for qbit_str, sets in result.items():
-            if not isinstance(qbit_str, str):
-                continue
+        for wire, sets in result.items():
+            qbit_str = "{0}[{1}]".format(wire[0].name, wire[1])
             result_to_compare[qbit_str] = []
             for commutation_set in sets:
                 result_to_compare[qbit_str].append(
@@ -79,8 +80,7 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1],
-                              [5],
+        expected = {'qr[0]': [[5],
                               [6],
                               [7],
                               [8, 9, 10, 11],
@@ -88,9 +88,8 @@ class TestCommutationAnalysis(QiskitTestCase):
                               [13],
                               [14],
                               [15],
-                              [16],
-                              [2]],
-                    'qr[1]': [[3], [14], [15], [16], [4]]}
+                              [16]],
+                    'qr[1]': [[14], [15], [16]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_non_commutative_circuit(self):
@@ -109,7 +108,7 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [7], [2]], 'qr[1]': [[3], [8], [4]], 'qr[2]': [[5], [9], [6]]}
+        expected = {'qr[0]': [[7]], 'qr[1]': [[8]], 'qr[2]': [[9]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_non_commutative_circuit_2(self):
@@ -130,9 +129,9 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [7], [2]],
-                    'qr[1]': [[3], [7], [9], [4]],
-                    'qr[2]': [[5], [8], [9], [6]]}
+        expected = {'qr[0]': [[7]],
+                    'qr[1]': [[7], [9]],
+                    'qr[2]': [[8], [9]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_commutative_circuit(self):
@@ -154,9 +153,9 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [7], [2]],
-                    'qr[1]': [[3], [7, 9], [4]],
-                    'qr[2]': [[5], [8], [9], [6]]}
+        expected = {'qr[0]': [[7]],
+                    'qr[1]': [[7, 9]],
+                    'qr[2]': [[8], [9]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_commutative_circuit_2(self):
@@ -180,9 +179,9 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [7, 8], [2]],
-                    'qr[1]': [[3], [7, 10], [4]],
-                    'qr[2]': [[5], [9], [10], [6]]}
+        expected = {'qr[0]': [[7, 8]],
+                    'qr[1]': [[7, 10]],
+                    'qr[2]': [[9], [10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_commutative_circuit_3(self):
@@ -208,9 +207,9 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [7, 9, 11, 13], [2]],
-                    'qr[1]': [[3], [7, 10, 11], [14], [4]],
-                    'qr[2]': [[5], [8], [10], [12, 14], [6]]}
+        expected = {'qr[0]': [[7, 9, 11, 13]],
+                    'qr[1]': [[7, 10, 11], [14]],
+                    'qr[2]': [[8], [10], [12, 14]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_jordan_wigner_type_circuit(self):
@@ -246,12 +245,12 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [13, 23], [2]],
-                    'qr[1]': [[3], [13], [14, 22], [23], [4]],
-                    'qr[2]': [[5], [14], [15, 21], [22], [6]],
-                    'qr[3]': [[7], [15], [16, 20], [21], [8]],
-                    'qr[4]': [[9], [16], [17, 19], [20], [10]],
-                    'qr[5]': [[11], [17], [18], [19], [12]]}
+        expected = {'qr[0]': [[13, 23]],
+                    'qr[1]': [[13], [14, 22], [23]],
+                    'qr[2]': [[14], [15, 21], [22]],
+                    'qr[3]': [[15], [16, 20], [21]],
+                    'qr[4]': [[16], [17, 19], [20]],
+                    'qr[5]': [[17], [18], [19]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
     def test_all_commute_circuit(self):
@@ -272,11 +271,81 @@ class TestCommutationAnalysis(QiskitTestCase):
 
         self.pass_.run(dag)
 
-        expected = {'qr[0]': [[1], [11, 15, 17], [2]],
-                    'qr[1]': [[3], [11, 12, 17, 18], [4]],
-                    'qr[2]': [[5], [12, 14, 18, 20], [6]],
-                    'qr[3]': [[7], [13, 14, 19, 20], [8]],
-                    'qr[4]': [[9], [13, 16, 19], [10]]}
+        expected = {'qr[0]': [[11, 15, 17]],
+                    'qr[1]': [[11, 12, 17, 18]],
+                    'qr[2]': [[12, 14, 18, 20]],
+                    'qr[3]': [[13, 14, 19, 20]],
+                    'qr[4]': [[13, 16, 19]]}
+        self.assertCommutationSet(self.pset["commutation_set"], expected)
+
+    def test_rule_table_gates(self):
+        """Test gates decided by the rule table, and measurements that do not commute
+
+        qr0:---[Sdg]---.----.---[M]---
+                       |    |    |
+        qr1:----[Rx]--(+)--(+)---|----
+                            |    |
+        qr2:----------------.----|----
+                                 |
+        cr0:---------------------o----
+        """
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.sdg(qr[0])
+        circuit.rx(0.3, qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.ccx(qr[0], qr[2], qr[1])
+        circuit.measure(qr[0], cr[0])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+
+        expected = {'qr[0]': [[9, 11, 12], [13]],
+                    'qr[1]': [[10, 11, 12]],
+                    'qr[2]': [[12]],
+                    'cr[0]': [[13]]}
+        self.assertCommutationSet(self.pset["commutation_set"], expected)
+        self.assertEqual(self.pset["commutation_group_ids"][12], (0, 0, 0))
+        self.assertEqual(self.pset["commutation_group_ids"][13], (1, 0))
+
+    def test_symbolic_params(self):
+        """Test gates with params that are not numbers do not commute"""
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.rx(sympy.Symbol('theta'), qr[0])
+        circuit.h(qr[0])
+        circuit.x(qr[0])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+
+        expected = {'qr[0]': [[3], [4], [5]]}
+        self.assertCommutationSet(self.pset["commutation_set"], expected)
+
+    def test_classical_bits(self):
+        """Test nodes on a shared classical bit only commute if they both read it
+
+        qr0:-[M]-----[Z]----
+              |       |
+        qr1:--|--[M]--|--[X]-
+              |   |   |   |
+        cr0:--.---.---o---o--
+        """
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.measure(qr[0], cr[0])
+        circuit.measure(qr[1], cr[0])
+        circuit.z(qr[0]).c_if(cr, 1)
+        circuit.x(qr[1]).c_if(cr, 1)
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+
+        expected = {'qr[0]': [[7], [9]],
+                    'qr[1]': [[8], [10]],
+                    'cr[0]': [[7], [8], [9, 10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
 
@@ -11,7 +11,7 @@ import unittest
 import sympy
 from qiskit.test import QiskitTestCase
 
-from qiskit import QuantumRegister, QuantumCircuit
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.transpiler import PassManager, transpile, PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis, CommutativeCancellation
 
@@ -125,6 +125,28 @@ class TestCommutativeCancellation(QiskitTestCase):
 
         self.assertEqual(expected, new_circuit)
 
+    def test_conditional_gates_not_cancelled(self):
+        """Conditional gates are not cancelled, even through a measure on another qubit
+
+        qr0:--[X]-------[X]--
+               |         |
+        qr1:---|---[M]---|---
+               |    |    |
+        cr0:---o----.----o---
+        """
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0]).c_if(cr, 1)
+        circuit.measure(qr[1], cr[0])
+        circuit.x(qr[0]).c_if(cr, 1)
+
+        passmanager = PassManager()
+        passmanager.append(CommutativeCancellation())
+        new_circuit = transpile(circuit, pass_manager=passmanager)
+
+        self.assertEqual(circuit, new_circuit)
+
 
 if __name__ == '__main__':
     unittest.main()
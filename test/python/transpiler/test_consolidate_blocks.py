@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Tests for the ConsolidateBlocks transpiler pass.
+"""
+
+import unittest
+
+import numpy as np
+
+from qiskit import BasicAer, execute
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import ConsolidateBlocks
+from qiskit.test import QiskitTestCase
+
+
+class TestConsolidateBlocks(QiskitTestCase):
+    """
+    Tests to verify that blocks of 2q interactions are re-synthesized correctly.
+    """
+
+    def setUp(self):
+        self.pass_manager = PassManager()
+        self.pass_manager.append(ConsolidateBlocks())
+
+    def assertEquivalent(self, circuit, other):
+        """Assert that two circuits have the same unitary, up to a global phase."""
+        backend = BasicAer.get_backend('unitary_simulator')
+        unitary = execute(circuit, backend).result().get_unitary()
+        other_unitary = execute(other, backend).result().get_unitary()
+        index = np.argmax(np.abs(unitary))
+        phase = other_unitary.flat[index] / unitary.flat[index]
+        self.assertTrue(np.allclose(other_unitary, phase * unitary))
+
+    def test_consolidate_long_block(self):
+        """A block with more than three cx is replaced by three cx.
+
+        q0:--[u3]--.---(+)--[u1]--.----(+)--[u2]--
+                   |    |         |     |
+        q1:-------(+)---.--[u3]--(+)----.---------
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[0])
+        circuit.u1(0.4, qr[0])
+        circuit.u3(0.5, 0.6, 0.7, qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[0])
+        circuit.u2(0.8, 0.9, qr[0])
+
+        result = dag_to_circuit(self.pass_manager.run_passes(circuit_to_dag(circuit)))
+
+        self.assertEqual(result.count_ops()['cx'], 3)
+        self.assertEquivalent(circuit, result)
+
+    def test_keep_short_block(self):
+        """A block with three cx or less is not changed."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.u1(0.4, qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[0])
+
+        result = dag_to_circuit(self.pass_manager.run_passes(circuit_to_dag(circuit)))
+
+        self.assertEqual(result.data, circuit.data)
+
+    def test_clifford_block_in_wider_circuit(self):
+        """Blocks of Clifford gates are consolidated between other gates."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.cx(qr[2], qr[1])
+        for _ in range(3):
+            circuit.cx(qr[0], qr[1])
+            circuit.u2(0, np.pi, qr[0])
+            circuit.cx(qr[1], qr[0])
+        circuit.cx(qr[1], qr[2])
+        circuit.u1(0.3, qr[2]).c_if(cr, 1)
+
+        result = dag_to_circuit(self.pass_manager.run_passes(circuit_to_dag(circuit)))
+
+        self.assertEqual(result.count_ops()['cx'], 5)
+        circuit.data.pop()
+        result.data.pop()
+        self.assertEquivalent(circuit, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
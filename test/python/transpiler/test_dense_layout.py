@@ -11,6 +11,7 @@ import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.mapper import CouplingMap
+from qiskit.transpiler import TranspilerError
 from qiskit.transpiler.passes import DenseLayout
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
@@ -65,6 +66,42 @@ class TestDenseLayout(QiskitTestCase):
         self.assertEqual(layout[qr1[1]], 1)
         self.assertEqual(layout[qr1[2]], 0)
 
+    def test_skips_small_components(self):
+        """Test that components smaller than the circuit are not chosen.
+        """
+        qr = QuantumRegister(3, 'q')
+        dag = circuit_to_dag(QuantumCircuit(qr))
+        pass_ = DenseLayout(CouplingMap([[0, 1], [2, 3], [3, 4], [4, 2]]))
+        pass_.run(dag)
+
+        layout = pass_.property_set['layout']
+        self.assertEqual({layout[qubit] for qubit in qr}, {2, 3, 4})
+
+    def test_no_component_large_enough(self):
+        """Test that a circuit wider than all the components raises.
+        """
+        qr = QuantumRegister(3, 'q')
+        dag = circuit_to_dag(QuantumCircuit(qr))
+        pass_ = DenseLayout(CouplingMap([[0, 1], [2, 3], [4, 5]]))
+
+        with self.assertRaises(TranspilerError):
+            pass_.run(dag)
+
+    def test_modified_coupling_map(self):
+        """Test that the layout follows the changes of the coupling map.
+        """
+        qr = QuantumRegister(2, 'q')
+        dag = circuit_to_dag(QuantumCircuit(qr))
+        coupling_map = CouplingMap([[0, 1], [2, 3]])
+        for edge, expected in [(None, {0, 1}), ((3, 2), {2, 3})]:
+            if edge:
+                coupling_map.add_edge(*edge)
+            pass_ = DenseLayout(coupling_map)
+            pass_.run(dag)
+
+            layout = pass_.property_set['layout']
+            self.assertEqual({layout[qubit] for qubit in qr}, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,12 +7,15 @@
 
 """Test the LookaheadSwap pass"""
 
+from datetime import datetime
 import unittest
 from qiskit.transpiler.passes import LookaheadSwap
 from qiskit.mapper import CouplingMap
 from qiskit.converters import circuit_to_dag
 from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Nduv, Gate
 
 
 class TestLookaheadSwap(QiskitTestCase):
@@ -150,6 +153,33 @@ class TestLookaheadSwap(QiskitTestCase):
                       [set(((QuantumRegister(3, 'q'), 0), (QuantumRegister(3, 'q'), 1))),
                        set(((QuantumRegister(3, 'q'), 1), (QuantumRegister(3, 'q'), 2)))])
 
+    def test_lookahead_swap_prefers_reliable_swaps(self):
+        """Test that lookahead mapper routes through the most reliable edges.
+
+        The two swaps through qubit 3 or through qubit 1 are equally short, but
+        the edges of qubit 3 have large cx errors.
+        """
+        qr = QuantumRegister(4, name='q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[2])
+        dag_circuit = circuit_to_dag(circuit)
+
+        coupling_map = CouplingMap([[0, 3], [3, 2], [0, 1], [1, 2]])
+        calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+        gates = [Gate(name="CX%s_%s" % (qubit0, qubit1), gate="cx", qubits=[qubit0, qubit1],
+                      parameters=[Nduv(date=calib_time, name='gate_error', unit='',
+                                       value=0.3 if 3 in (qubit0, qubit1) else 0.01)])
+                 for qubit0, qubit1 in coupling_map.get_edges()]
+        qubits = [[Nduv(date=calib_time, name='readout_error', unit='', value=0.01)]] * 4
+        backend_prop = BackendProperties(last_update_date=calib_time,
+                                         backend_name="test_backend", backend_version="1.0.0",
+                                         qubits=qubits, gates=gates, general=[])
+
+        mapped_dag = LookaheadSwap(coupling_map, backend_prop=backend_prop).run(dag_circuit)
+
+        for node in mapped_dag.op_nodes():
+            self.assertNotIn(qr[3], node.qargs)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,10 +11,10 @@ import unittest
 import sympy
 import numpy as np
 
-from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister
+from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister, BasicAer, execute
 from qiskit.transpiler import PassManager, transpile
 from qiskit.transpiler.passes import Optimize1qGates
-from qiskit.converters import circuit_to_dag
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeRueschlikon
 
@@ -104,16 +104,17 @@ class TestOptimize1qGates(QiskitTestCase):
         dag = circuit_to_dag(circ)
         simplified_dag = Optimize1qGates().run(dag)
 
-        params = set()
-        for node in simplified_dag.named_nodes('u1'):
-            params.add(node.op.params[0])
+        params = sorted(node.op.params[0]
+                        for node in simplified_dag.named_nodes('u1'))
 
-        expected_params = {sympy.Number(-3 * np.pi / 2),
-                           sympy.Number(1.0 + 0.55 * np.pi),
-                           sympy.Number(-0.479425538604203),
-                           sympy.Number(0.3 + np.pi + np.pi ** 2)}
+        expected_params = sorted([-3 * np.pi / 2,
+                                  1.0 + 0.55 * np.pi,
+                                  -0.479425538604203,
+                                  0.3 + np.pi + np.pi ** 2])
 
-        self.assertEqual(params, expected_params)
+        for param in params:
+            self.assertIsInstance(param, float)
+        np.testing.assert_allclose(params, expected_params)
 
     def test_ignores_conditional_rotations(self):
         """Conditional rotations should not be considered in the chain.
@@ -143,6 +144,31 @@ class TestOptimize1qGates(QiskitTestCase):
 
         self.assertEqual(circuit_to_dag(expected), after)
 
+    def test_ignores_variable_rotations(self):
+        """Rotations with params that depend on variables split the chain.
+
+        qr0:--[U1]-[U1]-[U1(t)]-[U1]-[U1]-    qr0:--[U1]-[U1(t)]-[U1]-
+        """
+        theta = sympy.Symbol('theta')
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u1(0.1, qr)
+        circuit.u1(0.2, qr)
+        circuit.u1(theta, qr)
+        circuit.u1(0.3, qr)
+        circuit.u1(0.4, qr)
+        dag = circuit_to_dag(circuit)
+
+        expected = QuantumCircuit(qr)
+        expected.u1(0.1 + 0.2, qr)
+        expected.u1(theta, qr)
+        expected.u1(0.3 + 0.4, qr)
+
+        pass_ = Optimize1qGates()
+        after = pass_.run(dag)
+
+        self.assertEqual(circuit_to_dag(expected), after)
+
     def test_in_the_back(self):
         """Optimizations can be in the back of the circuit.
         See https://github.com/Qiskit/qiskit-terra/issues/2004.
@@ -165,6 +191,53 @@ class TestOptimize1qGates(QiskitTestCase):
 
         self.assertEqual(circuit_to_dag(expected), after)
 
+    def test_compose_u3_runs(self):
+        """Runs of u3 gates of different lengths are composed together.
+
+        qr0:--[U3]-[U2]-[U3]-[U1]-    qr0:--[U3]--
+        qr1:--[U3]-[U3]-----------    qr1:--[U3]--
+        qr2:--[U3]-[U3]-[U3]------ == qr2:--------
+        """
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.u2(0.4, 0.5, qr[0])
+        circuit.u3(0.6, 0.7, 0.8, qr[0])
+        circuit.u1(0.9, qr[0])
+        circuit.u3(1.0, 1.1, 1.2, qr[1])
+        circuit.u3(1.3, 1.4, 1.5, qr[1])
+        circuit.u3(0.2, 0.4, 0.6, qr[2])
+        circuit.u3(-0.2, -0.6, -0.4, qr[2])
+        circuit.u3(np.pi, 0, np.pi, qr[2])
+        circuit.u3(np.pi, 0, np.pi, qr[2])
+        dag = circuit_to_dag(circuit)
+
+        after = Optimize1qGates().run(dag)
+
+        self.assertEqual(after.count_ops(), {'u3': 2})
+        backend = BasicAer.get_backend('unitary_simulator')
+        unitary = execute(circuit, backend).result().get_unitary()
+        other_unitary = execute(dag_to_circuit(after), backend).result().get_unitary()
+        index = np.argmax(np.abs(unitary))
+        phase = other_unitary.flat[index] / unitary.flat[index]
+        self.assertTrue(np.allclose(other_unitary, phase * unitary))
+
+    def test_compose_u3_to_u2(self):
+        """A run of u3 gates equal to a u2 gate is replaced by a u2 gate.
+
+        qr0:--[Y]-[H]-[X]--  == qr0:--[U2]--
+        """
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(np.pi, np.pi / 2, np.pi / 2, qr)
+        circuit.u2(0, np.pi, qr)
+        circuit.u3(np.pi, 0, np.pi, qr)
+        dag = circuit_to_dag(circuit)
+
+        after = Optimize1qGates().run(dag)
+
+        self.assertEqual(after.count_ops(), {'u2': 1})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Tests for the PeepholeOptimization transpiler pass.
+"""
+
+import unittest
+
+import numpy as np
+import sympy
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import PeepholeOptimization
+from qiskit.test import QiskitTestCase
+
+
+class TestPeepholeOptimization(QiskitTestCase):
+    """Test the local simplifications of the circuit."""
+
+    def test_cancel_through_commuting_gates(self):
+        """Self-inverse gates cancel through the gates that commute with them.
+
+        qr0:--.--[U1]--.--[U1]--    qr0:--[U1]--
+              |        |
+        qr1:-(+)-[X]--(+)-------  = qr1:--[X]---
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.u1(0.1, qr[0])
+        circuit.x(qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.u1(0.2, qr[0])
+
+        after = PeepholeOptimization().run(circuit_to_dag(circuit))
+
+        expected = QuantumCircuit(qr)
+        expected.x(qr[1])
+        expected.u1(0.1 + 0.2, qr[0])
+        self.assertEqual(circuit_to_dag(expected), after)
+
+    def test_cascading_cancellations(self):
+        """A circuit followed by its inverse cancels to nothing."""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.u2(0.4, 0.5, qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.u1(0.6, qr[1])
+        circuit.cx(qr[2], qr[0])
+        circuit.u3(0.7, 0.8, 0.9, qr[2])
+        circuit += circuit.inverse()
+
+        after = PeepholeOptimization().run(circuit_to_dag(circuit))
+
+        self.assertEqual(after.size(), 0)
+
+    def test_merge_to_u2(self):
+        """Runs of single qubit gates are merged to the simplest gate.
+
+        qr0:--[H]--[U1]--[H]--[H]--  =  qr0:--[U2]--
+        """
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u2(0, np.pi, qr[0])
+        circuit.u1(np.pi / 2, qr[0])
+        circuit.u2(0, np.pi, qr[0])
+        circuit.u2(0, np.pi, qr[0])
+
+        after = PeepholeOptimization().run(circuit_to_dag(circuit))
+
+        self.assertEqual(after.count_ops(), {'u2': 1})
+
+    def test_ignores_conditional_gates(self):
+        """Conditional gates are neither merged nor cancelled."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.u1(0.1, qr[0])
+        circuit.u1(0.2, qr[0]).c_if(cr, 1)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[0], qr[1]).c_if(cr, 1)
+
+        after = PeepholeOptimization().run(circuit_to_dag(circuit))
+
+        self.assertEqual(circuit_to_dag(circuit), after)
+
+    def test_ignores_variable_gates(self):
+        """Gates with params that depend on variables are left as they are,
+        and the gates around them are merged separately."""
+        theta = sympy.Symbol('theta')
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u1(0.1, qr[0])
+        circuit.u1(0.2, qr[0])
+        circuit.u3(theta, 0, 0, qr[0])
+        circuit.u1(0.3, qr[0])
+
+        after = PeepholeOptimization().run(circuit_to_dag(circuit))
+
+        expected = QuantumCircuit(qr)
+        expected.u1(0.1 + 0.2, qr[0])
+        expected.u3(theta, 0, 0, qr[0])
+        expected.u1(0.3, qr[0])
+        self.assertEqual(circuit_to_dag(expected), after)
+
+    def test_remove_redundant_barriers(self):
+        """A barrier whose qubits are barred by an adjacent barrier is removed.
+
+        qr0:--|--|--     qr0:--|--
+              |  |             |
+        qr1:-----|--  =  qr1:--|--
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.barrier(qr[0])
+        circuit.barrier(qr)
+
+        after = PeepholeOptimization().run(circuit_to_dag(circuit))
+
+        expected = QuantumCircuit(qr)
+        expected.barrier(qr)
+        self.assertEqual(circuit_to_dag(expected), after)
+
+
+if __name__ == '__main__':
+    unittest.main()
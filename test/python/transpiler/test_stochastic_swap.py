@@ -7,6 +7,7 @@
 
 """Test the Stochastic Swap pass"""
 
+from datetime import datetime
 import unittest
 from qiskit.transpiler.passes import StochasticSwap
 from qiskit.mapper import CouplingMap, Layout
@@ -14,6 +15,8 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Nduv, Gate
 
 
 class TestStochasticSwap(QiskitTestCase):
@@ -637,6 +640,36 @@ class TestStochasticSwap(QiskitTestCase):
         with self.assertRaises(TranspilerError):
             _ = pass_.run(dag)
 
+    def test_prefers_reliable_swaps(self):
+        """Test that the swaps are chosen by the error-weighted routing cost.
+
+        After the first layer, qubits 0 and 2 have to be made adjacent by a swap
+        through qubit 1 or through qubit 3, whose edges have large cx errors.
+        """
+        coupling = CouplingMap([[0, 3], [3, 2], [0, 1], [1, 2]])
+        calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+        gates = [Gate(name="CX%s_%s" % (qubit0, qubit1), gate="cx", qubits=[qubit0, qubit1],
+                      parameters=[Nduv(date=calib_time, name='gate_error', unit='',
+                                       value=0.3 if 3 in (qubit0, qubit1) else 0.01)])
+                 for qubit0, qubit1 in coupling.get_edges()]
+        qubits = [[Nduv(date=calib_time, name='readout_error', unit='', value=0.01)]] * 4
+        backend_prop = BackendProperties(last_update_date=calib_time,
+                                         backend_name="test_backend", backend_version="1.0.0",
+                                         qubits=qubits, gates=gates, general=[])
+
+        qr = QuantumRegister(4, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[2], qr[3])
+        circuit.cx(qr[0], qr[2])
+        dag = circuit_to_dag(circuit)
+
+        pass_ = StochasticSwap(coupling, None, 20, 4, backend_prop)
+        after = pass_.run(dag)
+
+        swap = after.named_nodes('swap')[0]
+        self.assertNotIn(qr[3], swap.qargs)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,7 +14,7 @@ import math
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import compile, BasicAer
 from qiskit.extensions.standard import CnotGate
-from qiskit.transpiler import PassManager, transpile_dag, transpile
+from qiskit.transpiler import PassManager, TranspilerError, transpile_dag, transpile
 from qiskit.compiler import assemble_circuits
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
@@ -220,3 +220,97 @@ class TestTranspile(QiskitTestCase):
         cx_qubits_physical = [[ctrl[1], tgt[1]] for [ctrl, tgt] in cx_qubits]
         self.assertEqual(sorted(cx_qubits_physical),
                          [[9, 4], [9, 4]])
+
+    def test_transpile_best_seed(self):
+        """Test that the best of several seeds is kept, with its seed."""
+        qr = QuantumRegister(5, 'qr')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 3), (1, 4), (2, 0), (4, 3), (1, 2), (3, 1), (0, 4)]:
+            circuit.cx(qr[control], qr[target])
+        coupling_map = [[0, 1], [1, 2], [2, 3], [3, 4]]
+
+        def cost(new_circuit):
+            return new_circuit.count_ops().get('cx', 0), new_circuit.depth()
+
+        best = transpile(circuit, coupling_map=coupling_map, seed_mapper=7, num_seeds=4)
+
+        self.assertIn(best.seed_mapper, range(7, 11))
+        for seed in range(7, 11):
+            single = transpile(circuit, coupling_map=coupling_map, seed_mapper=seed)
+            self.assertLessEqual(cost(best), cost(single))
+            if seed == best.seed_mapper:
+                self.assertEqual(single, best)
+
+        qobj = assemble_circuits(best)
+        self.assertEqual(qobj.experiments[0].header.seed_mapper, best.seed_mapper)
+        self.assertEqual(best.copy().seed_mapper, best.seed_mapper)
+        self.assertEqual(best.copy(shallow=True).seed_mapper, best.seed_mapper)
+
+        self.assertIsNone(single.seed_mapper)
+        self.assertNotIn('seed_mapper', assemble_circuits(single).experiments[0].header)
+
+    def test_transpile_best_seed_cost_function(self):
+        """Test that the circuits are selected by the given cost function."""
+        qr = QuantumRegister(5, 'qr')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 3), (1, 4), (2, 0), (4, 3), (1, 2), (3, 1), (0, 4)]:
+            circuit.cx(qr[control], qr[target])
+        coupling_map = [[0, 1], [1, 2], [2, 3], [3, 4]]
+
+        worst = transpile([circuit, circuit], coupling_map=coupling_map, seed_mapper=7,
+                          num_seeds=4, cost_function=lambda new_circuit: -new_circuit.size())
+
+        sizes = [transpile(circuit, coupling_map=coupling_map, seed_mapper=seed).size()
+                 for seed in range(7, 11)]
+        self.assertEqual([new_circuit.size() for new_circuit in worst], [max(sizes)] * 2)
+
+    def test_optimization_levels(self):
+        """Test that all the optimization levels map the circuit correctly, and
+        that the highest level gives fewer cx gates than the lowest."""
+        qr = QuantumRegister(5, 'qr')
+        cr = ClassicalRegister(5, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        for control, target in [(0, 3), (1, 4), (2, 0), (4, 3), (1, 2), (3, 1), (0, 4)]:
+            circuit.cx(qr[control], qr[target])
+            circuit.u3(0.1 * control, 0.2 * target, 0.3, qr[target])
+            circuit.cz(qr[control], qr[target])
+            circuit.h(qr[control])
+        circuit += circuit.inverse()
+        circuit.x(qr[1])
+        circuit.measure(qr, cr)
+        coupling_map = FakeMelbourne().configuration().coupling_map
+        backend = BasicAer.get_backend('qasm_simulator')
+
+        cx_counts = []
+        for level in range(4):
+            new_circuit = transpile(circuit, coupling_map=coupling_map, seed_mapper=1,
+                                    optimization_level=level)
+            for gate, qargs, _ in new_circuit.data:
+                if isinstance(gate, CnotGate):
+                    self.assertIn([x[1] for x in qargs], coupling_map)
+            qobj = assemble_circuits(new_circuit, RunConfig(shots=10, seed=1))
+            self.assertEqual(backend.run(qobj).result().get_counts(), {'00010': 10})
+            cx_counts.append(new_circuit.count_ops().get('cx', 0))
+
+        self.assertLess(cx_counts[3], cx_counts[0])
+
+    def test_default_optimization_level(self):
+        """Test that the default pipeline is the one of optimization level 2."""
+        qr = QuantumRegister(5, 'qr')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 3), (1, 4), (2, 0), (4, 3), (1, 2), (3, 1), (0, 4)]:
+            circuit.cx(qr[control], qr[target])
+            circuit.h(qr[control])
+        coupling_map = FakeMelbourne().configuration().coupling_map
+
+        self.assertEqual(transpile(circuit, coupling_map=coupling_map, seed_mapper=1),
+                         transpile(circuit, coupling_map=coupling_map, seed_mapper=1,
+                                   optimization_level=2))
+
+    def test_invalid_optimization_level(self):
+        """Test that an unknown optimization level raises."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+
+        self.assertRaises(TranspilerError, transpile, circuit, optimization_level=4)
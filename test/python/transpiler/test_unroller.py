@@ -13,7 +13,7 @@ from sympy import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.extensions.simulator import snapshot
-from qiskit.transpiler.passes import Unroller
+from qiskit.transpiler.passes import Unroller, Decompose
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 from qiskit.exceptions import QiskitError
@@ -86,6 +86,27 @@ class TestUnroller(QiskitTestCase):
         ref_dag = circuit_to_dag(ref_circuit)
         self.assertEqual(unrolled_dag, ref_dag)
 
+    def test_unroll_repeated_gates(self):
+        """Test unrolling the same gate on different wires.
+
+        The decomposition of the gate is reused for all of them.
+        """
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.ccx(qr[2], qr[0], qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.ccx(qr[1], qr[2], qr[0])
+        circuit.ccx(qr[0], qr[1], qr[2])
+        dag = circuit_to_dag(circuit)
+        pass_ = Unroller(['h', 't', 'tdg', 'cx'])
+        unrolled_dag = pass_.run(dag)
+
+        ref_dag = Decompose().run(circuit_to_dag(circuit))
+        self.assertEqual(unrolled_dag, ref_dag)
+        self.assertEqual(len(unrolled_dag.op_nodes()), 61)
+
     def test_unroll_no_basis(self):
         """Test when a given gate has no decompositions.
         """